@@ -0,0 +1,158 @@
+"""
+assembly.py -- Paul Cobbaut
+2026-10-19
+Create a hexagon wall display for small figurines.
+3D-printed hexagon, covered by a bought plexiglass panel.
+This file ==> a whole wall (layout.py) assembled in one document, with links
+Every part is built once (parts.shape) as a hidden Part::Feature; an App::Link
+array per part places all its copies (PlacementList), nothing is copied.
+A wall of 50 hexagons has some 30 objects and every shape only once.
+Where the parts go, in the frames of the generator scripts:
+- the wall is the XY plane, its back at z = 0, the glass side up (+z)
+- glue corners sit at their corner with z = 0..depth, arm a (-90 degrees)
+  turned onto a side; top corners are flipped over, on a line between their
+  arms, their glue face at z = common_height
+- a side runs along local x from the end of one corner arm to the next,
+  its width (y) centered on the line between the corners, local +y into the
+  cell it belongs to (for a hinged side -y: its leaf hangs over its cell)
+- the leaf has the frame of its hinged side, the glass lies on the ridges
+- a long shelve spans between the long arms (arm_d_length) of its mid shelve
+  corners, a short one rests on the holders in the middle of sideq2 and
+  sideq2_mirror
+Run with: freecadcmd assembly.py "0,0 1,0:long 0,1:short" wall.FCStd
+"""
+
+import math
+import os
+import sys
+from collections import defaultdict
+sys.path.append(os.path.dirname(os.path.abspath(__file__))) # local helper modules
+
+# in-plane axis (degrees) a top corner is flipped over, its arms land on the same sides
+flip_axis = {'two_way': -30, 'three_way': -90, 'mid_shelve': -90}
+
+# document name of an assembly
+DocLabel = 'hexagon_wall'
+
+
+def dimensions(params=None):
+    """The dimensions the placements depend on, from the generator scripts, params overriding them.
+    The corner arms are read from the source of glue_mid_shelve_corner, which needs FreeCAD to import."""
+    import parametric
+    import sides_and_shelves
+    d = {name: getattr(sides_and_shelves, name) for name in
+         ['side_length', 'common_width', 'common_height', 'short_length', 'long_length', 'ridge_height']}
+    corner = parametric.defaults('glue_mid_shelve_corner')
+    d['arm_length'] = corner['arm_length']
+    d['arm_d_length'] = corner['arm_d_length']
+    d.update({name: value for name, value in (params or {}).items() if name in d})
+    return d
+
+
+def with_radius(wall, d):
+    """The wall again, with the corner distance that follows from the dimensions."""
+    import layout
+    radius = d['side_length'] + 2 * d['arm_length']
+    return wall if abs(wall.radius - radius) < 1e-9 else layout.Layout(wall.cells, radius)
+
+
+def corner_angle(kind, directions):
+    """Rotation (degrees) of a corner part so that its arms point along directions."""
+    if kind == 'two_way':
+        # arm b is 120 degrees counter-clockwise from arm a
+        first = next(d for d in directions if (d + 120) % 360 in directions)
+        return (first + 90) % 360
+    return (directions[0] + 90) % 360
+
+
+def placements(wall, d):
+    """{part name: [(x, y, z, angle, flip)]} of all parts of a wall: the part is rotated angle
+    degrees around Z and, when flip is not None, first turned over the in-plane axis at flip degrees."""
+    wall = with_radius(wall, d)
+    result = defaultdict(list)
+    for corner, kind in wall.corners():
+        info = wall.corner_info[corner]
+        x, y = info['point']
+        if kind == 'mid_shelve':
+            angle = (info['shelve_direction'] - 90) % 360
+        else:
+            angle = corner_angle(kind, wall.corner_directions(corner))
+        result['Glue_' + kind].append((x, y, 0, angle, None))
+        result['Top_' + kind].append((x, y, d['common_height'], angle, flip_axis[kind]))
+    half = d['common_width'] / 2
+    for side, kind in wall.sides():
+        cell, k = wall.side_info[side]['owner']
+        corners = cell.corners(wall.radius)
+        (x0, y0), (x1, y1) = corners[k], corners[(k + 1) % 6]
+        if kind == 'side_hinge':
+            (x0, y0), (x1, y1) = (x1, y1), (x0, y0)
+        angle = round(math.degrees(math.atan2(y1 - y0, x1 - x0)), 9) % 360
+        ux, uy = math.cos(math.radians(angle)), math.sin(math.radians(angle))
+        # local origin: the end of the corner arm, half a width to the right of the line
+        x = x0 + d['arm_length'] * ux + half * uy
+        y = y0 + d['arm_length'] * uy - half * ux
+        result[kind].append((x, y, 0, angle, None))
+        if kind == 'side_hinge':
+            result['leaf'].append((x, y, 0, angle, None))
+    for cell in wall.cells:
+        cx, cy = cell.center(wall.radius)
+        result['Hexagon Glass sketch'].append((cx, cy, d['common_height'] + d['ridge_height'], 0, None))
+        if cell.shelve == 'long':
+            result['long_shelve'].append((cx - wall.radius + d['arm_d_length'], cy - half, 0, 0, None))
+        elif cell.shelve == 'short':
+            result['short_shelve'].append((cx - d['short_length'] / 2, cy + wall.radius * math.sqrt(3) / 4 - half, 0, 0, None))
+    needed = wall.parts()
+    counts = {name: len(places) for name, places in result.items()}
+    if counts != dict(needed):
+        raise ValueError('placements %s do not match the parts of the wall %s' % (counts, dict(needed)))
+    return dict(result)
+
+
+def placement(x, y, z, angle, flip):
+    import FreeCAD
+    from FreeCAD import Vector
+    rotation = FreeCAD.Rotation(Vector(0, 0, 1), angle)
+    if flip is not None:
+        axis = Vector(math.cos(math.radians(flip)), math.sin(math.radians(flip)), 0)
+        rotation = rotation.multiply(FreeCAD.Rotation(axis, 180))
+    return FreeCAD.Placement(Vector(x, y, z), rotation)
+
+
+def build(doc, wall, params=None, template=True):
+    """Add the parts of a wall to doc: a hidden source per part and an App::Link array
+    placing its copies. Returns {part name: link}."""
+    import parts
+    params = params or {}
+    links = {}
+    for name, places in sorted(placements(wall, dimensions(params)).items()):
+        source = doc.addObject('Part::Feature', name.replace(' ', '_') + '_source')
+        source.Shape = parts.shape(name, parts.params_for(name, params), template)
+        source.Visibility = False
+        link = doc.addObject('App::Link', name.replace(' ', '_'))
+        link.Label = name
+        link.setLink(source)
+        link.ElementCount = len(places)
+        link.PlacementList = [placement(*place) for place in places]
+        link.ShowElement = False # no object per copy
+        links[name] = link
+    doc.recompute()
+    return links
+
+
+def document(spec, path=None, params=None):
+    """New document with the wall of a layout spec (layout.parse), saved to path when given."""
+    import FreeCAD
+    import layout
+    doc = FreeCAD.newDocument(DocLabel)
+    build(doc, layout.parse(spec), params)
+    if path:
+        doc.saveAs(path)
+    return doc
+
+
+if __name__ == "__main__":
+    import time
+    args = [arg for arg in sys.argv[1:] if not arg.endswith('.py')]
+    start = time.perf_counter()
+    doc = document(args[0] if args else '0,0', args[1] if len(args) > 1 else None)
+    print('%d objects in %.1f s' % (len(doc.Objects), time.perf_counter() - start))
@@ -0,0 +1,153 @@
+"""
+batch.py -- Paul Cobbaut
+2026-10-19
+Create a hexagon wall display for small figurines.
+3D-printed hexagon, covered by a bought plexiglass panel.
+This file ==> resumable batch builds of many part variants
+A batch is a file with one JSON job per line, as for worker.py:
+  {"part": "sideq", "params": {"insert_width": 2.05}}
+Every job goes through three stages, each one is checkpointed:
+  refined : the shape is built and saved as BREP
+  mesh    : the shape is tessellated and the mesh saved (sketches skip this)
+  export  : the artifacts are written to the output directory
+The state of every job is kept in state.json next to the checkpoints.
+A rerun skips finished jobs and resumes the others from their last good
+stage. A job that fails is recorded with its params and the error, the
+rest of the batch goes on; failed jobs are tried again on the next run.
+Run with: freecadcmd batch.py jobs.jsonl [output directory]
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+import traceback
+sys.path.append(os.path.dirname(os.path.abspath(__file__))) # local helper modules
+
+output_directory = os.environ.get('HEXAGON_BATCH_OUTPUT', '/tmp/hexagon-batch')
+
+# stages in order, a job's stage is the last one that finished
+stages = ['refined', 'mesh', 'export']
+
+
+def job_key(part, params):
+    """Name of a job: the part plus a hash of its params, the same in every run."""
+    if not params:
+        return part
+    return part + '-' + hashlib.sha1(json.dumps(params, sort_keys=True).encode()).hexdigest()[:10]
+
+
+def read_jobs(path):
+    """(part, params) of every line of a batch file, empty lines and # comments skipped."""
+    jobs = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                job = json.loads(line)
+                jobs.append((job['part'], job.get('params') or {}))
+    return jobs
+
+
+class Checkpoints:
+    """Checkpoint files and state.json of one batch."""
+
+    def __init__(self, directory):
+        self.directory = os.path.join(directory, '.checkpoints')
+        os.makedirs(self.directory, exist_ok=True)
+        self.state_path = os.path.join(self.directory, 'state.json')
+        self.state = {}
+        if os.path.exists(self.state_path):
+            with open(self.state_path) as f:
+                self.state = json.load(f)
+
+    def path(self, key, stage):
+        return os.path.join(self.directory, key + {'refined': '.brep', 'mesh': '.bms'}[stage])
+
+    def stage(self, key):
+        """Last finished stage of a job, None when nothing finished (or its checkpoint is gone)."""
+        stage = self.state.get(key, {}).get('stage')
+        if stage == 'mesh' and not os.path.exists(self.path(key, 'mesh')):
+            stage = 'refined'
+        if stage in ('refined', 'mesh') and not os.path.exists(self.path(key, 'refined')):
+            stage = None
+        return stage
+
+    def record(self, key, part, params, stage=None, error=None, trace=None, artifacts=None):
+        """Update the state of a job and save it. A finished stage clears an earlier error."""
+        entry = self.state.setdefault(key, {'part': part, 'params': params})
+        if stage:
+            entry['stage'] = stage
+        if artifacts is not None:
+            entry['artifacts'] = artifacts
+        entry['error'] = error
+        entry['traceback'] = trace
+        self.save()
+
+    def save(self):
+        # replaced at once, an interrupted run never leaves half a state file
+        temporary = self.state_path + '.tmp'
+        with open(temporary, 'w') as f:
+            json.dump(self.state, f, indent=1, sort_keys=True)
+        os.replace(temporary, self.state_path)
+
+
+def run_job(checkpoints, part, params, directory, template=True):
+    """Take one job from its last good stage to export. Returns its artifacts."""
+    import Part
+    import Mesh
+    import parts
+    key = job_key(part, params)
+    stage = checkpoints.stage(key)
+    if stage == 'export':
+        return checkpoints.state[key].get('artifacts', [])
+    if stage is None:
+        shape = parts.shape(part, params, template)
+        shape.exportBrep(checkpoints.path(key, 'refined'))
+        checkpoints.record(key, part, params, 'refined')
+        stage = 'refined'
+    else:
+        shape = Part.read(checkpoints.path(key, 'refined'))
+    mesh = None
+    if part not in parts.sketches:
+        if stage == 'refined':
+            mesh = parts.tessellate(part, shape)
+            mesh.write(checkpoints.path(key, 'mesh'))
+            checkpoints.record(key, part, params, 'mesh')
+        else:
+            mesh = Mesh.Mesh(checkpoints.path(key, 'mesh'))
+    target = os.path.join(directory, key)
+    os.makedirs(target, exist_ok=True)
+    artifacts = parts.export_shape(part, shape, target, mesh)
+    checkpoints.record(key, part, params, 'export', artifacts=artifacts)
+    return artifacts
+
+
+def run(jobs, directory=output_directory, template=True):
+    """Run all (part, params) jobs, resuming from the checkpoints in directory.
+    Returns (finished, failed) as lists of job keys."""
+    checkpoints = Checkpoints(directory)
+    finished, failed = [], []
+    for part, params in jobs:
+        key = job_key(part, params)
+        start = time.perf_counter()
+        try:
+            run_job(checkpoints, part, params, directory, template)
+        except Exception as e:
+            checkpoints.record(key, part, params, error='%s: %s' % (type(e).__name__, e), trace=traceback.format_exc())
+            failed.append(key)
+            print('%-40s failed: %s' % (key, checkpoints.state[key]['error']))
+            continue
+        finished.append(key)
+        print('%-40s %s (%.1f s)' % (key, checkpoints.state[key]['stage'], time.perf_counter() - start))
+    return finished, failed
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.endswith('.py')]
+    directory = args[1] if len(args) > 1 else output_directory
+    finished, failed = run(read_jobs(args[0]), directory)
+    print('%d finished, %d failed, state in %s' % (len(finished), len(failed), Checkpoints(directory).state_path))
+    if failed:
+        sys.exit(1)
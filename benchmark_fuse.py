@@ -0,0 +1,72 @@
+"""
+benchmark_fuse.py -- Paul Cobbaut
+2026-10-19
+Create a hexagon wall display for small figurines.
+3D-printed hexagon, covered by a bought plexiglass panel.
+This file ==> compare Part::Compound + Part::Refine with Part::MultiFuse + Part::Refine
+for the sides and shelves: recompute time, face count, mesh size and manifoldness.
+Run with: freecadcmd benchmark_fuse.py
+"""
+
+import FreeCAD
+import MeshPart
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__))) # local helper modules
+import meshing
+import sides_and_shelves
+
+# every mode is built this many times, the fastest run counts
+rounds = 3
+
+
+def measure(fuse):
+    """Build all sides and shelves in a new document. Returns (recompute seconds, {name: stats})."""
+    best = None
+    for r in range(rounds):
+        doc = FreeCAD.newDocument("benchmark_fuse")
+        parts = sides_and_shelves.build(doc, fuse)
+        start = time.perf_counter()
+        doc.recompute()
+        seconds = time.perf_counter() - start
+        if best is None or seconds < best[0]:
+            stats = {}
+            for name, refined in parts.items():
+                shape = refined.Shape
+                start = time.perf_counter()
+                mesh = MeshPart.meshFromShape(Shape=shape, LinearDeflection=meshing.linear_deflection, AngularDeflection=meshing.angular_deflection, Relative=False)
+                stats[name] = {
+                    'solids'    : len(shape.Solids),
+                    'faces'     : len(shape.Faces),
+                    'facets'    : mesh.CountFacets,
+                    'mesh_s'    : time.perf_counter() - start,
+                    'manifold'  : not mesh.hasNonManifolds(),
+                    'solid'     : mesh.isSolid(),
+                    'selfint'   : mesh.hasSelfIntersections(),
+                }
+            best = (seconds, stats)
+        FreeCAD.closeDocument(doc.Name)
+    return best
+
+
+def report(results):
+    print("%-14s %-9s %6s %6s %7s %8s %8s %6s %7s" % ('part', 'mode', 'solids', 'faces', 'facets', 'mesh ms', 'manifold', 'solid', 'selfint'))
+    for name in results['compound'][1]:
+        for mode in ('compound', 'fuse'):
+            s = results[mode][1][name]
+            print("%-14s %-9s %6d %6d %7d %8.1f %8s %6s %7s" % (name, mode, s['solids'], s['faces'], s['facets'], s['mesh_s'] * 1000, s['manifold'], s['solid'], s['selfint']))
+    for mode in ('compound', 'fuse'):
+        seconds, stats = results[mode]
+        print("%-9s recompute %.3f s, mesh %.3f s, %d facets" % (mode, seconds, sum(s['mesh_s'] for s in stats.values()), sum(s['facets'] for s in stats.values())))
+    # the faster path that also prints correctly wins
+    printable = [mode for mode in ('compound', 'fuse') if all(s['manifold'] and s['solid'] and not s['selfint'] for s in results[mode][1].values())]
+    if printable:
+        best = min(printable, key=lambda mode: results[mode][0] + sum(s['mesh_s'] for s in results[mode][1].values()))
+        print("pick: " + best + "  (set fuse_parts = " + str(best == 'fuse') + " in sides_and_shelves.py)")
+    else:
+        print("pick: none, both paths give non-manifold or self-intersecting meshes")
+
+
+if __name__ == "__main__":
+    report({'compound': measure(False), 'fuse': measure(True)})
@@ -0,0 +1,80 @@
+"""
+decimate.py -- Paul Cobbaut
+2026-10-19
+Create a hexagon wall display for small figurines.
+3D-printed hexagon, covered by a bought plexiglass panel.
+This file ==> a coarse preview mesh, derived from the print mesh
+The print mesh is tessellated once; the preview is made from its arrays
+by vertex clustering, with numpy:
+- the bounding box is cut in cubes of one size, all points in a cube
+  become one point (their mean)
+- facets that lost a corner are dropped, as are facets that are there
+  twice, and pairs of facets that ended up back to back
+The cube size is searched (bisection) for the most facets within target.
+The preview is for looking at, not for printing: thin walls may close.
+"""
+
+import numpy
+
+# facets of a preview mesh, at most
+preview_facets = 400
+
+# steps of the bisection of the cube size
+steps = 16
+
+
+def _keys(rows, base):
+    """One int64 per row of small non-negative ints (below base), for a fast 1D numpy.unique."""
+    keys = numpy.zeros(len(rows), dtype=numpy.int64)
+    for column in range(rows.shape[1]):
+        keys = keys * base + rows[:, column]
+    return keys
+
+
+def cluster(points, facets, size):
+    """Points and facets of the mesh with all points within one cube of size merged."""
+    low = points.min(axis=0)
+    cells = numpy.floor((points - low) / size).astype(numpy.int64)
+    _, inverse, counts = numpy.unique(_keys(cells, cells.max() + 1), return_inverse=True, return_counts=True)
+    merged = numpy.zeros((len(counts), 3))
+    numpy.add.at(merged, inverse, points)
+    merged /= counts[:, None]
+    facets = inverse[facets]
+    facets = facets[(facets[:, 0] != facets[:, 1]) & (facets[:, 1] != facets[:, 2]) & (facets[:, 2] != facets[:, 0])]
+    # the same facet twice: rotated to start at its smallest point, they are equal
+    first = numpy.argmin(facets, axis=1)
+    facets = facets[numpy.arange(len(facets))[:, None], (first[:, None] + numpy.arange(3)) % 3]
+    _, once = numpy.unique(_keys(facets, len(counts)), return_index=True)
+    facets = facets[once]
+    # back to back: the same points, the other way around
+    _, inverse, counts = numpy.unique(_keys(numpy.sort(facets, axis=1), len(merged)), return_inverse=True, return_counts=True)
+    facets = facets[counts[inverse] == 1]
+    # points no facet uses any more are left out
+    used, facets = numpy.unique(facets, return_inverse=True)
+    return merged[used], facets.reshape(-1, 3)
+
+
+def decimate(points, facets, target=preview_facets):
+    """Points and facets of a mesh with at most target facets, as close to it as the search gets.
+    A mesh within target is returned as it is."""
+    points = numpy.asarray(points, dtype=float).reshape(-1, 3)
+    facets = numpy.asarray(facets, dtype=numpy.int64).reshape(-1, 3)
+    if len(facets) <= target:
+        return points, facets
+    # small: too many facets, large: within target (a single cube has none)
+    small, large = 0.0, float((points.max(axis=0) - points.min(axis=0)).max()) * 1.001
+    best = cluster(points, facets, large)
+    for _ in range(steps):
+        size = (small + large) / 2
+        result = cluster(points, facets, size)
+        if len(result[1]) > target:
+            small = size
+        else:
+            large, best = size, result
+    return best
+
+
+def decimate_mesh(mesh, target=preview_facets):
+    """decimate() of a FreeCAD mesh, as arrays."""
+    import meshcheck
+    return decimate(*meshcheck.arrays(mesh), target=target)
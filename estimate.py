@@ -0,0 +1,151 @@
+"""
+estimate.py -- Paul Cobbaut
+2026-10-19
+Create a hexagon wall display for small figurines.
+3D-printed hexagon, covered by a bought plexiglass panel.
+This file ==> filament per part and per wall, from the meshes, without a slicer
+Volume and surface area of a mesh are summed over all facets at once with numpy:
+- volume : signed tetrahedra from the origin to every facet
+- area   : half the length of the cross product of every facet
+The boxes of a compound export are separate shells that overlap; such a
+mesh is measured as the union of its shells (slicer.union_measures), the
+overlap once and no faces inside the part.
+A print is a shell (walls perimeters of line_width, all over the surface)
+and infill inside it:
+  filament volume = shell + infill * (volume - shell)
+turned into grams by the density and into meters by the filament diameter.
+A wall (layout.py) is the sum over its parts list; glass is bought, not printed.
+Run with: python3 estimate.py part.3mf [...]
+          python3 estimate.py --wall "0,0 1,0:long" directory-with-3mf-files
+"""
+
+import functools
+import io
+import math
+import os
+import re
+import sys
+import zipfile
+import numpy
+sys.path.append(os.path.dirname(os.path.abspath(__file__))) # local helper modules
+import meshcheck
+
+# print settings, PLA on a 0.4 mm nozzle
+settings = {
+    'density'     : 1.24,  # g/cm3
+    'diameter'    : 1.75,  # mm, filament
+    'line_width'  : 0.45,  # mm
+    'walls'       : 2,     # perimeters, also taken for the top and bottom layers
+    'infill'      : 0.15,  # fraction of the inside
+}
+
+vertex = re.compile(rb'<vertex x="([^"]+)" y="([^"]+)" z="([^"]+)"')
+triangle = re.compile(rb'<triangle v1="(\d+)" v2="(\d+)" v3="(\d+)"')
+
+
+def measures(points, facets):
+    """{'volume' (mm3), 'area' (mm2), 'size' (x, y, z in mm)} of a closed mesh given as arrays,
+    of the union of its shells when it has more than one."""
+    shell = meshcheck.shells(facets)
+    if len(facets) and shell.max() > 0:
+        import slicer
+        volume, area = slicer.union_measures(points, facets, shell)
+    else:
+        a = points[facets[:, 0]]
+        b = points[facets[:, 1]]
+        c = points[facets[:, 2]]
+        cross = numpy.cross(b - a, c - a)
+        volume = float(numpy.einsum('ij,ij->', a, cross) / 6)
+        area = float(numpy.linalg.norm(cross, axis=1).sum() / 2)
+    return {
+        'volume' : volume,
+        'area'   : area,
+        'size'   : [float(v) for v in points.max(axis=0) - points.min(axis=0)] if len(points) else [0.0] * 3,
+    }
+
+
+def read_3mf(data):
+    """Points (N, 3) and facets (F, 3) of the (single) mesh in a 3mf file given as bytes."""
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        model = archive.read('3D/3dmodel.model')
+    points = numpy.array(vertex.findall(model), dtype=float).reshape(-1, 3)
+    facets = numpy.array(triangle.findall(model), dtype=numpy.int64).reshape(-1, 3)
+    return points, facets
+
+
+@functools.lru_cache(maxsize=256)
+def measures_3mf(data):
+    """measures() of a 3mf file given as bytes; the same file is measured once."""
+    return measures(*read_3mf(data))
+
+
+def filament(measured, **more):
+    """{'filament_mm3', 'grams', 'meters'} of a part printed with settings (more overrides them)."""
+    s = dict(settings, **more)
+    volume = max(measured['volume'], 0.0)
+    shell = min(volume, measured['area'] * s['walls'] * s['line_width'])
+    used = shell + s['infill'] * (volume - shell)
+    return {
+        'filament_mm3' : used,
+        'grams'        : used / 1000 * s['density'],
+        'meters'       : used / (math.pi * (s['diameter'] / 2) ** 2) / 1000,
+    }
+
+
+def estimate(data, **more):
+    """measures() and filament() of a 3mf file given as bytes, in one dict."""
+    result = dict(measures_3mf(data))
+    result.update(filament(result, **more))
+    return result
+
+
+def wall(counts, files, **more):
+    """Estimate of a wall: counts is its parts list (layout.Layout.parts()), files
+    maps part name to its print 3mf bytes; parts without a 3mf (glass) are left out.
+    Returns {'parts': {name: estimate plus 'count'}, 'total': {'count', 'grams', 'meters', 'filament_mm3'},
+    'missing': [names without a 3mf]}."""
+    rows = {}
+    missing = []
+    total = {'count': 0, 'grams': 0.0, 'meters': 0.0, 'filament_mm3': 0.0}
+    for name in sorted(counts):
+        if name not in files:
+            missing.append(name)
+            continue
+        row = estimate(files[name], **more)
+        row['count'] = counts[name]
+        rows[name] = row
+        total['count'] += counts[name]
+        for key in ('grams', 'meters', 'filament_mm3'):
+            total[key] += row[key] * counts[name]
+    return {'parts': rows, 'total': total, 'missing': missing}
+
+
+def table(result):
+    """Text table of a wall() result."""
+    lines = ['%-22s %5s %10s %10s %8s %8s' % ('part', 'count', 'volume', 'area', 'g each', 'g total')]
+    for name, row in result['parts'].items():
+        lines.append('%-22s %5d %10.0f %10.0f %8.1f %8.1f' % (name, row['count'], row['volume'], row['area'], row['grams'], row['grams'] * row['count']))
+    total = result['total']
+    lines.append('%-22s %5d %10s %10s %8s %8.1f  (%.1f m of %.2f mm filament)' % ('total', total['count'], '', '', '', total['grams'], total['meters'], settings['diameter']))
+    if result['missing']:
+        lines.append('not printed or no 3mf: ' + ', '.join(result['missing']))
+    return '\n'.join(lines)
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.endswith('.py')]
+    if args and args[0] == '--wall':
+        import layout
+        counts = layout.parse(args[1]).parts()
+        files = {}
+        for name in counts:
+            path = os.path.join(args[2], name + '.3mf')
+            if os.path.exists(path):
+                with open(path, 'rb') as f:
+                    files[name] = f.read()
+        print(table(wall(counts, files)))
+    else:
+        for path in args:
+            with open(path, 'rb') as f:
+                row = estimate(f.read())
+            print('%-40s %10.0f mm3 %10.0f mm2 %8.1f g %6.2f m' % (path, row['volume'], row['area'], row['grams'], row['meters']))
@@ -0,0 +1,238 @@
+"""
+exporters.py -- Paul Cobbaut
+2026-10-19
+Create a hexagon wall display for small figurines.
+3D-printed hexagon, covered by a bought plexiglass panel.
+This file ==> 3mf, svg and dxf files that are the same, byte for byte, for the same geometry
+- numbers are rounded to 0.0001 mm (decimals) and written without trailing zeros
+- mesh points are sorted, every facet starts at its smallest point,
+  facets are sorted; sketch entities are sorted
+- zip entries of a 3mf have a fixed order, date and compression
+Every mesh is exported twice from one tessellation: the print mesh and a
+coarse preview (name.preview.3mf, decimate.py) for the configurator and renders;
+the print mesh lies on the bed the way it prints best (orient.py).
+A file is only written when its bytes change, so an unchanged part keeps
+its modification time and rsync (or any upload by checksum) skips it.
+"""
+
+import io
+import math
+import os
+import tempfile
+import zipfile
+import numpy
+
+# coordinates are rounded to this many decimals (mm)
+decimals = 4
+
+# a part's preview mesh is exported next to its print mesh, as name.preview.3mf
+preview_suffix = '.preview.3mf'
+
+# print 3mf files are turned to their best print orientation (orient.py) with HEXAGON_ORIENT=1,
+# by default they keep the model's
+orient_prints = os.environ.get('HEXAGON_ORIENT', '0') == '1'
+
+# date of every zip entry (the zip format starts at 1980)
+zip_date = (1980, 1, 1, 0, 0, 0)
+
+content_types = ('<?xml version="1.0" encoding="UTF-8"?>\n'
+                 '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                 '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+                 '<Default Extension="model" ContentType="application/vnd.ms-package.3dmanufacturing-3dmodel+xml"/>'
+                 '</Types>\n')
+
+relationships = ('<?xml version="1.0" encoding="UTF-8"?>\n'
+                 '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                 '<Relationship Target="/3D/3dmodel.model" Id="rel0" Type="http://schemas.microsoft.com/3dmanufacturing/2013/01/3dmodel"/>'
+                 '</Relationships>\n')
+
+
+def number(value):
+    """Canonical text of a number: rounded, no trailing zeros, no -0."""
+    text = '%.*f' % (decimals, value)
+    if '.' in text:
+        text = text.rstrip('0').rstrip('.')
+    return '0' if text == '-0' else text
+
+
+def canonical_mesh(points, facets):
+    """Points (N, 3) and facets (F, 3) in canonical order: equal (rounded) points merged and sorted,
+    every facet rotated to start at its smallest point (orientation kept), facets sorted."""
+    rounded = numpy.round(numpy.asarray(points, dtype=float).reshape(-1, 3), decimals) + 0.0 # + 0.0 turns -0 into 0
+    unique, inverse = numpy.unique(rounded, axis=0, return_inverse=True)
+    facets = inverse.ravel()[numpy.asarray(facets, dtype=numpy.int64).reshape(-1, 3)]
+    first = numpy.argmin(facets, axis=1)
+    facets = facets[numpy.arange(len(facets))[:, None], (first[:, None] + numpy.arange(3)) % 3]
+    facets = facets[numpy.lexsort(facets.T[::-1])]
+    return unique, facets
+
+
+def model_3mf(points, facets):
+    """3D/3dmodel.model of a mesh given as canonical arrays."""
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>',
+             '<model unit="millimeter" xml:lang="en-US" xmlns="http://schemas.microsoft.com/3dmanufacturing/core/2015/02">',
+             '<resources>', '<object id="1" type="model">', '<mesh>', '<vertices>']
+    lines += ['<vertex x="%s" y="%s" z="%s"/>' % (number(x), number(y), number(z)) for x, y, z in points.tolist()]
+    lines += ['</vertices>', '<triangles>']
+    lines += ['<triangle v1="%d" v2="%d" v3="%d"/>' % (a, b, c) for a, b, c in facets.tolist()]
+    lines += ['</triangles>', '</mesh>', '</object>', '</resources>', '<build>', '<item objectid="1"/>', '</build>', '</model>', '']
+    return '\n'.join(lines)
+
+
+def zip_bytes(entries):
+    """Zip archive of (name, text) entries, in the given order, with fixed dates and attributes."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        for name, text in entries:
+            info = zipfile.ZipInfo(name, date_time=zip_date)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.create_system = 0
+            info.external_attr = 0o644 << 16
+            archive.writestr(info, text.encode('utf-8'), compresslevel=6)
+    return buffer.getvalue()
+
+
+def arrays_3mf(points, facets):
+    """Bytes of a 3mf file of a mesh given as arrays."""
+    points, facets = canonical_mesh(points, facets)
+    return zip_bytes([('[Content_Types].xml', content_types),
+                      ('_rels/.rels', relationships),
+                      ('3D/3dmodel.model', model_3mf(points, facets))])
+
+
+def mesh_3mf(mesh):
+    """Bytes of a 3mf file of a FreeCAD mesh."""
+    import meshcheck
+    return arrays_3mf(*meshcheck.arrays(mesh))
+
+
+def preview_filename(filename):
+    """name.3mf --> name.preview.3mf"""
+    return filename[:-len('.3mf')] + preview_suffix
+
+
+def mesh_files(filename, mesh):
+    """[(filename, print 3mf), (its preview filename, preview 3mf)] of a FreeCAD mesh.
+    Both come from the same tessellation, the preview is decimated from it (decimate.py).
+    With orient_prints the print mesh is turned to its best print orientation (orient.py),
+    the preview stays as the part sits in the model."""
+    import meshcheck
+    return array_files(filename, *meshcheck.arrays(mesh))
+
+
+def array_files(filename, points, facets):
+    """mesh_files() of a mesh given as arrays (kernel.py)."""
+    import decimate
+    printed = points
+    if orient_prints and len(facets):
+        import orient
+        printed, _ = orient.orient(points, facets)
+    return [(filename, arrays_3mf(printed, facets)),
+            (preview_filename(filename), arrays_3mf(*decimate.decimate(points, facets)))]
+
+
+def entities(shape):
+    """Edges of a flat shape (in the XY plane) as sorted entity tuples:
+    ('CIRCLE', cx, cy, r), ('ARC', cx, cy, r, start angle, end angle) counter-clockwise in degrees,
+    ('LINE', x1, y1, x2, y2) with the smallest point first. Other curves become lines."""
+    result = []
+    for edge in shape.Edges:
+        curve = edge.Curve
+        first = edge.valueAt(edge.FirstParameter)
+        last = edge.valueAt(edge.LastParameter)
+        if curve.TypeId == 'Part::GeomCircle':
+            c, r = curve.Center, curve.Radius
+            if edge.isClosed():
+                result.append(('CIRCLE', c.x, c.y, r))
+                continue
+            if curve.Axis.z < 0:
+                first, last = last, first
+            start = math.degrees(math.atan2(first.y - c.y, first.x - c.x)) % 360
+            end = math.degrees(math.atan2(last.y - c.y, last.x - c.x)) % 360
+            result.append(('ARC', c.x, c.y, r, start, end))
+        elif curve.TypeId in ('Part::GeomLine', 'Part::GeomLineSegment'):
+            result.append(('LINE',) + min((first.x, first.y, last.x, last.y), (last.x, last.y, first.x, first.y)))
+        else:
+            points = edge.discretize(Deflection=10 ** -decimals * 100)
+            for p, q in zip(points, points[1:]):
+                result.append(('LINE',) + min((p.x, p.y, q.x, q.y), (q.x, q.y, p.x, p.y)))
+    # rounded first, so that noise below the precision does not change the order
+    result = [(e[0],) + tuple(float(number(v)) for v in e[1:]) for e in result]
+    return sorted(result)
+
+
+def svg(shape):
+    """Text of an svg file of a flat shape, in mm, y up as in FreeCAD."""
+    found = entities(shape)
+    box = shape.BoundBox
+    margin = 1
+    x0, y0 = box.XMin - margin, -box.YMax - margin
+    width, height = box.XLength + 2*margin, box.YLength + 2*margin
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>',
+             '<svg xmlns="http://www.w3.org/2000/svg" version="1.1" width="%smm" height="%smm" viewBox="%s %s %s %s">'
+             % (number(width), number(height), number(x0), number(y0), number(width), number(height)),
+             '<g fill="none" stroke="black" stroke-width="0.35">']
+    for e in found:
+        if e[0] == 'LINE':
+            lines.append('<path d="M %s %s L %s %s"/>' % (number(e[1]), number(-e[2]), number(e[3]), number(-e[4])))
+        elif e[0] == 'CIRCLE':
+            lines.append('<circle cx="%s" cy="%s" r="%s"/>' % (number(e[1]), number(-e[2]), number(e[3])))
+        else:
+            cx, cy, r, start, end = e[1:]
+            sweep = (end - start) % 360
+            sx, sy = cx + r * math.cos(math.radians(start)), cy + r * math.sin(math.radians(start))
+            ex, ey = cx + r * math.cos(math.radians(end)), cy + r * math.sin(math.radians(end))
+            # counter-clockwise with y up is clockwise (sweep flag 0) with y down
+            lines.append('<path d="M %s %s A %s %s 0 %d 0 %s %s"/>'
+                         % (number(sx), number(-sy), number(r), number(r), 1 if sweep > 180 else 0, number(ex), number(-ey)))
+    lines += ['</g>', '</svg>', '']
+    return '\n'.join(lines)
+
+
+def dxf(shape):
+    """Text of a dxf (R12, entities only) file of a flat shape, in mm."""
+    lines = ['0', 'SECTION', '2', 'ENTITIES']
+    for e in entities(shape):
+        lines += ['0', e[0], '8', '0']
+        if e[0] == 'LINE':
+            lines += ['10', number(e[1]), '20', number(e[2]), '30', '0', '11', number(e[3]), '21', number(e[4]), '31', '0']
+        else:
+            lines += ['10', number(e[1]), '20', number(e[2]), '30', '0', '40', number(e[3])]
+            if e[0] == 'ARC':
+                lines += ['50', number(e[4]), '51', number(e[5])]
+    lines += ['0', 'ENDSEC', '0', 'EOF', '']
+    return '\n'.join(lines)
+
+
+def write_if_changed(path, data):
+    """Write bytes (or text) to path, unless the file holds them already. The file is replaced
+    atomically, readers never see half a file. Returns True when the file was written."""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    handle, temporary = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix='.' + os.path.basename(path))
+    try:
+        with os.fdopen(handle, 'wb') as f:
+            f.write(data)
+        os.chmod(temporary, 0o644)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+    return True
+
+
+def write_mesh(mesh, path):
+    """Write a FreeCAD mesh as 3mf. Returns True when the file changed."""
+    return write_if_changed(path, mesh_3mf(mesh))
+
+
+def write_svg(shape, path):
+    return write_if_changed(path, svg(shape))
+
+
+def write_dxf(shape, path):
+    return write_if_changed(path, dxf(shape))
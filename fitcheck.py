@@ -0,0 +1,184 @@
+"""
+fitcheck.py -- Paul Cobbaut
+2026-10-19
+Create a hexagon wall display for small figurines.
+3D-printed hexagon, covered by a bought plexiglass panel.
+This file ==> 2D fit check of the mating features, before anything is meshed
+Every pair is a feature (the inserts of side, side_hinge and sideq, the
+cross parts of both shelves, a leaf knuckle), as sides_and_shelves.inserts(),
+boxes() and hinge.py build it, and the room it goes into (corner pocket,
+slot, hinge cut), both as a convex 2D cross-section perpendicular to the
+direction it is put in. For every edge of the room the gap to the feature
+is computed, all pairs at once with numpy:
+a gap below the edge's minimum is interference, above its maximum is slop.
+The glue corner and the (flipped) top corner are stacked, their pockets
+make one room from gluepart_depth up to depth + the top pocket.
+Shelves go in with the cut of the cross part (cross_cut) at the wall side.
+Run with: python3 fitcheck.py, no FreeCAD is needed
+"""
+
+import math
+import os
+import sys
+import numpy
+sys.path.append(os.path.dirname(os.path.abspath(__file__))) # local helper modules
+
+# floor left above the pocket of a top corner (Pocket_hole.Length = depth - 2)
+top_floor = 2
+
+# sides of a circle as polygon
+circle_sides = 64
+
+# allowed gap per edge of the room (mm): (minimum, maximum)
+press_fit = (-0.06, 0.25) # sides firmly in hexagon corners, a little interference is fine
+slide_fit = (0.0, 0.5)
+free_fit  = (0.05, 0.5)   # parts that have to move
+open_edge = (-numpy.inf, numpy.inf)
+
+# floating point noise is not interference
+eps = 1e-6
+
+
+class FitError(Exception):
+    pass
+
+
+def dimensions(**params):
+    """Dimensions of the generator scripts, with params overriding them.
+    The corner script needs FreeCAD to import, its dimensions are read from its source."""
+    import parametric
+    import sides_and_shelves
+    d = {}
+    for name in sides_and_shelves.dimensions:
+        d[name] = getattr(sides_and_shelves, name)
+    corner = parametric.defaults('glue_three_way_corner')
+    for name in ['center_radius', 'arm_length', 'arm_width', 'hole_width', 'depth', 'gluepart_depth']:
+        d[name] = corner[name]
+    d.update(params)
+    return d
+
+
+def rectangle(x0, x1, y0, y1):
+    """Counter-clockwise, edges: bottom, right, top, left."""
+    return [(x0, y0), (x1, y0), (x1, y1), (x0, y1)]
+
+
+def circle(radius, outside=False):
+    """Regular polygon; outside=True puts the edges on the circle (for rooms), else the vertices."""
+    r = radius / math.cos(math.pi / circle_sides) if outside else radius
+    return [(r * math.cos(2 * math.pi * i / circle_sides), r * math.sin(2 * math.pi * i / circle_sides)) for i in range(circle_sides)]
+
+
+def pairs(d):
+    """(name, feature polygon, room polygon, [(min, max) per room edge]) for every mating pair.
+    The features are the boxes and knuckles the scripts build (sides_and_shelves, hinge)."""
+    import hinge
+    import sides_and_shelves
+    with sides_and_shelves.dimensions_set(**{name: d[name] for name in sides_and_shelves.dimensions}):
+        inserts = [(name, sides_and_shelves.inserts(name)[0]) for name in ('side', 'side_hinge', 'sideq')]
+        crosses = [(name, sides_and_shelves.boxes(name)[1]) for name in ('short_shelve', 'long_shelve')]
+        span = sides_and_shelves.hinge_span
+    pocket_top = d['depth'] + d['depth'] - top_floor
+    result = []
+    # side inserts in the corner pockets; y across the pocket from the center line of the side, z up from the wall
+    for name, (label, length, width, height, x, y, z, angle) in inserts:
+        result.append((name + ' insert in corner pocket',
+                       rectangle(y - d['common_width']/2, y + width - d['common_width']/2, z, z + height),
+                       rectangle(-d['hole_width']/2, d['hole_width']/2, d['gluepart_depth'], pocket_top),
+                       [slide_fit, press_fit, slide_fit, press_fit]))
+    # shelve cross parts in the mid shelve slot, the shelve turned over; the slot runs from the arm center line to its open side
+    for name, (label, length, width, height, x, y, z, angle) in crosses:
+        result.append((name + ' cross part in mid shelve slot',
+                       rectangle(y, y + width, d['common_height'] - z - height, d['common_height'] - z),
+                       rectangle(0, d['arm_width']/2, d['gluepart_depth'], 2*d['depth']),
+                       [slide_fit, open_edge, slide_fit, slide_fit]))
+    if d['hinge_knuckles'] < 3:
+        return result
+    # the first leaf knuckle in the room cut from the side around it, and between its side knuckles along the axis
+    outer, clearance = d['hinge_outer'], d['hinge_clearance']
+    k = hinge.knuckle_length(span, d['hinge_knuckles'], clearance)
+    side0, leaf, side2 = hinge.knuckle_starts(span, d['hinge_knuckles'], clearance)[:3]
+    radius, rooms = hinge.leaf_rooms(span, d['hinge_knuckles'], outer, clearance)
+    result.append(('leaf knuckle in side hinge cut',
+                   circle(outer),
+                   circle(radius, outside=True),
+                   [free_fit] * circle_sides))
+    result.append(('leaf knuckle between side knuckles',
+                   rectangle(leaf, leaf + k, -outer, outer),
+                   rectangle(max(side0 + k, rooms[0][0]), min(side2, rooms[0][1]), -radius, radius),
+                   [free_fit] * 4))
+    return result
+
+
+def _padded(polygons):
+    """Polygons as one (P, N, 2) array, short ones padded with their first vertex, plus the counts."""
+    n = max(len(p) for p in polygons)
+    array = numpy.empty((len(polygons), n, 2))
+    for i, p in enumerate(polygons):
+        array[i, :len(p)] = p
+        array[i, len(p):] = p[0]
+    return array, numpy.array([len(p) for p in polygons])
+
+
+def gaps(features, rooms):
+    """Gap between every room edge and its feature, (P, E) with nan for padding.
+    The gap of an edge is the smallest distance of a feature vertex to the edge line,
+    measured into the room: negative means the feature sticks through that edge."""
+    vertices, _ = _padded(features)
+    corners, counts = _padded(rooms)
+    starts = corners
+    ends = numpy.roll(corners, -1, axis=1)
+    # the last real edge closes the polygon, not the padding
+    for i, count in enumerate(counts):
+        ends[i, count - 1] = corners[i, 0]
+    edges = ends - starts
+    lengths = numpy.hypot(edges[..., 0], edges[..., 1])
+    valid = numpy.arange(corners.shape[1])[None, :] < counts[:, None]
+    lengths[~valid] = 1
+    normals = numpy.stack([-edges[..., 1], edges[..., 0]], axis=-1) / lengths[..., None] # inward for counter-clockwise rooms
+    offsets = numpy.einsum('pek,pek->pe', starts, normals)
+    distances = numpy.einsum('pvk,pek->pve', vertices, normals) - offsets[:, None, :]
+    result = distances.min(axis=1)
+    result[~valid] = numpy.nan
+    return result
+
+
+def check(params=None, raise_error=True, **more):
+    """Check all pairs. Returns a list of (pair, smallest gap, largest gap, problems),
+    gaps nan for a check that is no pair; raises FitError on interference or slop when raise_error."""
+    d = dimensions(**dict(params or {}, **more))
+    found = pairs(d)
+    result = gaps([f for _, f, _, _ in found], [r for _, _, r, _ in found])
+    report = []
+    failed = []
+    # the leaf plate (a fixed hexagon), its screw holes and its cuts fit one leaf knuckle
+    # between two side knuckles: side, leaf, side
+    if d['hinge_knuckles'] != 3:
+        problem = '%d knuckles, the leaf fits 3 (side, leaf, side)' % d['hinge_knuckles']
+        report.append(('hinge', math.nan, math.nan, [problem]))
+        failed.append('hinge: ' + problem)
+    for i, (name, _, _, limits) in enumerate(found):
+        edge_gaps = result[i, :len(limits)]
+        low = numpy.array([l[0] for l in limits])
+        high = numpy.array([l[1] for l in limits])
+        problems = []
+        tight = edge_gaps < low - eps
+        loose = edge_gaps > high + eps
+        if tight.any():
+            smallest = numpy.min(edge_gaps[tight])
+            problems.append('interference %.3f mm' % -smallest if smallest < 0 else 'too tight, gap %.3f mm' % smallest)
+        if loose.any():
+            problems.append('slop %.3f mm' % numpy.max(edge_gaps[loose]))
+        closed = numpy.isfinite(high)
+        report.append((name, float(numpy.min(edge_gaps)), float(numpy.max(edge_gaps[closed])), problems))
+        if problems:
+            failed.append(name + ': ' + ', '.join(problems))
+    if failed and raise_error:
+        raise FitError('; '.join(failed))
+    return report
+
+
+if __name__ == "__main__":
+    for name, smallest, largest, problems in check(raise_error=False):
+        gap = "gap %7.3f .. %7.3f mm" % (smallest, largest) if math.isfinite(smallest) else ""
+        print("%-44s %-26s %s" % (name, gap, ', '.join(problems) or 'ok'))
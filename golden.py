@@ -0,0 +1,174 @@
+"""
+golden.py -- Paul Cobbaut
+2026-10-19
+Create a hexagon wall display for small figurines.
+3D-printed hexagon, covered by a bought plexiglass panel.
+This file ==> golden records of every part, to compare a build against
+A fingerprint of a part: volume, area, length of the edges and bounding
+box, compared within a tolerance (a mesh hash changes with the mesher and
+with every value that rounds the other way).
+Every generator script is built once per variant, all its parts are
+fingerprinted from that one build, no GUI needed.
+Without FreeCAD the numpy kernel builds the prismatic parts (kernel.py),
+they are compared with their own records in golden_numpy.json.
+Run with: freecadcmd golden.py record    # write the records
+          freecadcmd golden.py           # compare a build with the records
+          python3 golden.py              # the same with the numpy kernel
+"""
+
+import json
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__))) # local helper modules
+import kernel
+
+here = os.path.dirname(os.path.abspath(__file__))
+
+# records per geometry backend, HEXAGON_GOLDEN overrides
+golden_files = {'freecad': os.path.join(here, 'golden.json'), 'numpy': os.path.join(here, 'golden_numpy.json')}
+
+# allowed difference: relative for volume, area and length, absolute (mm) for the bounding box
+relative_tolerance = 1e-4
+bound_tolerance    = 1e-3
+
+# generator script --> variants (params) to record, {} builds with the defaults
+variants = {
+    'sides_and_shelves'      : [{}, {'fuse': True}],
+    'glue_two_way_corner'    : [{}],
+    'top_two_way_corner'     : [{}],
+    'glue_three_way_corner'  : [{}],
+    'top_three_way_corner'   : [{}],
+    'glue_mid_shelve_corner' : [{}],
+    'top_mid_shelve_corner'  : [{}],
+    'glass'                  : [{}],
+}
+
+
+def key(name, params):
+    """Record key of a part built with params."""
+    return name + json.dumps(params, sort_keys=True) if params else name
+
+
+def golden_file(name=None):
+    """Records file of a geometry backend (kernel.backends), the default backend if None."""
+    name = name or ('numpy' if isinstance(kernel.backend(), kernel.NumpyKernel) else 'freecad')
+    return os.environ.get('HEXAGON_GOLDEN', golden_files[name])
+
+
+def fingerprint(shape):
+    """Fingerprint of a shape as a dict."""
+    box = shape.BoundBox
+    return {
+        'volume' : shape.Volume,
+        'area'   : shape.Area,
+        'length' : shape.Length,
+        'bound'  : [box.XMin, box.YMin, box.ZMin, box.XMax, box.YMax, box.ZMax],
+    }
+
+
+def mesh_fingerprint(points, facets):
+    """Fingerprint of a mesh as a dict: the union measures, no edge length."""
+    import estimate
+    import numpy
+    measured = estimate.measures(points, facets)
+    return {
+        'volume' : measured['volume'],
+        'area'   : measured['area'],
+        'bound'  : numpy.concatenate([points.min(axis=0), points.max(axis=0)]).tolist(),
+    }
+
+
+def fingerprints(script, params):
+    """Build a generator script once with params. Returns {record key: fingerprint} of all its parts, mirrors included."""
+    import importlib
+    import FreeCAD
+    import Part
+    import mirror
+    import parts
+    module = importlib.import_module(script)
+    doc = FreeCAD.newDocument('golden')
+    try:
+        objects = module.build(doc, **params)
+        doc.recompute()
+        result = {}
+        for name, obj in objects.items():
+            result[key(name, params)] = fingerprint(Part.getShape(obj, ""))
+        for name, source in parts.mirrors.items():
+            if source in objects:
+                base, normal = module.mirror_plane(**params)
+                shape = mirror.mirror_shape(Part.getShape(objects[source], ""), base, normal)
+                result[key(name, params)] = fingerprint(shape)
+        return result
+    finally:
+        FreeCAD.closeDocument(doc.Name)
+
+
+def build_numpy():
+    """Fingerprints of the prismatic parts (kernel.prismatic) built with the numpy kernel."""
+    k = kernel.NumpyKernel()
+    return {name: mesh_fingerprint(*k.mesh(kernel.part(name, k=k))) for name in kernel.prismatic()}
+
+
+def build_all():
+    """Fingerprints of every part of every variant, of the prismatic parts only without FreeCAD."""
+    if isinstance(kernel.backend(), kernel.NumpyKernel):
+        return build_numpy()
+    result = {}
+    for script, params_list in variants.items():
+        for params in params_list:
+            result.update(fingerprints(script, params))
+    return result
+
+
+def differences(record, golden):
+    """What differs between two fingerprints, as a list of strings."""
+    found = []
+    for name in ['volume', 'area', 'length']:
+        if name not in golden:
+            continue
+        scale = max(abs(golden[name]), 1)
+        if abs(record[name] - golden[name]) > relative_tolerance * scale:
+            found.append('%s %.4f (was %.4f)' % (name, record[name], golden[name]))
+    if max(abs(a - b) for a, b in zip(record['bound'], golden['bound'])) > bound_tolerance:
+        found.append('bounding box %s (was %s)' % (['%.3f' % v for v in record['bound']], ['%.3f' % v for v in golden['bound']]))
+    return found
+
+
+def compare(records, golden):
+    """{record key: differences} for the parts that changed, are new or are gone."""
+    result = {}
+    for name in sorted(set(records) | set(golden)):
+        if name not in golden:
+            result[name] = ['new part']
+        elif name not in records:
+            result[name] = ['missing']
+        else:
+            found = differences(records[name], golden[name])
+            if found:
+                result[name] = found
+    return result
+
+
+def record(path=None):
+    records = build_all()
+    path = path or golden_file()
+    with open(path, 'w') as f:
+        json.dump(records, f, indent=1, sort_keys=True)
+    return records
+
+
+def load(path=None):
+    with open(path or golden_file()) as f:
+        return json.load(f)
+
+
+if __name__ == "__main__":
+    if 'record' in sys.argv:
+        print('%d parts recorded in %s' % (len(record()), golden_file()))
+    else:
+        changed = compare(build_all(), load())
+        for name, found in changed.items():
+            print(name + ': ' + ', '.join(found))
+        if changed:
+            sys.exit(1)
+        print('all parts match ' + golden_file())
@@ -0,0 +1,78 @@
+"""
+hinge.py -- Paul Cobbaut
+2026-10-19
+Create a hexagon wall display for small figurines.
+3D-printed hexagon, covered by a bought plexiglass panel.
+This file ==> parametric hinge with N alternating knuckles
+Knuckle 0, 2, 4, ... belong to the side, knuckle 1, 3, 5, ... to the leaf.
+The tube (outer cylinder minus pin hole) is cut once per radius pair
+and length, every knuckle is a placed copy of that solid, so more
+knuckles do not add boolean operations.
+The knuckles are made along +X from the origin of their feature, the
+caller places the feature (and can bind its placement to the sheet).
+knuckle_starts() and leaf_rooms() need no FreeCAD, fitcheck.py uses them.
+"""
+
+# (outer, inner, length) --> tube solid
+_tube_cache = {}
+
+
+def tube(outer, inner, length):
+    """Tube along +Z, cached."""
+    import Part
+    key = (outer, inner, length)
+    if key not in _tube_cache:
+        _tube_cache[key] = Part.makeCylinder(outer, length).cut(Part.makeCylinder(inner, length))
+    return _tube_cache[key]
+
+
+def knuckle_length(length, count, clearance):
+    """Length of one knuckle when count knuckles with clearance between them fill length."""
+    return (length - (count - 1) * clearance) / count
+
+
+def knuckle_starts(length, count, clearance):
+    """X of the start of every knuckle, from the start of the hinge axis."""
+    k = knuckle_length(length, count, clearance)
+    return [i * (k + clearance) for i in range(count)]
+
+
+def leaf_rooms(length, count, outer, clearance):
+    """Radius and [(x start, x end)] of the room cut from the side around every leaf knuckle."""
+    k = knuckle_length(length, count, clearance)
+    return outer + clearance, [(x - clearance, x + k + clearance) for i, x in enumerate(knuckle_starts(length, count, clearance)) if i % 2 == 1]
+
+
+def _feature(doc, label, shapes):
+    import Part
+    obj = doc.addObject("Part::Feature", label)
+    obj.Label = label
+    obj.Shape = Part.makeCompound(shapes)
+    return obj
+
+
+def make_knuckles(doc, label, length, count, outer, inner, clearance, leaf=False):
+    """Part::Feature with the side knuckles (or the leaf knuckles) of a hinge.
+    The hinge axis runs along +X from the origin of the feature."""
+    import FreeCAD
+    from FreeCAD import Vector
+    k = knuckle_length(length, count, clearance)
+    solid = tube(outer, inner, k)
+    rotation = FreeCAD.Rotation(Vector(0,1,0),90) # Z axis of the tube onto X
+    shapes = []
+    for i, x in enumerate(knuckle_starts(length, count, clearance)):
+        if i % 2 == (1 if leaf else 0):
+            shapes.append(solid.moved(FreeCAD.Placement(Vector(x, 0, 0), rotation)))
+    return _feature(doc, label, shapes)
+
+
+def make_clearance(doc, label, length, count, outer, clearance):
+    """Part::Feature with room around every leaf knuckle (leaf_rooms()), to cut from the side in one Part::Cut."""
+    import FreeCAD
+    import Part
+    from FreeCAD import Vector
+    radius, rooms = leaf_rooms(length, count, outer, clearance)
+    rotation = FreeCAD.Rotation(Vector(0,1,0),90)
+    solid = Part.makeCylinder(radius, knuckle_length(length, count, clearance) + 2 * clearance) # every room is as long
+    shapes = [solid.moved(FreeCAD.Placement(Vector(start, 0, 0), rotation)) for start, end in rooms]
+    return _feature(doc, label, shapes)
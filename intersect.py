@@ -0,0 +1,142 @@
+"""
+intersect.py -- Paul Cobbaut
+2026-10-19
+Create a hexagon wall display for small figurines.
+3D-printed hexagon, covered by a bought plexiglass panel.
+This file ==> intersections of the corner sketches: circle and segment, two lines
+The corner scripts each had a copy of these, which
+- took the square root of a negative discriminant when a segment missed the circle
+- rounded the hits to 0.01 mm and then tested them exactly against the bounding
+  box of the segment, so a hit rounded just past an end point was dropped
+- divided by zero for parallel lines
+Here a hit is tested before rounding, with a tolerance, and results are
+structured: Hit(x, y, t) and Crossing(x, y, t, u), t (and u) the position along
+the segment, 0 at its start and 1 at its end. The batch functions do N segments
+at once with numpy. circle_point() and crossing_point() give the Vector for a
+sketch or raise IntersectionError saying which segment, so a parameter sweep
+stops at the build that cannot be drawn instead of recomputing a broken sketch.
+Sketch points stay rounded to decimals, as the corners always were.
+"""
+
+import math
+import os
+import sys
+from collections import namedtuple
+import numpy
+sys.path.append(os.path.dirname(os.path.abspath(__file__))) # local helper modules
+from kernel import Vector
+
+# distances below this (mm) are zero: a hit this far past the end of a segment is on it
+tolerance = 1e-6
+
+# sketch points are rounded to 0.01 mm
+decimals = 2
+
+Hit = namedtuple('Hit', 'x y t')
+Crossing = namedtuple('Crossing', 'x y t u')
+
+
+class IntersectionError(Exception):
+    pass
+
+
+def polar(radius, angle_degrees):
+    """(x, y) at radius and angle (degrees) from the origin, rounded to decimals."""
+    angle_radians = math.radians(angle_degrees)
+    return round(radius * math.cos(angle_radians), decimals), round(radius * math.sin(angle_radians), decimals)
+
+
+def polar_to_vector(radius, angle_degrees):
+    return Vector(*polar(radius, angle_degrees), 0)
+
+
+def circle_segments(radius, starts, ends, center=(0, 0), tol=tolerance):
+    """Hits of a circle with N segments at once, starts and ends (N, 2).
+    Returns points (N, 2, 2) and t (N, 2), per segment in the order of t, and valid (N, 2):
+    the hits on the segment, within tol. A segment that misses has none, a tangent one
+    (within tol) one. Degenerate segments (shorter than tol) have none."""
+    starts = numpy.asarray(starts, dtype=float).reshape(-1, 2)
+    d = numpy.asarray(ends, dtype=float).reshape(-1, 2) - starts
+    s = starts - numpy.asarray(center, dtype=float)
+    a = (d * d).sum(axis=1)
+    b = 2 * (s * d).sum(axis=1)
+    c = (s * s).sum(axis=1) - radius * radius
+    length = numpy.sqrt(a)
+    real = length > tol
+    safe = numpy.where(real, a, 1.0)
+    # discriminant = 4 a (radius^2 - distance^2) of the line to the center: tangent within tol
+    discriminant = b * b - 4 * a * c
+    real &= discriminant >= -8 * a * radius * tol
+    root = numpy.sqrt(numpy.maximum(discriminant, 0))
+    t = numpy.stack([(-b - root) / (2 * safe), (-b + root) / (2 * safe)], axis=1)
+    margin = (tol / numpy.where(real, length, 1.0))[:, None]
+    valid = real[:, None] & (t >= -margin) & (t <= 1 + margin)
+    valid[:, 1] &= root > 0 # a tangent touches once
+    t = numpy.clip(t, 0, 1)
+    points = starts[:, None, :] + t[:, :, None] * d[:, None, :]
+    return points, t, valid
+
+
+def circle_segment(radius, start, end, center=(0, 0), tol=tolerance):
+    """[Hit(x, y, t)] of a circle and a segment, in the order of t; empty when the segment misses."""
+    points, t, valid = circle_segments(radius, [start], [end], center, tol)
+    return [Hit(float(points[0, i, 0]), float(points[0, i, 1]), float(t[0, i])) for i in range(2) if valid[0, i]]
+
+
+def on_segment(point, start, end, tol=tolerance):
+    """True when point is within tol of the segment from start to end."""
+    p, a, b = (numpy.asarray(v, dtype=float)[:2] for v in (point, start, end))
+    d = b - a
+    t = numpy.clip((p - a) @ d / max(d @ d, tol * tol), 0, 1)
+    return bool(numpy.hypot(*(a + t * d - p)) <= tol)
+
+
+def line_crossings(starts1, ends1, starts2, ends2, tol=tolerance):
+    """Where the lines through N pairs of segments cross, at once.
+    Returns points (N, 2), t (N) along the first segments, u (N) along the second ones
+    (0..1 is on the segment) and parallel (N): lines within tol of parallel (or degenerate),
+    their point, t and u are nan."""
+    s1 = numpy.asarray(starts1, dtype=float).reshape(-1, 2)
+    s2 = numpy.asarray(starts2, dtype=float).reshape(-1, 2)
+    d1 = numpy.asarray(ends1, dtype=float).reshape(-1, 2) - s1
+    d2 = numpy.asarray(ends2, dtype=float).reshape(-1, 2) - s2
+    offset = s2 - s1
+    denominator = d1[:, 0] * d2[:, 1] - d1[:, 1] * d2[:, 0]
+    # the sine of the angle between the lines
+    parallel = numpy.abs(denominator) <= tol * numpy.hypot(*d1.T) * numpy.hypot(*d2.T)
+    safe = numpy.where(parallel, numpy.nan, denominator)
+    t = (offset[:, 0] * d2[:, 1] - offset[:, 1] * d2[:, 0]) / safe
+    u = (offset[:, 0] * d1[:, 1] - offset[:, 1] * d1[:, 0]) / safe
+    return s1 + t[:, None] * d1, t, u, parallel
+
+
+def line_crossing(start1, end1, start2, end2, tol=tolerance):
+    """Crossing(x, y, t, u) of the lines through two segments, None when they are parallel."""
+    points, t, u, parallel = line_crossings([start1], [end1], [start2], [end2], tol)
+    if parallel[0]:
+        return None
+    return Crossing(float(points[0, 0]), float(points[0, 1]), float(t[0]), float(u[0]))
+
+
+def _text(point):
+    return '(%.3f, %.3f)' % tuple(point)[:2]
+
+
+def circle_point(radius, start, end, center=(0, 0)):
+    """Vector of the first hit (from start) of a circle and a segment, rounded to decimals,
+    for a sketch. Raises IntersectionError when the segment misses the circle."""
+    hits = circle_segment(radius, start, end, center)
+    if not hits:
+        raise IntersectionError('segment %s - %s misses the circle of radius %g at %s'
+                                % (_text(start), _text(end), radius, _text(center)))
+    return Vector(round(hits[0].x, decimals), round(hits[0].y, decimals), 0)
+
+
+def crossing_point(start1, end1, start2, end2):
+    """Vector where the lines through two segments cross, for a sketch.
+    Raises IntersectionError when they are parallel."""
+    crossing = line_crossing(start1, end1, start2, end2)
+    if crossing is None:
+        raise IntersectionError('lines %s - %s and %s - %s are parallel'
+                                % (_text(start1), _text(end1), _text(start2), _text(end2)))
+    return Vector(crossing.x, crossing.y, 0)
@@ -0,0 +1,342 @@
+"""
+kernel.py -- Paul Cobbaut
+2026-10-19
+Create a hexagon wall display for small figurines.
+3D-printed hexagon, covered by a bought plexiglass panel.
+This file ==> geometry backends: FreeCAD, or numpy for the prismatic parts
+A backend has the few operations the prismatic parts need:
+- vector, segment, arc, polygon, face : points and a closed 2D profile (XY)
+- extrude, box                        : a solid from a profile, along +z
+- placed, mirrored, compound          : move, turn around Z, reflect, combine
+- measure, mesh, files                : volume/area/size, arrays, 3mf files
+FreeCADKernel does them with Part, NumpyKernel keeps a solid as a list of
+prisms (profile, height, transformation) and tessellates them itself: no
+FreeCAD is needed. Like a Part::Compound the prisms may overlap; volume and
+area are those of their union (the fused solids, estimate.measures for numpy).
+The shelves and the sides with(out) quartershelves are only boxes
+(sides_and_shelves.boxes), part() builds them with either backend. Hinge,
+leaf, corners and glass need cuts, chamfers and sketches: FreeCAD (parts.py).
+HEXAGON_KERNEL picks the backend: freecad, numpy, or empty for FreeCAD when
+it can be imported.
+Run with: python3 kernel.py [--export directory] [part ...]
+"""
+
+import math
+import os
+import sys
+import numpy
+sys.path.append(os.path.dirname(os.path.abspath(__file__))) # local helper modules
+
+# backend: 'freecad', 'numpy' or '' for FreeCAD when it is there
+default_backend = os.environ.get('HEXAGON_KERNEL', '')
+
+# arcs of the numpy backend: at most this angle (radians) per segment, as meshing.angular_deflection
+arc_step = 0.1
+
+# points closer than this (mm) are the same point, profile corners this flat are dropped
+eps = 1e-9
+
+
+class Point:
+    """x, y, z; stands in for FreeCAD.Vector where FreeCAD is not there."""
+
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        self.x, self.y, self.z = x, y, z
+
+    def __iter__(self):
+        return iter((self.x, self.y, self.z))
+
+    def __add__(self, other):
+        return Point(self.x + other.x, self.y + other.y, self.z + other.z)
+
+    def __sub__(self, other):
+        return Point(self.x - other.x, self.y - other.y, self.z - other.z)
+
+    def __mul__(self, factor):
+        return Point(self.x * factor, self.y * factor, self.z * factor)
+
+    __rmul__ = __mul__
+
+    @property
+    def Length(self):
+        return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+
+    def __repr__(self):
+        return 'Point (%r, %r, %r)' % (self.x, self.y, self.z)
+
+
+# what the scripts use as Vector; sides_and_shelves.py imports it from here
+# (not just a find_spec: the FreeCAD directory of this repo imports as an empty package)
+try:
+    from FreeCAD import Vector
+    freecad = True
+except ImportError:
+    Vector = Point
+    freecad = False
+
+
+class FreeCADKernel:
+    name = 'freecad'
+
+    def vector(self, x, y, z=0):
+        from FreeCAD import Vector
+        return Vector(x, y, z)
+
+    def segment(self, start, end):
+        import Part
+        return Part.LineSegment(self.vector(*start), self.vector(*end)).toShape()
+
+    def arc(self, center, radius, start, end):
+        """Arc counter-clockwise from angle start to end (degrees)."""
+        import Part
+        circle = Part.Circle(self.vector(*center), self.vector(0, 0, 1), radius)
+        return Part.ArcOfCircle(circle, math.radians(start), math.radians(end)).toShape()
+
+    def face(self, edges):
+        import Part
+        return Part.Face(Part.Wire(Part.__sortEdges__(edges)))
+
+    def polygon(self, points):
+        import Part
+        points = [self.vector(*point) for point in points]
+        return Part.Face(Part.makePolygon(points + points[:1]))
+
+    def extrude(self, face, height):
+        return face.extrude(self.vector(0, 0, height))
+
+    def box(self, length, width, height):
+        import Part
+        return Part.makeBox(length, width, height)
+
+    def placed(self, solid, x, y, z, angle=0):
+        import FreeCAD
+        shape = solid.copy()
+        shape.Placement = FreeCAD.Placement(self.vector(x, y, z), FreeCAD.Rotation(self.vector(0, 0, 1), angle)).multiply(shape.Placement)
+        return shape
+
+    def mirrored(self, solid, base, normal):
+        return solid.mirror(self.vector(*base), self.vector(*normal))
+
+    def compound(self, solids):
+        import Part
+        return Part.makeCompound(solids)
+
+    def measure(self, solid):
+        box = solid.BoundBox
+        solids = solid.Solids
+        if len(solids) > 1:
+            solid = solids[0].multiFuse(solids[1:])
+        return {'volume': solid.Volume, 'area': solid.Area, 'size': [box.XLength, box.YLength, box.ZLength]}
+
+    def mesh(self, solid):
+        import MeshPart
+        import meshcheck
+        import meshing
+        mesh = MeshPart.meshFromShape(Shape=solid, LinearDeflection=meshing.linear_deflection,
+                                      AngularDeflection=meshing.angular_deflection, Relative=False)
+        return meshcheck.arrays(mesh)
+
+    def files(self, filename, solid):
+        import exporters
+        return exporters.array_files(filename, *self.mesh(solid))
+
+
+class Solid:
+    """Solid of the numpy backend: prisms [(profile (N, 2) counter-clockwise, height, matrix (3, 3), offset (3))]."""
+
+    def __init__(self, prisms):
+        self.prisms = prisms
+
+
+def simplify(profile):
+    """The profile without repeated points and straight corners, counter-clockwise."""
+    points = numpy.asarray(profile, dtype=float)[:, :2]
+    points = points[numpy.hypot(*(points - numpy.roll(points, 1, axis=0)).T) > eps]
+    while len(points) >= 3:
+        before, after = numpy.roll(points, 1, axis=0), numpy.roll(points, -1, axis=0)
+        turn = (points[:, 0] - before[:, 0]) * (after[:, 1] - points[:, 1]) - (points[:, 1] - before[:, 1]) * (after[:, 0] - points[:, 0])
+        keep = numpy.abs(turn) > eps
+        if keep.all():
+            break
+        points = points[keep]
+    if len(points) < 3:
+        raise ValueError('profile has no area')
+    if shoelace(points) < 0:
+        points = points[::-1]
+    return points
+
+
+def shoelace(points):
+    x, y = points[:, 0], points[:, 1]
+    return float((x * numpy.roll(y, -1) - numpy.roll(x, -1) * y).sum() / 2)
+
+
+def triangulate(points):
+    """Triangles [(i, j, k)] of a simple counter-clockwise polygon, by ear clipping."""
+    left = list(range(len(points)))
+    triangles = []
+    while len(left) > 3:
+        for n in range(len(left)):
+            i, j, k = left[n - 1], left[n], left[(n + 1) % len(left)]
+            a, b, c = points[i], points[j], points[k]
+            if (b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0]) <= eps:
+                continue # reflex or flat corner
+            inside = False
+            for m in left:
+                if m in (i, j, k):
+                    continue
+                p = points[m]
+                if all((q[0] - o[0]) * (p[1] - o[1]) - (q[1] - o[1]) * (p[0] - o[0]) > -eps for o, q in ((a, b), (b, c), (c, a))):
+                    inside = True
+                    break
+            if not inside:
+                triangles.append((i, j, k))
+                del left[n]
+                break
+        else:
+            raise ValueError('profile is not a simple polygon')
+    triangles.append(tuple(left))
+    return triangles
+
+
+def rotation_z(angle):
+    c, s = math.cos(math.radians(angle)), math.sin(math.radians(angle))
+    return numpy.array([[c, -s, 0.0], [s, c, 0.0], [0.0, 0.0, 1.0]])
+
+
+class NumpyKernel:
+    name = 'numpy'
+
+    def vector(self, x, y, z=0):
+        return Point(x, y, z)
+
+    def segment(self, start, end):
+        return numpy.array([tuple(start)[:2], tuple(end)[:2]], dtype=float)
+
+    def arc(self, center, radius, start, end):
+        """Arc counter-clockwise from angle start to end (degrees), as points."""
+        sweep = math.radians((end - start) % 360 or 360)
+        steps = max(1, math.ceil(sweep / arc_step))
+        angles = math.radians(start) + numpy.linspace(0, sweep, steps + 1)
+        cx, cy = tuple(center)[:2]
+        return numpy.stack([cx + radius * numpy.cos(angles), cy + radius * numpy.sin(angles)], axis=1)
+
+    def face(self, edges):
+        """Closed profile of edges (segments and arcs) in order; an edge is turned around when its end meets the profile."""
+        points = numpy.asarray(edges[0], dtype=float)
+        for edge in edges[1:]:
+            edge = numpy.asarray(edge, dtype=float)
+            if numpy.hypot(*(edge[-1] - points[-1])) < numpy.hypot(*(edge[0] - points[-1])):
+                edge = edge[::-1]
+            points = numpy.concatenate([points, edge])
+        return simplify(points)
+
+    def polygon(self, points):
+        return simplify([tuple(point)[:2] for point in points])
+
+    def extrude(self, face, height):
+        return Solid([(face, float(height), numpy.eye(3), numpy.zeros(3))])
+
+    def box(self, length, width, height):
+        return self.extrude(self.polygon([(0, 0), (length, 0), (length, width), (0, width)]), height)
+
+    def placed(self, solid, x, y, z, angle=0):
+        turn = rotation_z(angle)
+        offset = numpy.array([x, y, z], dtype=float)
+        return Solid([(profile, height, turn @ matrix, turn @ shift + offset) for profile, height, matrix, shift in solid.prisms])
+
+    def mirrored(self, solid, base, normal):
+        n = numpy.array(tuple(normal), dtype=float)
+        n /= numpy.linalg.norm(n)
+        reflect = numpy.eye(3) - 2 * numpy.outer(n, n)
+        base = numpy.array(tuple(base), dtype=float)
+        return Solid([(profile, height, reflect @ matrix, reflect @ (shift - base) + base) for profile, height, matrix, shift in solid.prisms])
+
+    def compound(self, solids):
+        return Solid([prism for solid in solids for prism in solid.prisms])
+
+    def measure(self, solid):
+        import estimate
+        return estimate.measures(*self.mesh(solid))
+
+    def mesh(self, solid):
+        """Points (N, 3) and facets (F, 3) of all prisms, outward facets counter-clockwise."""
+        all_points, all_facets, count = [], [], 0
+        for profile, height, matrix, shift in solid.prisms:
+            n = len(profile)
+            bottom = numpy.column_stack([profile, numpy.zeros(n)])
+            top = numpy.column_stack([profile, numpy.full(n, height)])
+            caps = numpy.array(triangulate(profile), dtype=numpy.int64).reshape(-1, 3)
+            i = numpy.arange(n)
+            j = (i + 1) % n
+            facets = numpy.concatenate([caps[:, ::-1], caps + n,
+                                        numpy.stack([i, j, j + n], axis=1), numpy.stack([i, j + n, i + n], axis=1)])
+            if numpy.linalg.det(matrix) < 0:
+                facets = facets[:, ::-1] # a reflection turns the facets inside out
+            all_points.append(numpy.concatenate([bottom, top]) @ matrix.T + shift)
+            all_facets.append(facets + count)
+            count += 2 * n
+        if not all_points:
+            return numpy.zeros((0, 3)), numpy.zeros((0, 3), dtype=numpy.int64)
+        return numpy.concatenate(all_points), numpy.concatenate(all_facets)
+
+    def files(self, filename, solid):
+        import exporters
+        return exporters.array_files(filename, *self.mesh(solid))
+
+
+backends = {'freecad': FreeCADKernel, 'numpy': NumpyKernel}
+
+
+def backend(name=None):
+    """A backend by name; default_backend, or FreeCAD when it can be imported, else numpy."""
+    name = name or default_backend or ('freecad' if freecad else 'numpy')
+    if name not in backends:
+        raise ValueError('unknown geometry backend: ' + name + ' (' + ', '.join(backends) + ')')
+    return backends[name]()
+
+
+def prismatic():
+    """Names of the parts part() can build, mirrors included."""
+    import parts
+    import sides_and_shelves
+    return [name for name in parts.names() if parts.mirrors.get(name, name) in sides_and_shelves.box_parts]
+
+
+def part(name, params=None, k=None):
+    """Solid of a prismatic part (prismatic()) in backend k, params overriding the dimensions."""
+    import parts
+    import sides_and_shelves
+    k = k or backend()
+    params = params or {}
+    source = parts.mirrors.get(name, name)
+    if source not in sides_and_shelves.box_parts:
+        raise ValueError(name + ' is not made of boxes only, build it with FreeCAD (parts.py)')
+    with sides_and_shelves.dimensions_set(**params):
+        solid = k.compound([k.placed(k.box(length, width, height), x, y, z, angle)
+                            for label, length, width, height, x, y, z, angle in sides_and_shelves.boxes(source)])
+        if name in parts.mirrors:
+            solid = k.mirrored(solid, *sides_and_shelves.mirror_plane(**params))
+    return solid
+
+
+if __name__ == "__main__":
+    import time
+    import estimate
+    import sinks
+    args = [arg for arg in sys.argv[1:] if not arg.endswith('.py')]
+    target = None
+    if args and args[0] == '--export':
+        target, args = args[1], args[2:]
+    k = backend()
+    start = time.perf_counter()
+    with sinks.open_sink(target) if target else sinks.MemorySink() as sink:
+        for name in args or prismatic():
+            solid = part(name, k=k)
+            row = k.measure(solid)
+            row.update(estimate.filament(row))
+            print('%-16s %10.0f mm3 %10.0f mm2 %8.1f g %6.2f m' % (name, row['volume'], row['area'], row['grams'], row['meters']), file=sys.stderr)
+            if target:
+                for filename, data in k.files(name + '.3mf', solid):
+                    sink.put(filename, data)
+    print('%s backend: %.2f s' % (k.name, time.perf_counter() - start), file=sys.stderr)
@@ -0,0 +1,162 @@
+"""
+layout.py -- Paul Cobbaut
+2026-10-19
+Create a hexagon wall display for small figurines.
+3D-printed hexagon, covered by a bought plexiglass panel.
+This file ==> a wall of hexagon cells, and the parts it takes
+Cells are flat-top hexagons on an axial grid (q, r); neighbours share a side
+and the corners at both ends of it. The distance between the centers of
+two corners is the side plus the arms of both corners: corner_distance.
+Corner k of a cell is at 60*k degrees, side k runs from corner k to k+1:
+side 1 is the top (hinged, it carries the glass door), side 0 and side 2
+are the upper right and upper left side.
+A corner where two sides meet is a two-way corner, three sides a three-way
+corner. A cell with a long shelve has mid shelve corners at 0 and 180 degrees,
+a cell with a short shelve rests it on the holders of its upper right
+(sideq2) and upper left (sideq2_mirror) side.
+A layout is written as cells separated by spaces, q,r[:shelve]:
+  "0,0 1,0:long 0,1:short"
+"""
+
+import json
+import math
+from collections import Counter
+
+# distance between the centers of neighbouring corners (side_length + 2 * arm_length)
+corner_distance = 170
+
+shelves = [None, 'long', 'short']
+
+
+class Cell:
+    def __init__(self, q, r, shelve=None):
+        if shelve not in shelves:
+            raise ValueError('unknown shelve: %s' % shelve)
+        self.q, self.r, self.shelve = q, r, shelve
+
+    def center(self, radius=corner_distance):
+        return radius * 1.5 * self.q, radius * math.sqrt(3) * (self.r + self.q / 2)
+
+    def corners(self, radius=corner_distance):
+        """(x, y) of the six corners, corner k at 60*k degrees."""
+        x, y = self.center(radius)
+        return [(x + radius * math.cos(math.radians(60 * k)), y + radius * math.sin(math.radians(60 * k))) for k in range(6)]
+
+
+def key(point):
+    """Corners of neighbouring cells are the same corner: compare rounded to 0.01 mm."""
+    return round(point[0], 2) + 0.0, round(point[1], 2) + 0.0
+
+
+class Layout:
+    def __init__(self, cells, radius=corner_distance):
+        self.cells = list(cells)
+        self.radius = radius
+        positions = [(c.q, c.r) for c in self.cells]
+        if len(set(positions)) != len(positions):
+            raise ValueError('a cell is given twice')
+        self._analyse()
+
+    def _analyse(self):
+        # corner key --> {'point', 'sides' (set of side keys), 'mid_shelve', 'shelve_direction' (degrees, to the long shelve)}
+        self.corner_info = {}
+        # side key (two corner keys, sorted) --> {'kind', 'cells', 'owner': (cell, k) that decided the kind}
+        self.side_info = {}
+        for cell in self.cells:
+            points = cell.corners(self.radius)
+            keys = [key(p) for p in points]
+            for k in range(6):
+                a, b = keys[k], keys[(k + 1) % 6]
+                side = tuple(sorted([a, b]))
+                info = self.side_info.setdefault(side, {'kind': 'side', 'cells': [], 'owner': (cell, k)})
+                info['cells'].append(cell)
+                if k == 1:
+                    info['kind'] = 'side_hinge'
+                    info['owner'] = (cell, k)
+                elif cell.shelve == 'short' and k in (0, 2) and info['kind'] == 'side':
+                    info['kind'] = 'sideq2' if k == 0 else 'sideq2_mirror'
+                    info['owner'] = (cell, k)
+                for corner, point in ((a, points[k]), (b, points[(k + 1) % 6])):
+                    self.corner_info.setdefault(corner, {'point': point, 'sides': set(), 'mid_shelve': False})['sides'].add(side)
+            if cell.shelve == 'long':
+                self.corner_info[keys[0]].update(mid_shelve=True, shelve_direction=180)
+                self.corner_info[keys[3]].update(mid_shelve=True, shelve_direction=0)
+
+    def corner_kind(self, corner):
+        info = self.corner_info[corner]
+        if info['mid_shelve']:
+            return 'mid_shelve'
+        return 'two_way' if len(info['sides']) == 2 else 'three_way'
+
+    def corner_directions(self, corner):
+        """Directions (degrees) of the sides at a corner, sorted."""
+        x, y = self.corner_info[corner]['point']
+        result = []
+        for a, b in self.corner_info[corner]['sides']:
+            other = b if a == corner else a
+            result.append(round(math.degrees(math.atan2(other[1] - y, other[0] - x))) % 360)
+        return sorted(result)
+
+    def corners(self):
+        """[(corner key, kind)] sorted."""
+        return [(corner, self.corner_kind(corner)) for corner in sorted(self.corner_info)]
+
+    def sides(self):
+        """[(side key, kind)] sorted; kind is the part name of the side."""
+        return [(side, info['kind']) for side, info in sorted(self.side_info.items())]
+
+    def parts(self):
+        """Counter part name --> number needed for the whole wall."""
+        count = Counter()
+        for corner, kind in self.corners():
+            count['Glue_' + kind] += 1
+            count['Top_' + kind] += 1
+        for side, kind in self.sides():
+            count[kind] += 1
+            if kind == 'side_hinge':
+                count['leaf'] += 1
+        for cell in self.cells:
+            count['Hexagon Glass sketch'] += 1
+            if cell.shelve:
+                count[cell.shelve + '_shelve'] += 1
+        return count
+
+    def bounds(self):
+        """(xmin, ymin, xmax, ymax) of all corners."""
+        xs = [info['point'][0] for info in self.corner_info.values()]
+        ys = [info['point'][1] for info in self.corner_info.values()]
+        return min(xs), min(ys), max(xs), max(ys)
+
+    def spec(self):
+        return ' '.join('%d,%d' % (c.q, c.r) + (':' + c.shelve if c.shelve else '') for c in self.cells)
+
+
+def parse(spec):
+    """Layout from 'q,r[:shelve] ...' or from a JSON list of [q, r] / [q, r, shelve]."""
+    spec = spec.strip()
+    cells = []
+    if spec.startswith('['):
+        for item in json.loads(spec):
+            cells.append(Cell(int(item[0]), int(item[1]), item[2] if len(item) > 2 else None))
+        return Layout(cells)
+    for item in spec.split():
+        position, _, shelve = item.partition(':')
+        q, r = (int(v) for v in position.split(','))
+        cells.append(Cell(q, r, shelve or None))
+    return Layout(cells)
+
+
+def hexagon(rings, shelve=None):
+    """Layout of a big hexagon: one cell and rings of cells around it."""
+    cells = []
+    for q in range(-rings, rings + 1):
+        for r in range(max(-rings, -q - rings), min(rings, -q + rings) + 1):
+            cells.append(Cell(q, r, shelve))
+    return Layout(cells)
+
+
+if __name__ == "__main__":
+    import sys
+    wall = parse(' '.join(sys.argv[1:]) or '0,0')
+    for name, count in sorted(wall.parts().items()):
+        print('%-22s %4d' % (name, count))
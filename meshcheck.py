@@ -0,0 +1,152 @@
+"""
+meshcheck.py -- Paul Cobbaut
+2026-10-19
+Create a hexagon wall display for small figurines.
+3D-printed hexagon, covered by a bought plexiglass panel.
+This file ==> watertightness and manifold check of a mesh, before it goes to the slicer
+Compounds of overlapping boxes can give meshes that the slicer has to repair.
+All edges of all facets are built at once with numpy (half-edges: every
+facet has three, from vertex i to vertex i+1) and counted per undirected edge:
+- open edge         : only one facet uses it, the mesh is not watertight
+- non-manifold edge : more than two facets use it
+- flipped edge      : both facets walk it in the same direction, one of them is flipped
+- degenerate facet  : two equal vertices or (almost) no area
+A closed mesh with a negative volume is inside out.
+- overlapping shells: two closed shells (facets connected by edges, see
+  shells()) share volume; only pairs whose bounding boxes overlap are
+  measured, the overlap is their volumes minus that of their union
+  (slicer.union_measures). Touching shells do not overlap.
+Run with: freecadcmd meshcheck.py file.3mf [file.stl ...]
+"""
+
+import os
+import sys
+import numpy
+
+# facets with a smaller area (mm2) are degenerate
+min_area = 1e-9
+
+# shells that share less volume (mm3) do not overlap
+min_overlap = 1e-6
+
+
+def arrays(mesh):
+    """Points (N, 3) and facets (F, 3) of a FreeCAD mesh as numpy arrays."""
+    points, facets = mesh.Topology
+    return numpy.array(points, dtype=float).reshape(-1, 3), numpy.array(facets, dtype=numpy.int64).reshape(-1, 3)
+
+
+def check(points, facets):
+    """Check a mesh given as arrays. Returns a dict with the facet count, the number of
+    open, non-manifold and flipped edges, the number of degenerate facets, the volume and,
+    for a closed mesh, the number of pairs of overlapping shells."""
+    a = points[facets[:, 0]]
+    b = points[facets[:, 1]]
+    c = points[facets[:, 2]]
+    cross = numpy.cross(b - a, c - a)
+    area = numpy.linalg.norm(cross, axis=1) / 2
+    repeated = (facets[:, 0] == facets[:, 1]) | (facets[:, 1] == facets[:, 2]) | (facets[:, 2] == facets[:, 0])
+    degenerate = repeated | (area < min_area)
+    # half-edges of the facets that have three different vertices
+    used = facets[~repeated]
+    start = used.ravel()
+    end = used[:, [1, 2, 0]].ravel()
+    low = numpy.minimum(start, end)
+    high = numpy.maximum(start, end)
+    edges, inverse, counts = numpy.unique(low * len(points) + high, return_inverse=True, return_counts=True)
+    # per undirected edge: how many of its half-edges go from low to high
+    forward = numpy.bincount(inverse.ravel(), weights=(start < end), minlength=len(edges))
+    pairs = counts == 2
+    open_edges = int(numpy.count_nonzero(counts == 1))
+    return {
+        'facets'             : len(facets),
+        'open_edges'         : open_edges,
+        'non_manifold_edges' : int(numpy.count_nonzero(counts > 2)),
+        'flipped_edges'      : int(numpy.count_nonzero(pairs & (forward != 1))),
+        'degenerate_facets'  : int(numpy.count_nonzero(degenerate)),
+        'volume'             : float(numpy.einsum('ij,ij->', a, cross) / 6),
+        'overlapping_shells' : 0 if open_edges else len(overlaps(points, facets)),
+    }
+
+
+def shells(facets):
+    """Shell (F) of every facet: facets that share an edge are in the same shell, numbered from 0.
+    The boxes of a compound are separate shells, overlapping or not."""
+    if not len(facets):
+        return numpy.zeros(0, dtype=numpy.int64)
+    start = facets.ravel()
+    end = facets[:, [1, 2, 0]].ravel()
+    key = numpy.minimum(start, end) * (int(facets.max()) + 1) + numpy.maximum(start, end)
+    owner = numpy.repeat(numpy.arange(len(facets)), 3)
+    order = numpy.argsort(key, kind='stable')
+    same = key[order[1:]] == key[order[:-1]]
+    a, b = owner[order[1:]][same], owner[order[:-1]][same]
+    labels = numpy.arange(len(facets))
+    while True:
+        low = numpy.minimum(labels[a], labels[b])
+        before = labels.copy()
+        numpy.minimum.at(labels, a, low)
+        numpy.minimum.at(labels, b, low)
+        labels = labels[labels]
+        if (labels == before).all():
+            break
+    return numpy.unique(labels, return_inverse=True)[1].ravel()
+
+
+def overlaps(points, facets, shell=None):
+    """[(shell, shell, volume they share)] of the closed shells of a mesh that overlap."""
+    import slicer
+    shell = shells(facets) if shell is None else shell
+    if not len(facets) or shell.max() == 0:
+        return []
+    count = int(shell.max()) + 1
+    corners = points[facets].reshape(-1, 3)
+    owner = numpy.repeat(shell, 3)
+    low = numpy.full((count, 3), numpy.inf)
+    high = numpy.full((count, 3), -numpy.inf)
+    numpy.minimum.at(low, owner, corners)
+    numpy.maximum.at(high, owner, corners)
+    # pairs of shells whose bounding boxes share volume
+    common = (numpy.minimum(high[:, None], high[None, :]) - numpy.maximum(low[:, None], low[None, :]) > 0).all(axis=2)
+    result = []
+    for i, j in zip(*numpy.nonzero(numpy.triu(common, 1))):
+        both = facets[(shell == i) | (shell == j)]
+        a, b, c = points[both[:, 0]], points[both[:, 1]], points[both[:, 2]]
+        volumes = numpy.einsum('ij,ij->', a, numpy.cross(b - a, c - a)) / 6
+        union, _ = slicer.union_measures(points, both, (shell[(shell == i) | (shell == j)] == j).astype(numpy.int64))
+        if volumes - union > min_overlap:
+            result.append((int(i), int(j), float(volumes - union)))
+    return result
+
+
+def problems(report):
+    """The problems in a check() report as a list of strings, empty when the mesh is fine."""
+    result = []
+    for key, text in [('open_edges', 'open edges'), ('non_manifold_edges', 'non-manifold edges'),
+                      ('flipped_edges', 'flipped edges'), ('degenerate_facets', 'degenerate facets'),
+                      ('overlapping_shells', 'pairs of overlapping shells')]:
+        if report[key]:
+            result.append('%d %s' % (report[key], text))
+    if report['volume'] < 0 and not report['open_edges']:
+        result.append('inside out (volume %.1f mm3)' % report['volume'])
+    return result
+
+
+def check_mesh(mesh):
+    """check() of a FreeCAD mesh."""
+    return check(*arrays(mesh))
+
+
+def warn(name, mesh):
+    """Check a FreeCAD mesh and print its problems. Returns the problems."""
+    found = problems(check_mesh(mesh))
+    if found:
+        print(name + ': ' + ', '.join(found), file=sys.stderr)
+    return found
+
+
+if __name__ == "__main__":
+    import Mesh
+    for path in [arg for arg in sys.argv[1:] if os.path.isfile(arg) and arg.lower().endswith(('.3mf', '.stl', '.obj', '.ply'))]:
+        if not warn(path, Mesh.Mesh(path)):
+            print(path + ': ok')
@@ -0,0 +1,62 @@
+"""
+meshing.py -- Paul Cobbaut
+2026-10-19
+Create a hexagon wall display for small figurines.
+3D-printed hexagon, covered by a bought plexiglass panel.
+This file ==> tessellate refined shapes in worker processes
+Every job is meshed and exported in its own process, results are
+returned (and printed) in the order they finish, not the order given.
+Every mesh is checked (meshcheck.py) right after tessellation.
+The workers return the 3mf files as bytes (exporters.py), the caller's
+sink (sinks.py) writes them while the next ones are meshed.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# same settings as the meshFromShape calls in the generator scripts
+linear_deflection  = 1
+angular_deflection = 0.1
+
+
+def mesh_job(name, brep, filename, mirrors=(), linear=linear_deflection, angular=angular_deflection):
+    """Tessellate one shape (as a BREP string) into a print and a preview 3mf file.
+    mirrors is a list of (filename, base, normal) tuples; the mesh is reflected
+    for each of them instead of tessellating a mirrored shape again.
+    Returns (name, [(filename, 3mf bytes)], number of facets, mesh problems)."""
+    import Part
+    import MeshPart
+    from FreeCAD import Vector
+    import mirror
+    import meshcheck
+    import exporters
+    shape = Part.Shape()
+    shape.importBrepFromString(brep)
+    mesh = MeshPart.meshFromShape(Shape=shape, LinearDeflection=linear, AngularDeflection=angular, Relative=False)
+    problems = meshcheck.problems(meshcheck.check_mesh(mesh))
+    files = exporters.mesh_files(filename, mesh)
+    for mirror_filename, base, normal in mirrors:
+        files += exporters.mesh_files(mirror_filename, mirror.mirror_mesh(mesh, Vector(*base), Vector(*normal)))
+    return name, files, mesh.CountFacets, problems
+
+
+def _results(jobs, processes):
+    args = [(name, shape.exportBrepToString(), filename, list(mirrors)) for name, shape, filename, mirrors in jobs]
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        for arg in args:
+            yield mesh_job(*arg)
+        return
+    processes = processes or max(1, min(len(args), os.cpu_count() or 1))
+    with ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context('fork')) as pool:
+        futures = [pool.submit(mesh_job, *arg) for arg in args]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def export_parallel(jobs, sink, processes=None):
+    """Mesh (name, shape, filename, mirrors) jobs concurrently and put their files in sink.
+    Shapes go to the workers as BREP strings. Yields (name, locations, number of facets, mesh problems)
+    as the jobs finish. Without fork (the FreeCAD binary cannot be spawned as a python worker) the jobs run here."""
+    for name, files, facets, problems in _results(jobs, processes):
+        yield name, [sink.put(filename, data) for filename, data in files], facets, problems
@@ -0,0 +1,52 @@
+"""
+mirror.py -- Paul Cobbaut
+2026-10-19
+Create a hexagon wall display for small figurines.
+3D-printed hexagon, covered by a bought plexiglass panel.
+This file ==> mirrored variants of parts that are already built
+A mirror image is derived from a refined shape or from a mesh
+by a reflection, the part is not rebuilt and not refined again.
+"""
+
+import FreeCAD
+from FreeCAD import Vector
+
+
+def mirror_matrix(base, normal):
+    """Reflection in the plane through base, perpendicular to normal."""
+    n = Vector(normal)
+    n.normalize()
+    d = 2 * base.dot(n)
+    return FreeCAD.Matrix(1 - 2*n.x*n.x,   - 2*n.x*n.y,   - 2*n.x*n.z, d*n.x,
+                            - 2*n.y*n.x, 1 - 2*n.y*n.y,   - 2*n.y*n.z, d*n.y,
+                            - 2*n.z*n.x,   - 2*n.z*n.y, 1 - 2*n.z*n.z, d*n.z,
+                                      0,             0,             0,     1)
+
+
+def mirror_shape(shape, base, normal):
+    """Mirrored copy of a (refined) shape, OCC keeps the faces outward."""
+    return shape.mirror(base, normal)
+
+
+def mirror_mesh(mesh, base, normal):
+    """Mirrored copy of a mesh.
+    A reflection turns every facet inside out, so the normals are flipped back."""
+    mirrored = mesh.copy()
+    mirrored.transform(mirror_matrix(base, normal))
+    mirrored.flipNormals()
+    return mirrored
+
+
+def mirror_variants(doc, variants, base, normal):
+    """Add a mirrored Part::Feature to doc for every (name, object) in variants.
+    Returns a dict name_mirror -> feature."""
+    mirrored = {}
+    for name, obj in variants:
+        label = name + '_mirror'
+        feature = doc.addObject("Part::Feature", label)
+        feature.Label = label
+        feature.Shape = mirror_shape(obj.Shape, base, normal)
+        if FreeCAD.GuiUp:
+            feature.ViewObject.hide()
+        mirrored[label] = feature
+    return mirrored
@@ -0,0 +1,140 @@
+"""
+orient.py -- Paul Cobbaut
+2026-10-19
+Create a hexagon wall display for small figurines.
+3D-printed hexagon, covered by a bought plexiglass panel.
+This file ==> the print orientation of a part: which side goes down on the bed
+The hinged side (hinge tubes on a 42 mm wall) and the sideq holders overhang
+in one orientation and not in another. Candidates are the directions of a
+fibonacci sphere plus the six axes: the direction of the part that would
+point down. For all facets and all candidates at once (numpy, in blocks of
+candidates) a candidate is scored on:
+- overhang : area of facets facing down steeper than overhang_angle, and of
+             the lowest facets (within bottom_band of the bed) facing down at
+             all without lying on it: nothing holds them but support
+- support  : volume under those facets, their area seen from below times
+             their height above the bed
+- contact  : area of facets lying flat on the bed (a bonus)
+- height   : height of the part on the bed (time, and wobble of tall parts)
+A candidate with less bed contact than min_contact, or than contact_fraction
+of the best candidate, is not taken: tilted, a part stands on an edge or a
+corner and scores on height alone. The lowest score of the others wins. The mesh is rotated to it and put on the bed (z = 0),
+exporters.py writes the print 3mf of every part that way with HEXAGON_ORIENT=1
+(orient_prints).
+Run with: python3 orient.py part.3mf [...]
+"""
+
+import math
+import sys
+import numpy
+
+# number of fibonacci sphere candidates (the six axes are added)
+candidates = 256
+
+# facets facing down steeper than this (degrees from the vertical) need support
+overhang_angle = 45
+
+# on the bed: facing down within contact_angle degrees, within contact_height mm of the bed
+contact_angle = 1
+contact_height = 0.05
+
+# facets facing down this close (mm) to the bed have nothing under them to print on
+bottom_band = 1.0
+
+# a candidate needs this much bed contact (mm2), and contact_fraction of the best candidate's
+min_contact = 25
+contact_fraction = 0.1
+
+# weights of the score: mm3 of support is the unit
+weights = {
+    'overhang' : 1.0,   # per mm2
+    'support'  : 1.0,   # per mm3
+    'contact'  : -0.5,  # per mm2
+    'height'   : 20.0,  # per mm
+}
+
+# candidates scored at a time, keeps the (facets x candidates) arrays small
+block = 64
+
+
+def directions(count=candidates):
+    """(count + 6, 3) unit vectors: the six axes and a fibonacci sphere."""
+    i = numpy.arange(count) + 0.5
+    z = 1 - 2 * i / count
+    r = numpy.sqrt(1 - z * z)
+    phi = i * math.pi * (3 - math.sqrt(5))
+    axes = numpy.array([(0, 0, -1), (0, 0, 1), (1, 0, 0), (-1, 0, 0), (0, 1, 0), (0, -1, 0)], dtype=float)
+    return numpy.concatenate([axes, numpy.stack([r * numpy.cos(phi), r * numpy.sin(phi), z], axis=1)])
+
+
+def score(points, facets, down):
+    """Scores of a mesh for every candidate down direction (K, 3).
+    Returns a dict of (K) arrays: 'overhang', 'support', 'contact', 'height' and the weighted 'score',
+    inf for the candidates with too little bed contact."""
+    a, b, c = points[facets[:, 0]], points[facets[:, 1]], points[facets[:, 2]]
+    cross = numpy.cross(b - a, c - a)
+    area = numpy.linalg.norm(cross, axis=1) / 2
+    normal = cross / numpy.maximum(2 * area, 1e-12)[:, None]
+    center = (a + b + c) / 3
+    limit = math.sin(math.radians(overhang_angle))
+    flat = math.cos(math.radians(contact_angle))
+    result = {key: numpy.zeros(len(down)) for key in ('overhang', 'support', 'contact', 'height')}
+    for start in range(0, len(down), block):
+        d = down[start:start + block]
+        # heights above the bed, the bed being the lowest point in that direction
+        bed = (points @ d.T).max(axis=0)
+        result['height'][start:start + block] = bed - (points @ d.T).min(axis=0)
+        above = bed - center @ d.T                   # (F, k)
+        facing = normal @ d.T                        # (F, k), 1 is straight down
+        contact = (facing > flat) & (above < contact_height)
+        lowest = (facing > 1e-3) & (above < bottom_band)
+        overhang = ((facing > limit) | lowest) & ~contact
+        result['overhang'][start:start + block] = area @ overhang
+        result['support'][start:start + block] = (area[:, None] * facing * above * overhang).sum(axis=0)
+        result['contact'][start:start + block] = area @ contact
+    result['score'] = sum(weights[key] * result[key] for key in weights)
+    best_contact = result['contact'].max()
+    needed = min(max(min_contact, contact_fraction * best_contact), best_contact)
+    result['score'][result['contact'] < needed] = numpy.inf
+    return result
+
+
+def rotation(down):
+    """Rotation matrix (3, 3) that turns direction down to (0, 0, -1)."""
+    d = numpy.asarray(down, dtype=float)
+    d = d / numpy.linalg.norm(d)
+    target = numpy.array([0.0, 0.0, -1.0])
+    v = numpy.cross(d, target)
+    c = float(d @ target)
+    if c < -1 + 1e-9:
+        return numpy.diag([1.0, -1.0, -1.0])
+    k = numpy.array([[0, -v[2], v[1]], [v[2], 0, -v[0]], [-v[1], v[0], 0]])
+    return numpy.eye(3) + k + k @ k / (1 + c)
+
+
+def best(points, facets, down=None):
+    """(down direction, its scores as a dict of floats) of the best orientation of a mesh."""
+    down = directions() if down is None else down
+    scores = score(points, facets, down)
+    i = int(numpy.argmin(scores['score']))
+    return down[i], {key: float(value[i]) for key, value in scores.items()}
+
+
+def orient(points, facets):
+    """Points of a mesh rotated to its best orientation and put on the bed, with the scores.
+    A rotation keeps the facets as they are."""
+    down, scores = best(points, facets)
+    rotated = points @ rotation(down).T
+    rotated[:, 2] -= rotated[:, 2].min()
+    return rotated, scores
+
+
+if __name__ == "__main__":
+    import estimate
+    args = [arg for arg in sys.argv[1:] if not arg.endswith('.py')]
+    for path in args:
+        with open(path, 'rb') as f:
+            points, facets = estimate.read_3mf(f.read())
+        down, scores = best(points, facets)
+        print('%-40s down (%5.2f %5.2f %5.2f)  overhang %7.0f mm2  support %8.0f mm3  contact %7.0f mm2  height %5.1f mm'
+              % (path, down[0], down[1], down[2], scores['overhang'], scores['support'], scores['contact'], scores['height']))
@@ -0,0 +1,162 @@
+"""
+parametric.py -- Paul Cobbaut
+2026-10-19
+Create a hexagon wall display for small figurines.
+3D-printed hexagon, covered by a bought plexiglass panel.
+This file ==> documents with a spreadsheet of the dimensions, features bound to it
+The generator scripts are built with Param numbers instead of plain ones:
+a Param is a float that remembers its expression ('Dimensions.side_length / 2'),
+arithmetic on it gives a Param again. bind() sets a property to the value and,
+for a Param, also the expression, so that FreeCAD recomputes it from the sheet.
+Editing a cell of the Dimensions sheet recomputes only what depends on it.
+Bound: boxes and their placements (sides and shelves, the hinge features too),
+pad and pocket lengths (corners). Sketch geometry and the hinge knuckles are
+computed by the scripts and stay fixed: the sheet marks those dimensions as
+build time only (the ones templates.patchable does not list), editing them
+needs a new build.
+Run with: freecadcmd parametric.py sides_and_shelves [file.FCStd]
+"""
+
+import ast
+import importlib
+import inspect
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__))) # local helper modules
+
+# name of the spreadsheet object, expressions refer to it
+sheet_name = 'Dimensions'
+
+# dimensions that are counts, used in range(); they stay plain numbers
+integers = ['hinge_knuckles']
+
+
+def _expression(value):
+    return value.expression if isinstance(value, Param) else repr(value)
+
+
+class Param(float):
+    """A number that remembers the expression it came from."""
+
+    def __new__(cls, value, expression):
+        obj = float.__new__(cls, value)
+        obj.expression = expression
+        return obj
+
+    def _apply(self, other, operator, result, reflected=False):
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+        left, right = (other, self) if reflected else (self, other)
+        return Param(result, '(%s %s %s)' % (_expression(left), operator, _expression(right)))
+
+    def __add__(self, other):
+        return self._apply(other, '+', float(self) + other)
+
+    def __radd__(self, other):
+        return self._apply(other, '+', other + float(self), True)
+
+    def __sub__(self, other):
+        return self._apply(other, '-', float(self) - other)
+
+    def __rsub__(self, other):
+        return self._apply(other, '-', other - float(self), True)
+
+    def __mul__(self, other):
+        return self._apply(other, '*', float(self) * other)
+
+    def __rmul__(self, other):
+        return self._apply(other, '*', other * float(self), True)
+
+    def __truediv__(self, other):
+        return self._apply(other, '/', float(self) / other)
+
+    def __rtruediv__(self, other):
+        return self._apply(other, '/', other / float(self), True)
+
+    def __neg__(self):
+        return Param(-float(self), '-' + self.expression)
+
+    def __pos__(self):
+        return self
+
+
+def bind(obj, prop, value):
+    """obj.prop = value, bound to the expression of value when it is a Param.
+    For a path such as 'Placement.Base.x' only the expression is set."""
+    if '.' not in prop:
+        setattr(obj, prop, value)
+    if isinstance(value, Param):
+        obj.setExpression(prop, value.expression)
+
+
+def dimensions(module, params=None):
+    """{name: value} of the dimensions of a generator script, params overriding them."""
+    names = getattr(module, 'dimensions', None)
+    if names is None:
+        names = [p.name for p in inspect.signature(module.build).parameters.values()
+                 if p.default is not inspect.Parameter.empty and p.name not in ('fuse', 'only')]
+    values = {name: getattr(module, name) for name in names}
+    values.update(params or {})
+    return values
+
+
+def defaults(script):
+    """{name: value} of the plain numbers a generator script assigns at module level,
+    read from its source: the script (and FreeCAD) is not imported."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), script + '.py')
+    with open(path) as f:
+        tree = ast.parse(f.read(), path)
+    values = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            try:
+                value = ast.literal_eval(node.value)
+            except ValueError:
+                continue
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                values[node.targets[0].id] = value
+    return values
+
+
+def make_sheet(doc, values, fixed=()):
+    """Spreadsheet with a row per dimension: name, value (aliased as the name),
+    and 'build time only' for the dimensions in fixed, nothing is bound to them."""
+    sheet = doc.addObject('Spreadsheet::Sheet', sheet_name)
+    for row, (name, value) in enumerate(sorted(values.items()), start=1):
+        sheet.set('A%d' % row, name)
+        sheet.set('B%d' % row, repr(value))
+        sheet.setAlias('B%d' % row, name)
+        if name in fixed:
+            sheet.set('C%d' % row, 'build time only')
+    return sheet
+
+
+def symbols(values):
+    """The values as Params that refer to their cell in the sheet."""
+    return {name: value if name in integers else Param(value, '%s.%s' % (sheet_name, name)) for name, value in values.items()}
+
+
+def document(script, path=None, **params):
+    """Build a generator script in a new document with a Dimensions sheet, bound to it.
+    Saves it as path (FCStd) when given. Returns (document, {part: object})."""
+    import FreeCAD
+    module = importlib.import_module(script)
+    doc = FreeCAD.newDocument(script)
+    values = dimensions(module, params)
+    import templates
+    bound = templates.patchable.get(script)
+    make_sheet(doc, values, [name for name in values if bound is not None and name not in bound])
+    doc.recompute()
+    objects = module.build(doc, **symbols(values))
+    doc.recompute()
+    if path:
+        doc.saveAs(path)
+    return doc, objects
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.endswith('.py')]
+    script = args[0]
+    path = args[1] if len(args) > 1 else os.path.abspath(script + '.FCStd')
+    document(script, path)
+    print(path)
@@ -0,0 +1,150 @@
+"""
+parts.py -- Paul Cobbaut
+2026-10-19
+Create a hexagon wall display for small figurines.
+3D-printed hexagon, covered by a bought plexiglass panel.
+This file ==> every part that can be generated, and the script that builds it
+Every generator script has a build(doc, **params) that creates its parts
+in doc and returns them as a dict part name -> object to export.
+A script that makes more than one part also takes only, the names of the
+parts to create, so that one part is built without the others.
+"""
+
+import importlib
+import os
+
+# part name --> generator script
+generators = {
+    'short_shelve'         : 'sides_and_shelves',
+    'long_shelve'          : 'sides_and_shelves',
+    'side'                 : 'sides_and_shelves',
+    'side_hinge'           : 'sides_and_shelves',
+    'leaf'                 : 'sides_and_shelves',
+    'sideq'                : 'sides_and_shelves',
+    'sideq2'               : 'sides_and_shelves',
+    'sideq3'               : 'sides_and_shelves',
+    'Glue_two_way'         : 'glue_two_way_corner',
+    'Top_two_way'          : 'top_two_way_corner',
+    'Glue_three_way'       : 'glue_three_way_corner',
+    'Top_three_way'        : 'top_three_way_corner',
+    'Glue_mid_shelve'      : 'glue_mid_shelve_corner',
+    'Top_mid_shelve'       : 'top_mid_shelve_corner',
+    'Hexagon Glass sketch' : 'glass',
+}
+
+# mirrored part --> part it is reflected from
+mirrors = {
+    'sideq_mirror'  : 'sideq',
+    'sideq2_mirror' : 'sideq2',
+    'sideq3_mirror' : 'sideq3',
+}
+
+# exported as svg and dxf instead of 3mf
+sketches = ['Hexagon Glass sketch']
+
+# local modules every part is built and exported with, besides its generator script,
+# the ones imported by others first (watch.py reloads them in this order)
+shared = ['kernel', 'intersect', 'parametric', 'hinge', 'mirror', 'fitcheck', 'meshcheck', 'decimate', 'orient',
+          'exporters', 'meshing', 'sinks', 'templates', 'parts']
+
+
+def names():
+    return list(generators) + list(mirrors)
+
+
+def generator(name):
+    """The generator script (module) of a part."""
+    return importlib.import_module(generators[mirrors.get(name, name)])
+
+
+def params_for(name, overrides, per_part=None):
+    """params of part name: the overrides its script has a dimension for, then the ones given for this part only."""
+    import parametric
+    names = parametric.dimensions(generator(name))
+    params = {key: value for key, value in overrides.items() if key in names}
+    params.update((per_part or {}).get(name) or {})
+    return params
+
+
+def build(doc, name, params):
+    """Build part name (only that part) with params in doc and recompute. Returns the object to export."""
+    script = generators[mirrors.get(name, name)]
+    if list(generators.values()).count(script) > 1:
+        objects = generator(name).build(doc, only=[mirrors.get(name, name)], **params)
+    else:
+        objects = generator(name).build(doc, **params)
+    doc.recompute()
+    return pick(doc, name, objects, params)
+
+
+def pick(doc, name, objects, params):
+    """The object to export of part name, from all objects its script built in doc. Mirrored parts are made here."""
+    if name in mirrors:
+        module = generator(name)
+        import mirror
+        base, normal = module.mirror_plane(**params)
+        return mirror.mirror_variants(doc, [(mirrors[name], objects[mirrors[name]])], base, normal)[name]
+    return objects[name]
+
+
+def tessellate(name, shape):
+    """Mesh of a part's shape, checked by meshcheck."""
+    import MeshPart
+    import meshing
+    import meshcheck
+    mesh = MeshPart.meshFromShape(Shape=shape, LinearDeflection=meshing.linear_deflection, AngularDeflection=meshing.angular_deflection, Relative=False)
+    meshcheck.warn(name, mesh)
+    return mesh
+
+
+def export_shape(name, shape, target, mesh=None):
+    """Write the artifacts of a part's shape (or its mesh, when given) to target,
+    a directory or a sink (sinks.py): a sketch as svg and dxf, a solid as print
+    and preview 3mf. Returns their locations."""
+    import exporters
+    import sinks
+    sink = sinks.as_sink(target)
+    if name in sketches:
+        return [sink.put(name + '.svg', exporters.svg(shape)), sink.put(name + '.dxf', exporters.dxf(shape))]
+    return [sink.put(filename, data) for filename, data in exporters.mesh_files(name + '.3mf', mesh or tessellate(name, shape))]
+
+
+def export(name, obj, target):
+    """Write the artifacts of a built part to target, a directory or a sink. Returns their locations."""
+    import Part
+    return export_shape(name, Part.getShape(obj, ""), target)
+
+
+def shape(name, params=None, template=False):
+    """Build part name with params in a document of its own and return its shape; the document is closed.
+    Raises fitcheck.FitError, before building, when the params make mating parts interfere or rattle.
+    With template, the document is opened from the template of its script and patched when the params allow it."""
+    import FreeCAD
+    import Part
+    if name not in generators and name not in mirrors:
+        raise KeyError('unknown part: ' + name)
+    if name not in sketches:
+        import fitcheck
+        fitcheck.check(params)
+    params = params or {}
+    opened = None
+    if template:
+        import templates
+        opened = templates.open_template(generators[mirrors.get(name, name)], params)
+    if opened:
+        doc, objects = opened
+    else:
+        doc = FreeCAD.newDocument('part')
+    try:
+        if opened:
+            obj = pick(doc, name, objects, params)
+        else:
+            obj = build(doc, name, params)
+        return Part.getShape(obj, "")
+    finally:
+        FreeCAD.closeDocument(doc.Name)
+
+
+def make(name, params=None, target='.', template=False):
+    """Build part name with params and export it to target, a directory or a sink. Returns the artifact locations."""
+    return export_shape(name, shape(name, params, template), target)
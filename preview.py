@@ -0,0 +1,236 @@
+"""
+preview.py -- Paul Cobbaut
+2026-10-19
+Create a hexagon wall display for small figurines.
+3D-printed hexagon, covered by a bought plexiglass panel.
+This file ==> quick 2D previews as svg or png, without the FreeCAD GUI
+- a part: its edges from the geometry kernel, projected on one or more views
+  (corners and glass from the top, sides and shelves from the front and the side)
+- a wall layout (layout.py): glass, sides and corners of every cell, colored by
+  part; all cells at once with numpy, no FreeCAD needed
+A drawing is a list of layers: (segments (M, 2, 2), color, width) in mm,
+y up. png files are drawn with numpy and written with zlib, no imaging library.
+Run with: python3 preview.py layout "0,0 1,0:long 0,1:short" wall.svg
+          freecadcmd preview.py part Glue_three_way corner.png
+"""
+
+import math
+import os
+import struct
+import sys
+import zlib
+import numpy
+sys.path.append(os.path.dirname(os.path.abspath(__file__))) # local helper modules
+
+# colors per part kind
+colors = {
+    'glass'      : '#9ecae1',
+    'side'       : '#636363',
+    'side_hinge' : '#e6550d',
+    'sideq2'     : '#31a354',
+    'shelve'     : '#756bb1',
+    'two_way'    : '#3182bd',
+    'three_way'  : '#08519c',
+    'mid_shelve' : '#a50f15',
+    'edge'       : '#000000',
+}
+
+# views of a part: name --> the two axes (x=0, y=1, z=2) that are drawn
+view_axes = {'top': (0, 1), 'front': (0, 2), 'side': (1, 2)}
+
+# space between views (mm) and around a drawing (fraction of its size)
+view_gap = 10
+margin = 0.02
+
+# edges are discretized to this deflection (mm)
+deflection = 0.05
+
+
+def default_views(name):
+    if name.startswith(('Glue_', 'Top_')) or name in ('Hexagon Glass sketch',):
+        return ['top']
+    return ['front', 'side']
+
+
+def shape_segments(shape, axes):
+    """All edges of a shape as 2D segments (M, 2, 2), projected on axes."""
+    chunks = []
+    for edge in shape.Edges:
+        points = numpy.array([tuple(p) for p in edge.discretize(Deflection=deflection)])
+        if len(points) > 1:
+            chunks.append(numpy.stack([points[:-1][:, axes], points[1:][:, axes]], axis=1))
+    return numpy.concatenate(chunks) if chunks else numpy.zeros((0, 2, 2))
+
+
+def part_drawing(shape, views):
+    """Layers of a part, its views next to each other from left to right."""
+    layers = []
+    x = 0
+    for view in views:
+        segments = shape_segments(shape, list(view_axes[view]))
+        if not len(segments):
+            continue
+        low = segments.reshape(-1, 2).min(axis=0)
+        high = segments.reshape(-1, 2).max(axis=0)
+        segments = segments - low + (x, 0)
+        layers.append((segments, colors['edge'], 0.2))
+        x += high[0] - low[0] + view_gap
+    return layers
+
+
+def corner_offsets(radius):
+    """(7, 2) offsets of the corners of a hexagon, corner k at 60*k degrees, corner 0 again at the end."""
+    angles = numpy.radians(60 * numpy.arange(7))
+    return radius * numpy.stack([numpy.cos(angles), numpy.sin(angles)], axis=1)
+
+
+def hexagon_segments(centers, radius):
+    """Segments (N * 6, 2, 2) of the hexagons around centers, side k of a cell at N * 6 + k."""
+    corners = centers[:, None, :] + corner_offsets(radius)[None, :, :]
+    return numpy.stack([corners[:, :-1], corners[:, 1:]], axis=2).reshape(-1, 2, 2)
+
+
+def per_side(cells, sides):
+    """Mask over the N * 6 sides: the sides numbered in sides of the cells in mask cells."""
+    return numpy.repeat(cells, 6) & numpy.tile(numpy.isin(numpy.arange(6), sides), len(cells))
+
+
+def layout_drawing(wall):
+    """Layers of a wall layout: glass, sides by kind, corners by kind, shelves."""
+    radius = wall.radius
+    q = numpy.array([c.q for c in wall.cells], dtype=float)
+    r = numpy.array([c.r for c in wall.cells], dtype=float)
+    shelve = numpy.array([c.shelve or '' for c in wall.cells])
+    centers = numpy.stack([radius * 1.5 * q, radius * math.sqrt(3) * (r + q / 2)], axis=1)
+    layers = [(hexagon_segments(centers, radius * 0.85), colors['glass'], 2)]
+    # sides: every side once, the kind with the highest priority wins (hinge > sideq2 > side)
+    segments = hexagon_segments(centers, radius)
+    everywhere = numpy.ones(len(centers), dtype=bool)
+    priority = numpy.zeros(len(segments), dtype=int)
+    priority[per_side(shelve == 'short', [0, 2])] = 1
+    priority[per_side(everywhere, [1])] = 2
+    # the same side of two cells: ends rounded, the lower end first
+    ends = numpy.round(segments, 2).reshape(-1, 4) + 0.0
+    swap = (ends[:, 0] > ends[:, 2]) | ((ends[:, 0] == ends[:, 2]) & (ends[:, 1] > ends[:, 3]))
+    ends[swap] = ends[swap][:, [2, 3, 0, 1]]
+    unique, inverse = numpy.unique(ends, axis=0, return_inverse=True)
+    kind = numpy.zeros(len(unique), dtype=int)
+    numpy.maximum.at(kind, inverse.ravel(), priority)
+    unique = unique.reshape(-1, 2, 2)
+    for value, name in [(0, 'side'), (1, 'sideq2'), (2, 'side_hinge')]:
+        layers.append((unique[kind == value], colors[name], 6))
+    # corners: number of cells at a corner, 1 --> two-way, more --> three-way
+    corners = (centers[:, None, :] + corner_offsets(radius)[None, :6, :]).reshape(-1, 2)
+    points, inverse, counts = numpy.unique(numpy.round(corners, 2) + 0.0, axis=0, return_inverse=True, return_counts=True)
+    mid = numpy.zeros(len(points), dtype=bool)
+    mid[inverse.ravel()[per_side(shelve == 'long', [0, 3])]] = True
+    size = radius * 0.08
+    for name, selected in [('two_way', (counts == 1) & ~mid), ('three_way', (counts > 1) & ~mid), ('mid_shelve', mid)]:
+        layers.append((cross_segments(points[selected], size), colors[name], 8))
+    # shelves: long from corner 3 to corner 0, short between the middles of side 2 and side 0
+    long_cells = centers[shelve == 'long']
+    long_segments = numpy.stack([long_cells - (radius, 0), long_cells + (radius, 0)], axis=1)
+    short_cells = centers[shelve == 'short']
+    half = radius * math.sqrt(3) / 4
+    short_segments = numpy.stack([short_cells + (-radius * 0.75, half), short_cells + (radius * 0.75, half)], axis=1)
+    layers.append((numpy.concatenate([long_segments, short_segments]), colors['shelve'], 5))
+    return layers
+
+
+def cross_segments(points, size):
+    """A small square around every point, as segments."""
+    offsets = numpy.array([(-1, -1), (1, -1), (1, 1), (-1, 1), (-1, -1)]) * size
+    corners = points[:, None, :] + offsets[None, :, :]
+    return numpy.stack([corners[:, :-1], corners[:, 1:]], axis=2).reshape(-1, 2, 2)
+
+
+def bounds(layers):
+    everything = numpy.concatenate([segments.reshape(-1, 2) for segments, _, _ in layers if len(segments)])
+    low, high = everything.min(axis=0), everything.max(axis=0)
+    border = (high - low).max() * margin + 1
+    return low - border, high + border
+
+
+def svg(layers):
+    """Text of an svg of the layers, in mm, y up."""
+    low, high = bounds(layers)
+    width, height = high - low
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>',
+             '<svg xmlns="http://www.w3.org/2000/svg" version="1.1" width="%.1fmm" height="%.1fmm" viewBox="%.2f %.2f %.2f %.2f">'
+             % (width, height, low[0], -high[1], width, height)]
+    for segments, color, stroke in layers:
+        if not len(segments):
+            continue
+        flipped = segments * (1, -1)
+        path = ' '.join('M%.2f %.2fL%.2f %.2f' % tuple(s) for s in flipped.reshape(-1, 4).tolist())
+        lines.append('<path fill="none" stroke="%s" stroke-width="%g" stroke-linecap="round" d="%s"/>' % (color, stroke, path))
+    lines += ['</svg>', '']
+    return '\n'.join(lines)
+
+
+def _rgb(color):
+    return tuple(int(color[i:i + 2], 16) for i in (1, 3, 5))
+
+
+def raster(layers, width=1200):
+    """(H, W, 3) uint8 image of the layers, width pixels wide; strokes are in mm of the drawing."""
+    low, high = bounds(layers)
+    scale = (width - 1) / (high[0] - low[0])
+    height = int(math.ceil((high[1] - low[1]) * scale)) + 1
+    image = numpy.full((height, width, 3), 255, dtype=numpy.uint8)
+    for segments, color, stroke in layers:
+        if not len(segments):
+            continue
+        pixels = (segments - low) * scale
+        pixels[..., 1] = height - 1 - pixels[..., 1]
+        lengths = numpy.hypot(*(pixels[:, 1] - pixels[:, 0]).T)
+        counts = numpy.ceil(lengths).astype(int) + 1
+        t = numpy.arange(counts.sum()) - numpy.repeat(numpy.cumsum(counts) - counts, counts)
+        t = t / numpy.repeat(numpy.maximum(counts - 1, 1), counts)
+        start = numpy.repeat(pixels[:, 0], counts, axis=0)
+        end = numpy.repeat(pixels[:, 1], counts, axis=0)
+        points = start + (end - start) * t[:, None]
+        radius = max(0, int(stroke * scale / 2))
+        for dx in range(-radius, radius + 1):
+            for dy in range(-radius, radius + 1):
+                if dx * dx + dy * dy <= radius * radius:
+                    x = numpy.clip(numpy.round(points[:, 0]).astype(int) + dx, 0, width - 1)
+                    y = numpy.clip(numpy.round(points[:, 1]).astype(int) + dy, 0, height - 1)
+                    image[y, x] = _rgb(color)
+    return image
+
+
+def png(image):
+    """Bytes of a png file of an (H, W, 3) uint8 image."""
+    height, width, _ = image.shape
+    rows = numpy.concatenate([numpy.zeros((height, 1), dtype=numpy.uint8), image.reshape(height, -1)], axis=1)
+
+    def chunk(kind, data):
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data) & 0xffffffff)
+
+    return (b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0))
+            + chunk(b'IDAT', zlib.compress(rows.tobytes(), 6)) + chunk(b'IEND', b''))
+
+
+def render(layers, path, width=1200):
+    """Write the layers to path, svg or png by its extension. Returns the bytes written."""
+    data = png(raster(layers, width)) if path.lower().endswith('.png') else svg(layers).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(data)
+    return data
+
+
+def part(name, params=None, views=None):
+    """Layers of a generated part (needs FreeCAD)."""
+    import parts
+    return part_drawing(parts.shape(name, params), views or default_views(name))
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.endswith('.py')]
+    if args[0] == 'layout':
+        import layout
+        render(layout_drawing(layout.parse(args[1])), args[2])
+    else:
+        render(part(args[1]), args[2])
+    print(args[2])
@@ -0,0 +1,315 @@
+"""
+server.py -- Paul Cobbaut
+2026-10-19
+Create a hexagon wall display for small figurines.
+3D-printed hexagon, covered by a bought plexiglass panel.
+This file ==> local HTTP configurator: pick a wall layout, download its print files
+  freecadcmd server.py              (listens on 127.0.0.1:8642, nothing leaves the box)
+  GET  /parts?layout=0,0+1,0:long               parts list of a layout, as JSON
+  GET  /wall.zip?layout=0,0+1,0:long&insert_width=2.05
+  POST /wall.zip  {"layout": "0,0 1,0:long", "params": {"insert_width": 2.05},
+                   "parts": {"sideq2": {"holder_length": 12}}}
+  GET  /part/sideq2.zip?insert_width=2.05       one part
+  GET  /quote?layout=0,0+1,0:long               filament per part and in total (estimate.py)
+A wall zip has the 3mf (or svg and dxf) files of every part of the layout once,
+parts.csv with how many of each to print, quote.txt with the filament it takes,
+and wall.svg, a preview (preview.py).
+params go to every part whose script has that dimension, "parts" to one part only.
+Parts are looked up in a result cache on disk, by part, params and a hash of its
+script and of every local module a part is built and exported with (parts.shared):
+a changed script or module is a miss.
+Misses are built on a pool of warm FreeCAD processes (forked after warm_up, so
+no process loads FreeCAD again); requests that want the same part at the same
+time wait for one build of it.
+"""
+
+import csv
+import io
+import json
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import traceback
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, unquote, urlsplit
+sys.path.append(os.path.dirname(os.path.abspath(__file__))) # local helper modules
+
+address         = os.environ.get('HEXAGON_SERVER_ADDRESS', '127.0.0.1')
+port            = int(os.environ.get('HEXAGON_SERVER_PORT', '8642'))
+cache_directory = os.environ.get('HEXAGON_CACHE', '/tmp/hexagon-cache')
+processes       = int(os.environ.get('HEXAGON_SERVER_PROCESSES', '0')) or max(1, (os.cpu_count() or 2) - 1)
+
+# parts are built from their templates (templates.py) when the params allow it
+use_templates = True
+
+
+def build_part(name, params, template):
+    """Build one part in a pool process. Returns {filename: bytes}."""
+    import parts
+    import sinks
+    sink = sinks.MemorySink()
+    parts.make(name, params, sink, template)
+    return sink.files
+
+
+def ready():
+    return os.getpid()
+
+
+class Cache:
+    """Built parts on disk, one directory per part and params, and the builds in flight.
+    A directory counts once its files.json is there, it is written last."""
+
+    def __init__(self, pool, directory=cache_directory, template=use_templates):
+        self.pool = pool
+        self.directory = directory
+        self.template = template
+        self.lock = threading.Lock()
+        self.building = {}
+        self.hits = self.misses = self.coalesced = 0
+
+    def path(self, name, params):
+        import batch
+        import parts
+        import templates
+        script = parts.generators[parts.mirrors.get(name, name)]
+        source = templates.source_hash(script, [module + '.py' for module in parts.shared])
+        return os.path.join(self.directory, source[:10], batch.job_key(name, params))
+
+    def load(self, path):
+        try:
+            with open(os.path.join(path, 'files.json')) as f:
+                names = json.load(f)
+            files = {}
+            for filename in names:
+                with open(os.path.join(path, filename), 'rb') as f:
+                    files[filename] = f.read()
+            return files
+        except (OSError, ValueError):
+            return None
+
+    def store(self, path, files):
+        # built in a directory of its own and renamed, a reader never sees half a part
+        parent = os.path.dirname(path)
+        os.makedirs(parent, exist_ok=True)
+        temporary = tempfile.mkdtemp(dir=parent)
+        for filename, data in files.items():
+            with open(os.path.join(temporary, filename), 'wb') as f:
+                f.write(data)
+        with open(os.path.join(temporary, 'files.json'), 'w') as f:
+            json.dump(sorted(files), f)
+        try:
+            os.rename(temporary, path)
+        except OSError:
+            shutil.rmtree(temporary, ignore_errors=True) # stored by another server meanwhile
+
+    def get(self, name, params):
+        """Future-like object with result() -> {filename: bytes} of part name with params."""
+        path = self.path(name, params)
+        with self.lock:
+            if path in self.building:
+                self.coalesced += 1
+                return self.building[path]
+            files = self.load(path)
+            if files is not None:
+                self.hits += 1
+                return Done(files)
+            self.misses += 1
+            future = self.pool.submit(build_part, name, params, self.template)
+            self.building[path] = future
+        future.add_done_callback(lambda f: self._finished(path, f))
+        return future
+
+    def _finished(self, path, future):
+        try:
+            if future.exception() is None:
+                self.store(path, future.result())
+        finally:
+            with self.lock:
+                del self.building[path]
+
+    def stats(self):
+        with self.lock:
+            return {'hits': self.hits, 'misses': self.misses, 'coalesced': self.coalesced, 'building': len(self.building)}
+
+
+class Done:
+    """A finished result, for cache hits."""
+
+    def __init__(self, files):
+        self.files = files
+
+    def result(self, timeout=None):
+        return self.files
+
+
+class RequestError(Exception):
+    """Bad request: answered with status 400 and the message."""
+
+
+def read_request(query, body):
+    """(layout, overrides, per part params) of a request, from the query string and a JSON body."""
+    import layout
+    import worker
+    request = json.loads(body) if body else {}
+    query = dict(query)
+    spec = request.get('layout') or query.get('layout') or '0,0'
+    query.pop('layout', None)
+    overrides = worker.parse_params('%s=%s' % item for item in query.items())
+    overrides.update(request.get('params') or {})
+    try:
+        wall = layout.parse(spec) if not isinstance(spec, list) else layout.parse(json.dumps(spec))
+    except ValueError as e:
+        raise RequestError('bad layout: %s' % e)
+    return wall, overrides, request.get('parts') or {}
+
+
+def check_params(names, overrides, per_part):
+    """Raise RequestError for params no part has, or that make parts not fit (fitcheck.py)."""
+    import fitcheck
+    import parametric
+    import parts
+    known = set()
+    for name in names:
+        known.update(parametric.dimensions(parts.generator(name)))
+    unknown = sorted(set(overrides) - known) + sorted(key for params in per_part.values() for key in params if key not in known)
+    if unknown:
+        raise RequestError('unknown dimensions: ' + ', '.join(unknown))
+    if set(per_part) - set(names):
+        raise RequestError('not in this layout: ' + ', '.join(sorted(set(per_part) - set(names))))
+    try:
+        fitcheck.check(dict(overrides))
+    except fitcheck.FitError as e:
+        raise RequestError(str(e))
+
+
+def collect(cache, counts, overrides, per_part):
+    """{part: {filename: bytes}} of the parts in counts (a Counter), all builds submitted before waiting for any."""
+    import parts
+    futures = [(name, cache.get(name, parts.params_for(name, overrides, per_part))) for name in sorted(counts)]
+    return {name: future.result() for name, future in futures}
+
+
+def quote(counts, built):
+    """estimate.wall() of the parts in counts, from their print 3mf files."""
+    import estimate
+    files = {name: files[name + '.3mf'] for name, files in built.items() if name + '.3mf' in files}
+    return estimate.wall(counts, files)
+
+
+def build_zip(counts, built, extra=()):
+    """Zip of the built files of the parts in counts, parts.csv, quote.txt and the extra (name, data) files."""
+    import estimate
+    import sinks
+    bundle = sinks.ZipSink(None)
+    rows = io.StringIO()
+    table = csv.writer(rows, lineterminator='\n')
+    table.writerow(['part', 'count', 'files'])
+    for name in sorted(counts):
+        for filename, data in built[name].items():
+            bundle.put(filename, data)
+        table.writerow([name, counts[name], ' '.join(sorted(built[name]))])
+    bundle.put('parts.csv', rows.getvalue())
+    bundle.put('quote.txt', estimate.table(quote(counts, built)) + '\n')
+    for filename, data in extra:
+        bundle.put(filename, data)
+    return bundle.archive()
+
+
+class Handler(BaseHTTPRequestHandler):
+    server_version = 'hexagon-configurator'
+
+    def do_GET(self):
+        self.answer(b'')
+
+    def do_POST(self):
+        self.answer(self.rfile.read(int(self.headers.get('Content-Length') or 0)))
+
+    def answer(self, body):
+        start = time.perf_counter()
+        url = urlsplit(self.path)
+        query = parse_qsl(url.query)
+        try:
+            if url.path == '/parts':
+                wall, _, _ = read_request(query, body)
+                self.send(200, 'application/json', json.dumps(dict(sorted(wall.parts().items())), indent=1).encode())
+            elif url.path == '/wall.zip':
+                self.send(200, 'application/zip', self.wall(query, body), 'wall.zip')
+            elif url.path.startswith('/part/') and url.path.endswith('.zip'):
+                self.send(200, 'application/zip', self.part(url.path[len('/part/'):-len('.zip')], query, body), url.path[len('/part/'):])
+            elif url.path == '/quote':
+                self.send(200, 'application/json', json.dumps(self.quote(query, body), indent=1).encode())
+            elif url.path == '/stats':
+                self.send(200, 'application/json', json.dumps(self.server.cache.stats()).encode())
+            else:
+                self.send(404, 'text/plain', (__doc__ or '').encode())
+        except (RequestError, ValueError, KeyError) as e:
+            self.send(400, 'text/plain', ('%s: %s\n' % (type(e).__name__, e)).encode())
+        except Exception:
+            self.send(500, 'text/plain', traceback.format_exc().encode())
+        self.log_message('%s %.2f s', url.path, time.perf_counter() - start)
+
+    def wall(self, query, body):
+        import preview
+        wall, overrides, per_part = read_request(query, body)
+        counts = wall.parts()
+        check_params(counts, overrides, per_part)
+        built = collect(self.server.cache, counts, overrides, per_part)
+        extra = [('layout.txt', wall.spec() + '\n'), ('wall.svg', preview.svg(preview.layout_drawing(wall)))]
+        return build_zip(counts, built, extra)
+
+    def quote(self, query, body):
+        wall, overrides, per_part = read_request(query, body)
+        counts = wall.parts()
+        check_params(counts, overrides, per_part)
+        return quote(counts, collect(self.server.cache, counts, overrides, per_part))
+
+    def part(self, name, query, body):
+        import parts
+        name = unquote(name)
+        if name not in parts.names():
+            raise KeyError('unknown part: ' + name)
+        _, overrides, per_part = read_request(query, body)
+        check_params([name], overrides, per_part)
+        counts = Counter({name: 1})
+        return build_zip(counts, collect(self.server.cache, counts, overrides, per_part))
+
+    def send(self, status, content_type, data, filename=None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        if filename:
+            self.send_header('Content-Disposition', 'attachment; filename="%s"' % filename)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def serve(host=address, port=port, workers=processes):
+    """Warm up, fork the pool and serve until interrupted."""
+    import worker
+    worker.warm_up()
+    # every process is forked here, before the server starts its threads
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork'))
+    for future in [pool.submit(ready) for _ in range(workers)]:
+        future.result()
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    server.cache = Cache(pool)
+    print('hexagon configurator on http://%s:%d/ (%d workers, cache in %s)' % (host, port, workers, cache_directory))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        pool.shutdown(cancel_futures=True)
+
+
+if __name__ == "__main__":
+    serve()
@@ -0,0 +1,196 @@
+"""
+sinks.py -- Paul Cobbaut
+2026-10-19
+Create a hexagon wall display for small figurines.
+3D-printed hexagon, covered by a bought plexiglass panel.
+This file ==> where exported files go: a directory, a zip, a tar stream or memory
+Every sink has put(name, data) and close(); put returns location(name), where the file goes.
+- DirectorySink : files in a directory, replaced atomically, only when they changed
+- ZipSink       : one zip bundle, entries sorted and with a fixed date, written at close
+                  (path None: kept in memory, archive() returns its bytes)
+- TarSink       : a tar stream, to stdout by default (freecadcmd x.py | ssh host tar x)
+- MemorySink    : name -> bytes in a dict, for the worker API
+open_sink() picks one from a spec: '-' is a tar to stdout, *.zip a zip, else a directory.
+With background=True (the default) files are written by a thread of their own,
+while the caller goes on meshing the next part.
+"""
+
+import abc
+import io
+import os
+import queue
+import sys
+import tarfile
+import threading
+import zipfile
+
+# where the generator scripts export to, unless told otherwise
+default_output = os.environ.get('HEXAGON_OUTPUT', os.path.join(os.path.expanduser('~'), 'FreeCAD models', 'smurf'))
+
+
+class Sink(abc.ABC):
+    """Base class; sinks are context managers that close on exit."""
+
+    @abc.abstractmethod
+    def put(self, name, data):
+        """Store data (bytes or str) as name, returns location(name)."""
+
+    def location(self, name):
+        return name
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _bytes(data):
+    return data.encode('utf-8') if isinstance(data, str) else data
+
+
+class DirectorySink(Sink):
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def location(self, name):
+        return os.path.join(self.directory, name)
+
+    def put(self, name, data):
+        import exporters
+        path = self.location(name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        exporters.write_if_changed(path, _bytes(data))
+        return path
+
+
+class ZipSink(Sink):
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+
+    def location(self, name):
+        return self.path + ':' + name if self.path else name
+
+    def put(self, name, data):
+        self.entries[name] = _bytes(data)
+        return self.location(name)
+
+    def archive(self):
+        """Bytes of the zip of everything put so far."""
+        import exporters
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w') as archive:
+            for name in sorted(self.entries):
+                info = zipfile.ZipInfo(name, date_time=exporters.zip_date)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                info.create_system = 0
+                info.external_attr = 0o644 << 16
+                archive.writestr(info, self.entries[name])
+        return buffer.getvalue()
+
+    def close(self):
+        import exporters
+        if self.path is None:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        exporters.write_if_changed(self.path, self.archive())
+
+
+class TarSink(Sink):
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout.buffer
+        self.archive = tarfile.open(fileobj=self.stream, mode='w|')
+
+    def put(self, name, data):
+        data = _bytes(data)
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mode = 0o644
+        info.mtime = 0
+        self.archive.addfile(info, io.BytesIO(data))
+        return self.location(name)
+
+    def location(self, name):
+        return 'tar:' + name
+
+    def close(self):
+        self.archive.close()
+        self.stream.flush()
+
+
+class MemorySink(Sink):
+
+    def __init__(self):
+        self.files = {}
+
+    def put(self, name, data):
+        self.files[name] = _bytes(data)
+        return name
+
+
+class BackgroundSink(Sink):
+    """Hands every put to a writer thread, close waits for it. An error of the
+    writer is raised again by the next put or by close."""
+
+    def __init__(self, sink):
+        self.sink = sink
+        self.queue = queue.Queue(maxsize=16)
+        self.error = None
+        self.thread = threading.Thread(target=self._write, daemon=True)
+        self.thread.start()
+
+    def _write(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            if self.error is None:
+                try:
+                    self.sink.put(*item)
+                except BaseException as e:
+                    self.error = e
+
+    def _raise(self):
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+
+    def location(self, name):
+        return self.sink.location(name)
+
+    def put(self, name, data):
+        self._raise()
+        self.queue.put((name, data))
+        return self.location(name)
+
+    def close(self):
+        self.queue.put(None)
+        self.thread.join()
+        self.sink.close()
+        self._raise()
+
+
+def as_sink(target):
+    """target when it is a sink already, else a DirectorySink of it.
+    A sink is anything with put(): watch.py reloads this module, its sinks stay sinks."""
+    return target if hasattr(target, 'put') else DirectorySink(target)
+
+
+def open_sink(spec=None, background=True):
+    """Sink for a spec: '-' a tar to stdout, a path ending in .zip a zip bundle, else a directory."""
+    spec = spec or default_output
+    if spec == '-':
+        sink = TarSink()
+    elif spec.lower().endswith('.zip'):
+        sink = ZipSink(spec)
+    else:
+        sink = DirectorySink(spec)
+    return BackgroundSink(sink) if background else sink
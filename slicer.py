@@ -0,0 +1,281 @@
+"""
+slicer.py -- Paul Cobbaut
+2026-10-19
+Create a hexagon wall display for small figurines.
+3D-printed hexagon, covered by a bought plexiglass panel.
+This file ==> slice a mesh in layers: area, perimeter, thin walls and print time
+cover_width and hole_width are 2 mm, the hinge walls are under 2 mm: close to
+what a 0.4 mm nozzle can print. The print mesh is cut in the middle of every
+layer, all facets and layers at once with numpy:
+- a facet is cut by the layers between its lowest and highest point, in each
+  one by a segment, oriented so that the part is on its left (area >= 0)
+- the boxes of a compound export are separate shells that overlap: area and
+  perimeter of a layer are those of the union of its loops, in vertical strips
+  between all end points and crossings, where the winding number of the
+  segments is above zero (the layer turned by skew, no segment is vertical)
+- wall thickness: from the middle of every segment on the outside of that
+  union straight into the part, the distance to the first segment of the
+  same shell on the other side (per layer, all pairs); a segment where two
+  shells overlap is no wall
+A wall thinner than min_widths extrusion widths is flagged with its height.
+Print time: per layer the perimeters, the infill (solid in the bottom and top
+solid_layers) at their speeds, and layer_seconds for travel and layer change.
+Parts are sliced in parallel processes, no FreeCAD is needed.
+Run with: python3 slicer.py part.3mf [...]
+"""
+
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+import numpy
+sys.path.append(os.path.dirname(os.path.abspath(__file__))) # local helper modules
+import estimate
+import meshcheck
+
+# slicer settings, with line_width, walls and infill from estimate.settings
+settings = {
+    'layer_height'    : 0.2,   # mm
+    'min_widths'      : 2,     # thinner walls (in line widths) are flagged
+    'perimeter_speed' : 40,    # mm/s
+    'infill_speed'    : 60,    # mm/s
+    'solid_layers'    : 4,     # bottom and top layers printed solid
+    'layer_seconds'   : 2,     # travel, retraction and layer change, per layer
+}
+
+# rays that start closer than this (mm) do not count as the other side
+eps = 1e-6
+
+# a layer is turned this much (radians) before it is cut in strips, so that no segment is vertical
+skew = 1.0
+
+
+def cut(points, facets, height):
+    """Segments (S, 2, 2) where the layers cut the mesh, the layer (S) and the facet (S) of every segment.
+    Layer k is cut at z = lowest point + (k + 0.5) * height."""
+    z0 = points[:, 2].min()
+    layers = int(math.floor((points[:, 2].max() - z0) / height - 0.5)) + 1
+    return cut_levels(points, facets, z0 + (numpy.arange(max(layers, 0)) + 0.5) * height)
+
+
+def cut_levels(points, facets, levels, below=True):
+    """Segments (S, 2, 2) where the planes z = levels (ascending) cut the mesh, the level (S)
+    and the facet (S) of every segment. A plane through vertices cuts the mesh as it is
+    just below them, or just above them when not below."""
+    a, b, c = points[facets[:, 0]], points[facets[:, 1]], points[facets[:, 2]]
+    z = numpy.stack([a[:, 2], b[:, 2], c[:, 2]], axis=1)
+    side = 'right' if below else 'left'
+    first = numpy.searchsorted(levels, z.min(axis=1), side)
+    counts = numpy.maximum(numpy.searchsorted(levels, z.max(axis=1), side) - first, 0)
+    # one row per (facet, level) pair
+    facet = numpy.repeat(numpy.arange(len(facets)), counts)
+    layer = numpy.repeat(first, counts) + numpy.arange(counts.sum()) - numpy.repeat(numpy.cumsum(counts) - counts, counts)
+    level = numpy.asarray(levels, dtype=float)[layer]
+    corners = numpy.stack([a, b, c], axis=1)[facet]            # (P, 3, 3)
+    above = corners[:, :, 2] >= level[:, None] if below else corners[:, :, 2] > level[:, None]
+    start, end = corners, corners[:, [1, 2, 0]]
+    crossing = above != above[:, [1, 2, 0]]                     # edge i runs from corner i to i + 1
+    dz = end[:, :, 2] - start[:, :, 2]
+    t = (level[:, None] - start[:, :, 2]) / numpy.where(crossing, dz, 1)
+    hits = start[:, :, :2] + t[:, :, None] * (end[:, :, :2] - start[:, :, :2])
+    # a facet that spans a layer crosses it with two of its edges
+    keep = crossing.sum(axis=1) == 2
+    segments = hits[keep][crossing[keep]].reshape(-1, 2, 2)
+    facet, layer = facet[keep], layer[keep]
+    # the part on the left: the outward normal of the facet points to the right of the segment
+    normal = numpy.cross(b - a, c - a)[facet][:, :2]
+    direction = segments[:, 1] - segments[:, 0]
+    flip = direction[:, 1] * normal[:, 0] - direction[:, 0] * normal[:, 1] < 0
+    segments[flip] = segments[flip][:, ::-1]
+    return segments, layer, facet
+
+
+def union(segments, shell):
+    """Area of the union of the loops of one layer and, for every segment, the length
+    of it on the outside of the union (their sum is the perimeter). shell (S) is the
+    shell of every segment."""
+    c, s = math.cos(skew), math.sin(skew)
+    p = segments @ numpy.array([[c, s], [-s, c]])
+    x0, y0, x1, y1 = p[:, 0, 0], p[:, 0, 1], p[:, 1, 0], p[:, 1, 1]
+    dx, dy = x1 - x0, y1 - y0
+    # strips between all end points and the crossings of segments of different shells
+    denominator = dx[:, None] * dy[None, :] - dy[:, None] * dx[None, :]
+    safe = numpy.where(numpy.abs(denominator) > eps, denominator, numpy.inf)
+    ox, oy = x0[None, :] - x0[:, None], y0[None, :] - y0[:, None]
+    t = (ox * dy[None, :] - oy * dx[None, :]) / safe
+    u = (ox * dy[:, None] - oy * dx[:, None]) / safe
+    crossing = (t > 0) & (t < 1) & (u > 0) & (u < 1) & (shell[:, None] != shell[None, :])
+    xs = numpy.unique(numpy.concatenate([x0, x1, (x0[:, None] + t * dx[:, None])[crossing]]))
+    left, right = xs[:-1, None], xs[1:, None]
+    middle = (left + right) / 2
+    active = (numpy.minimum(x0, x1) < middle) & (numpy.maximum(x0, x1) > middle)
+    slope = dy / numpy.where(numpy.abs(dx) > eps, dx, 1)
+    at = lambda x: y0 + (x - x0) * slope                          # (K, S)
+    # going up through a segment that runs to +x enters the part (it is on the left)
+    sign = numpy.where(active, numpy.where(dx > 0, 1, -1), 0)
+    # coincident segments of two shells (rounded to 1e-6 mm): the one entering first, the wall between is inside
+    order = numpy.lexsort((-sign, numpy.where(active, numpy.round(at(middle), 6), numpy.inf)), axis=1)
+    sign = numpy.take_along_axis(sign, order, axis=1)
+    inside = numpy.cumsum(sign, axis=1) > 0                       # above every sorted segment
+    outside = (inside != (numpy.cumsum(sign, axis=1) - sign > 0)) & (sign != 0)
+    width = right - left
+    lengths = width * numpy.sqrt(1 + slope[order] ** 2)
+    yl, yr = numpy.take_along_axis(at(left), order, axis=1), numpy.take_along_axis(at(right), order, axis=1)
+    gap = inside[:, :-1] & (sign[:, 1:] != 0)
+    area = (gap * ((yl[:, 1:] - yl[:, :-1]) + (yr[:, 1:] - yr[:, :-1])) / 2 * width).sum()
+    return float(area), numpy.bincount(order[outside], weights=lengths[outside], minlength=len(segments))
+
+
+def thickness(segments, shell=None):
+    """Wall thickness at the middle of every segment of one layer: the distance
+    straight into the part to the nearest other segment (of the same shell when
+    shell (S) is given), inf when there is none."""
+    middle = segments.mean(axis=1)
+    edge = segments[:, 1] - segments[:, 0]
+    length = numpy.hypot(edge[:, 0], edge[:, 1])
+    inward = numpy.stack([-edge[:, 1], edge[:, 0]], axis=1) / numpy.maximum(length, eps)[:, None]
+    # ray i (middle i + t inward i) against segment j (start j + s edge j)
+    offset = segments[None, :, 0, :] - middle[:, None, :]
+    denominator = inward[:, None, 0] * edge[None, :, 1] - inward[:, None, 1] * edge[None, :, 0]
+    safe = numpy.where(numpy.abs(denominator) > eps, denominator, numpy.inf)
+    t = (offset[:, :, 0] * edge[None, :, 1] - offset[:, :, 1] * edge[None, :, 0]) / safe
+    s = (offset[:, :, 0] * inward[:, None, 1] - offset[:, :, 1] * inward[:, None, 0]) / safe
+    valid = (t > eps) & (s >= 0) & (s <= 1)
+    if shell is not None:
+        valid &= shell[:, None] == shell[None, :]
+    numpy.fill_diagonal(valid, False)
+    return numpy.where(valid, t, numpy.inf).min(axis=1)
+
+
+def slice_mesh(points, facets, **more):
+    """Slice a mesh given as arrays. Returns a dict with per layer 'z', 'area', 'perimeter',
+    'thickness' (thinnest wall of the layer), the 'thin' spots [(z, thickness, x, y)] below
+    min_widths line widths, the thinnest wall and the estimated print 'seconds'."""
+    s = dict(estimate.settings, **settings)
+    s.update(more)
+    height = s['layer_height']
+    segments, layer, facet = cut(points, facets, height)
+    shell = meshcheck.shells(facets)[facet]
+    layers = int(layer.max()) + 1 if len(layer) else 0
+    area = numpy.zeros(layers)
+    perimeter = numpy.zeros(layers)
+    limit = s['min_widths'] * s['line_width']
+    thinnest = numpy.full(layers, numpy.inf)
+    thin = []
+    order = numpy.argsort(layer, kind='stable')
+    bounds = numpy.searchsorted(layer[order], numpy.arange(layers + 1))
+    for k in range(layers):
+        rows = order[bounds[k]:bounds[k + 1]]
+        if not len(rows):
+            continue
+        part = segments[rows]
+        area[k], outside = union(part, shell[rows])
+        perimeter[k] = outside.sum()
+        walls = numpy.where(outside > 0, thickness(part, shell[rows]), numpy.inf)
+        i = int(numpy.argmin(walls))
+        thinnest[k] = walls[i]
+        if walls[i] < limit:
+            x, y = part[i].mean(axis=0)
+            thin.append((float(points[:, 2].min() + (k + 0.5) * height), float(walls[i]), float(x), float(y)))
+    # print time
+    shell = numpy.minimum(area, perimeter * s['walls'] * s['line_width'])
+    density = numpy.full(layers, s['infill'])
+    density[:s['solid_layers']] = 1
+    density[max(0, layers - s['solid_layers']):] = 1
+    infill_path = (area - shell) * density / s['line_width']
+    seconds = (perimeter * s['walls'] / s['perimeter_speed'] + infill_path / s['infill_speed']).sum() + layers * s['layer_seconds']
+    return {
+        'layers'    : layers,
+        'z'         : points[:, 2].min() + (numpy.arange(layers) + 0.5) * height,
+        'area'      : area,
+        'perimeter' : perimeter,
+        'thickness' : thinnest,
+        'thin'      : thin,
+        'thinnest'  : float(thinnest.min()) if layers else math.inf,
+        'seconds'   : float(seconds),
+    }
+
+
+def sections(points, facets, shell, levels, below=True):
+    """(level, union area, outside length per segment, facet per segment) of every level that cuts the mesh."""
+    segments, layer, facet = cut_levels(points, facets, levels, below)
+    order = numpy.argsort(layer, kind='stable')
+    bounds = numpy.searchsorted(layer[order], numpy.arange(len(levels) + 1))
+    for k in range(len(levels)):
+        rows = order[bounds[k]:bounds[k + 1]]
+        if len(rows):
+            area, outside = union(segments[rows], shell[facet[rows]])
+            yield k, area, outside, facet[rows], segments[rows]
+
+
+def union_measures(points, facets, shell):
+    """Volume and area of the union of the closed shells (F) of a mesh, that may overlap.
+    Between two heights of vertices the area of a section is quadratic in z and the
+    outside length of every segment linear: two sections per gap (Gauss) integrate
+    them exactly. The flat faces of the union at the height of a vertex are where the
+    sections just below and just above it differ: twice the area of their union minus both."""
+    heights = numpy.unique(points[facets.ravel(), 2])
+    gap = numpy.diff(heights)
+    gauss = (1 - 1 / math.sqrt(3)) / 2
+    levels = numpy.stack([heights[:-1] + gauss * gap, heights[1:] - gauss * gap], axis=1).ravel()
+    a, b, c = points[facets[:, 0]], points[facets[:, 1]], points[facets[:, 2]]
+    normal = numpy.cross(b - a, c - a)
+    # facet area per length of its section and height
+    slant = numpy.linalg.norm(normal, axis=1) / numpy.maximum(numpy.hypot(normal[:, 0], normal[:, 1]), eps)
+    volume = area = 0.0
+    for k, section, outside, facet, _ in sections(points, facets, shell, levels):
+        volume += gap[k // 2] / 2 * section
+        area += gap[k // 2] / 2 * (outside * slant[facet]).sum()
+    below = {k: (section, segments, shell[facet]) for k, section, _, facet, segments in sections(points, facets, shell, heights)}
+    above = {k: (section, segments, shell[facet]) for k, section, _, facet, segments in sections(points, facets, shell, heights, False)}
+    shells = int(shell.max()) + 1
+    for k in set(below) | set(above):
+        if k not in below or k not in above:
+            area += (below.get(k) or above.get(k))[0]
+            continue
+        both = union(numpy.concatenate([below[k][1], above[k][1]]), numpy.concatenate([below[k][2], above[k][2] + shells]))[0]
+        area += 2 * both - below[k][0] - above[k][0]
+    return float(volume), float(area)
+
+
+def slice_3mf(path, **more):
+    """slice_mesh() of a 3mf file, with its path."""
+    with open(path, 'rb') as f:
+        points, facets = estimate.read_3mf(f.read())
+    result = slice_mesh(points, facets, **more)
+    result['path'] = path
+    return result
+
+
+def _slice(args):
+    path, more = args
+    return slice_3mf(path, **more)
+
+
+def slice_files(paths, processes=None, **more):
+    """slice_3mf() of many files, in parallel processes. Results in the order of paths."""
+    processes = processes or max(1, min(len(paths), os.cpu_count() or 1))
+    if processes == 1:
+        return [slice_3mf(path, **more) for path in paths]
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        return list(pool.map(_slice, [(path, more) for path in paths]))
+
+
+def report(result):
+    """A line of text for a part, and one for its thin walls if it has any."""
+    minutes = round(result['seconds'] / 60)
+    lines = ['%-40s %4d layers %3d:%02d h  thinnest wall %5.2f mm' % (result['path'], result['layers'],
+             minutes // 60, minutes % 60, result['thinnest'])]
+    if result['thin']:
+        z, wall, x, y = min(result['thin'], key=lambda spot: spot[1])
+        lines.append('    thin walls in %d layers, z %.1f to %.1f; %.2f mm at z %.1f (x %.1f, y %.1f)'
+                     % (len(result['thin']), result['thin'][0][0], result['thin'][-1][0], wall, z, x, y))
+    return '\n'.join(lines)
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.endswith('.py')]
+    import exporters
+    paths = [path for path in args if not path.endswith(exporters.preview_suffix)]
+    for result in slice_files(paths):
+        print(report(result))
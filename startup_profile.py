@@ -0,0 +1,84 @@
+"""
+startup_profile.py -- Paul Cobbaut
+2026-10-19
+Create a hexagon wall display for small figurines.
+3D-printed hexagon, covered by a bought plexiglass panel.
+This file ==> report what a run pays before and while building
+1. per import cost of FreeCAD and the workbench modules
+2. per generator script: import, build (with recompute) and mesh time
+Modules are imported in the order below, so a module that pulls in
+another one that is not loaded yet also pays for that one.
+Run with: freecadcmd startup_profile.py
+"""
+
+import importlib
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__))) # local helper modules
+
+# what the generator scripts (may) import, cheapest dependencies first
+# the svg, dxf and 3mf files come from exporters.py, importSVG and importDXF are no longer loaded
+modules = ['FreeCAD', 'Part', 'Sketcher', 'PartDesign', 'Mesh', 'MeshPart', 'ProfileLib.RegularPolygon', 'exporters']
+
+
+def profile_imports(names=modules):
+    """Returns a list of (module, seconds, modules loaded with it); seconds is None when it was loaded already."""
+    results = []
+    for name in names:
+        if name in sys.modules:
+            results.append((name, None, 0))
+            continue
+        before = len(sys.modules)
+        start = time.perf_counter()
+        importlib.import_module(name)
+        results.append((name, time.perf_counter() - start, len(sys.modules) - before))
+    return results
+
+
+def profile_generator(script):
+    """Returns (import seconds, build seconds, mesh seconds) of a generator script."""
+    import FreeCAD
+    import Part
+    import MeshPart
+    import meshing
+    start = time.perf_counter()
+    module = importlib.import_module(script)
+    imported = time.perf_counter() - start
+    doc = FreeCAD.newDocument('profile')
+    try:
+        start = time.perf_counter()
+        objects = module.build(doc)
+        doc.recompute()
+        built = time.perf_counter() - start
+        start = time.perf_counter()
+        for obj in objects.values():
+            if obj.isDerivedFrom('Sketcher::SketchObject'):
+                continue
+            MeshPart.meshFromShape(Shape=Part.getShape(obj, ""), LinearDeflection=meshing.linear_deflection, AngularDeflection=meshing.angular_deflection, Relative=False)
+        meshed = time.perf_counter() - start
+    finally:
+        FreeCAD.closeDocument(doc.Name)
+    return imported, built, meshed
+
+
+def report():
+    print("%-28s %10s %8s" % ('import', 'ms', 'modules'))
+    total = 0
+    for name, seconds, count in profile_imports():
+        if seconds is None:
+            print("%-28s %10s %8s" % (name, 'loaded', '-'))
+        else:
+            total += seconds
+            print("%-28s %10.1f %8d" % (name, seconds * 1000, count))
+    print("%-28s %10.1f" % ('total', total * 1000))
+    import parts
+    print()
+    print("%-28s %10s %10s %10s" % ('generator', 'import ms', 'build ms', 'mesh ms'))
+    for script in sorted(set(parts.generators.values())):
+        imported, built, meshed = profile_generator(script)
+        print("%-28s %10.1f %10.1f %10.1f" % (script, imported * 1000, built * 1000, meshed * 1000))
+
+
+if __name__ == "__main__":
+    report()
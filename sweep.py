@@ -0,0 +1,238 @@
+"""
+sweep.py -- Paul Cobbaut
+2026-10-19
+Create a hexagon wall display for small figurines.
+3D-printed hexagon, covered by a bought plexiglass panel.
+This file ==> tolerance sweep for the fit-critical dimensions
+Instead of printing whole parts to dial in a printer or filament, print
+one plate with small test coupons of the fits:
+- insert  : end of a side with its insert, goes into a pocket
+- pocket  : end of a corner arm with the pocket for the insert
+- cross   : end of a shelve with its cross part, goes into a slot
+- slot    : end of a mid shelve corner arm with the slot for the cross part
+- knuckle : hinge knuckle with the pin hole
+Every swept value gets a row on the plate, labeled with its value.
+A coupon is only built again when a dimension it depends on changes,
+the others are taken from the cache (e.g. one pocket for all insert widths).
+Coupons and the plate are meshed in parallel.
+cross_width is not swept: it follows common_width (common_width/2), as
+sides_and_shelves derives it.
+Run with: HEXAGON_SWEEP="insert_width=2.00:2.20:0.05" freecadcmd sweep.py
+Several dimensions give a matrix of all combinations.
+"""
+
+import itertools
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__))) # local helper modules
+
+# where the plate, the coupons and the legend are written
+output_directory = os.environ.get('HEXAGON_SWEEP_OUTPUT', '/tmp/hexagon-sweep')
+
+# coupons are short, only the fit matters
+coupon_depth = 5   # height of inserts and depth of pockets
+coupon_floor = 1.9 # below the pocket, as gluepart_depth
+row_gap      = 6   # between rows and coupons on the plate
+label_size   = 4   # height of the label text
+label_depth  = 0.6 # label is raised this much
+font_file    = '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf'
+
+# coupon --> dimensions it depends on
+coupon_dimensions = {
+    'insert'  : ['insert_width', 'insert_length', 'common_width'],
+    'pocket'  : ['hole_width', 'insert_length', 'arm_width'],
+    'cross'   : ['cross_length', 'common_width'],
+    'slot'    : ['arm_width', 'cross_length'],
+    'knuckle' : ['hinge_outer', 'hinge_inner', 'hinge_length'],
+}
+
+# coupon --> coupon it mates with
+mates = {'insert': 'pocket', 'pocket': 'insert', 'cross': 'slot', 'slot': 'cross'}
+
+# (coupon, dimension values) --> shape
+_cache = {}
+
+
+def defaults():
+    """Current values of the fit-critical dimensions, from the generator scripts (the corner from its source)."""
+    import parametric
+    import sides_and_shelves
+    values = {}
+    for name in ['insert_width', 'insert_length', 'common_width', 'cross_length', 'hinge_outer', 'hinge_inner', 'hinge_length']:
+        values[name] = getattr(sides_and_shelves, name)
+    corner = parametric.defaults('glue_three_way_corner')
+    for name in ['hole_width', 'arm_width']:
+        values[name] = corner[name]
+    return values
+
+
+def steps(start, stop, step):
+    """start, start + step, ... up to and including stop, rounded to 0.001 mm."""
+    count = int(round((stop - start) / step))
+    return [round(start + i * step, 3) for i in range(count + 1)]
+
+
+def _insert(d):
+    import Part
+    from FreeCAD import Vector
+    base = Part.makeBox(6, d['common_width'], coupon_depth)
+    tab  = Part.makeBox(d['insert_length'], d['insert_width'], coupon_depth, Vector(6, (d['common_width'] - d['insert_width'])/2, 0))
+    return base.fuse(tab).removeSplitter()
+
+
+def _pocket(d):
+    import Part
+    from FreeCAD import Vector
+    block = Part.makeBox(d['insert_length'] + 3, d['arm_width'], coupon_floor + coupon_depth)
+    hole  = Part.makeBox(d['insert_length'] + 1, d['hole_width'], coupon_depth, Vector(2, (d['arm_width'] - d['hole_width'])/2, coupon_floor))
+    return block.cut(hole)
+
+
+def _cross(d):
+    import Part
+    from FreeCAD import Vector
+    base = Part.makeBox(6, d['common_width'], coupon_depth)
+    tab  = Part.makeBox(d['cross_length'], d['cross_width'], coupon_depth, Vector(6, 0, 0))
+    return base.fuse(tab).removeSplitter()
+
+
+def _slot(d):
+    import Part
+    from FreeCAD import Vector
+    block = Part.makeBox(d['cross_length'] + 3, d['arm_width'], coupon_floor + coupon_depth)
+    slot  = Part.makeBox(d['cross_length'] + 1, d['arm_width']/2, coupon_depth, Vector(2, d['arm_width']/2, coupon_floor))
+    return block.cut(slot)
+
+
+def _knuckle(d):
+    import hinge
+    return hinge.tube(d['hinge_outer'], d['hinge_inner'], d['hinge_length']/2)
+
+
+builders = {'insert': _insert, 'pocket': _pocket, 'cross': _cross, 'slot': _slot, 'knuckle': _knuckle}
+
+
+def coupon(name, values):
+    """Coupon shape for these dimension values, from the cache when nothing it depends on changed."""
+    key = (name, tuple(values[d] for d in coupon_dimensions[name]))
+    if key not in _cache:
+        _cache[key] = builders[name](values)
+    return _cache[key]
+
+
+def coupon_label(name, values):
+    return name + '_' + '_'.join('%g' % values[d] for d in coupon_dimensions[name])
+
+
+def variants(ranges, base=None):
+    """Every combination of the swept values, with cross_width derived from common_width.
+    ranges: dimension --> (start, stop, step)."""
+    base = dict(base or defaults())
+    names = sorted(ranges)
+    for combination in itertools.product(*(steps(*ranges[name]) for name in names)):
+        values = dict(base)
+        values.update(zip(names, combination))
+        values['cross_width'] = values['common_width']/2
+        yield values
+
+
+def swept_coupons(ranges):
+    """Coupons that depend on a swept dimension, plus the coupons they mate with."""
+    swept = [name for name, dims in coupon_dimensions.items() if set(dims) & set(ranges)]
+    return swept + [mates[name] for name in swept if name in mates and mates[name] not in swept]
+
+
+def label(text):
+    """Raised text, or None without a font."""
+    import Part
+    from FreeCAD import Vector
+    if not os.path.exists(font_file):
+        return None
+    faces = []
+    for char in Part.makeWireString(text, font_file, label_size):
+        if char:
+            faces.append(Part.makeFace(char, 'Part::FaceMakerBullseye'))
+    if not faces:
+        return None
+    return Part.makeCompound(faces).extrude(Vector(0, 0, label_depth))
+
+
+def plate(ranges, base=None):
+    """One plate for the sweep: a labeled row per variant.
+    Returns (plate shape, {coupon label: shape}, legend rows)."""
+    import Part
+    from FreeCAD import Vector
+    names = swept_coupons(ranges)
+    swept = sorted(ranges)
+    shapes, unique, legend = [], {}, []
+    y = 0
+    for row, values in enumerate(variants(ranges, base)):
+        text = ' '.join('%g' % values[d] for d in swept)
+        x = 0
+        tag = label(text)
+        if tag is not None:
+            shapes.append(tag.translated(Vector(x, y, 0)))
+            x += tag.BoundBox.XLength + row_gap
+        height = label_size
+        for name in names:
+            solid = coupon(name, values)
+            unique[coupon_label(name, values)] = solid
+            shapes.append(solid.translated(Vector(x - solid.BoundBox.XMin, y - solid.BoundBox.YMin, -solid.BoundBox.ZMin)))
+            x += solid.BoundBox.XLength + row_gap
+            height = max(height, solid.BoundBox.YLength)
+        legend.append([row + 1] + [values[d] for d in swept] + [coupon_label(name, values) for name in names])
+        y += height + row_gap
+    return Part.makeCompound(shapes), unique, legend
+
+
+def run(ranges, directory=output_directory, base=None):
+    """Build the plate and the coupons of a sweep, mesh them in parallel.
+    directory can also be a zip or '-' (see sinks.py). Returns the written locations."""
+    import meshing
+    import sinks
+    stem = 'sweep_' + '_'.join(sorted(ranges))
+    shape, unique, legend = plate(ranges, base)
+    jobs = [(stem, shape, stem + '.3mf', [])]
+    jobs += [(name, solid, name + '.3mf', []) for name, solid in unique.items()]
+    written = []
+    with sinks.open_sink(directory) as sink:
+        for name, paths, facets, problems in meshing.export_parallel(jobs, sink):
+            written += paths
+            if problems:
+                print(name + ': ' + ', '.join(problems), file=sys.stderr)
+        # one column per coupon, as in the legend rows
+        lines = [','.join(['row'] + sorted(ranges) + swept_coupons(ranges))]
+        lines += [','.join(str(v) for v in row) for row in legend]
+        written.append(sink.put(stem + '.csv', '\n'.join(lines) + '\n'))
+    return written
+
+
+def parse_ranges(specs):
+    """'insert_width=2.00:2.20:0.05' --> {'insert_width': (2.0, 2.2, 0.05)}
+    Raises ValueError unless step > 0, stop >= start and the steps end on stop."""
+    ranges = {}
+    for spec in specs:
+        name, values = spec.split('=', 1)
+        start, stop, step = (float(v) for v in values.split(':'))
+        if step <= 0 or stop < start:
+            raise ValueError('%s: need step > 0 and stop >= start' % spec)
+        count = (stop - start) / step
+        if abs(count - round(count)) > 1e-6:
+            raise ValueError('%s: the steps do not end on %g' % (spec, stop))
+        ranges[name.strip()] = (start, stop, step)
+    return ranges
+
+
+if __name__ == "__main__":
+    specs = [arg for arg in sys.argv[1:] if '=' in arg and ':' in arg]
+    specs += [spec for spec in os.environ.get('HEXAGON_SWEEP', '').split() if spec]
+    try:
+        ranges = parse_ranges(specs)
+    except ValueError as e:
+        raise SystemExit(str(e))
+    unknown = set(ranges) - set(defaults())
+    if unknown:
+        raise SystemExit('not a fit-critical dimension: ' + ', '.join(sorted(unknown)))
+    # messages go to stderr, stdout can be a tar stream
+    for path in run(ranges):
+        print(path, file=sys.stderr)
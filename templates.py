@@ -0,0 +1,116 @@
+"""
+templates.py -- Paul Cobbaut
+2026-10-19
+Create a hexagon wall display for small figurines.
+3D-printed hexagon, covered by a bought plexiglass panel.
+This file ==> built documents as templates, patched for a variant instead of built again
+A template is the parametric document (parametric.py) of a generator script,
+built once with the default dimensions and saved as FCStd, plus a json file
+with the object of every part and a hash of the scripts it was built from.
+A variant opens the template, sets its cells in the Dimensions sheet and
+recomputes: no objects are created, no sketches drawn, no faces searched.
+Only dimensions that are bound to the sheet can be patched (see patchable),
+a variant that changes another one is built from scratch.
+The template is built again when one of its scripts changed. Both files are
+written under a temporary name and renamed, the json last: processes that
+build the same template at once never leave half a file to another one.
+"""
+
+import hashlib
+import json
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__))) # local helper modules
+
+template_directory = os.environ.get('HEXAGON_TEMPLATES', '/tmp/hexagon-templates')
+
+# generator script --> dimensions that only end up in bound properties
+# (the hinge knuckles are made in Python; corner sketches are drawn in Python)
+patchable = {
+    'sides_and_shelves'      : ['common_height', 'common_width', 'short_length', 'long_length', 'cross_length', 'cross_cut',
+                                'side_length', 'insert_length', 'insert_gap', 'insert_width', 'ridge_width', 'ridge_height',
+                                'holder_length', 'groove_length', 'leaf_thickness', 'hole_mm'],
+    'glue_two_way_corner'    : ['depth', 'gluepart_depth'],
+    'glue_three_way_corner'  : ['depth', 'gluepart_depth'],
+    'glue_mid_shelve_corner' : ['depth', 'gluepart_depth'],
+    'top_two_way_corner'     : ['depth', 'glass_mm'],
+    'top_three_way_corner'   : ['depth', 'glass_mm'],
+    'top_mid_shelve_corner'  : ['depth', 'gluepart_depth', 'glass_mm'],
+    'glass'                  : [],
+}
+
+# every template also depends on these
+shared_sources = ['parametric.py', 'hinge.py', 'intersect.py', 'kernel.py']
+
+
+def paths(script, directory=template_directory):
+    """(FCStd path, json path) of the template of a generator script."""
+    stem = os.path.join(directory, script)
+    return stem + '.FCStd', stem + '.json'
+
+
+def source_hash(script, shared=shared_sources):
+    """Hash of the generator script and the shared files (by default the ones every template is built with)."""
+    here = os.path.dirname(os.path.abspath(__file__))
+    digest = hashlib.sha1()
+    for name in [script + '.py'] + list(shared):
+        with open(os.path.join(here, name), 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def make_template(script, directory=template_directory):
+    """Build the parametric document of script with the defaults and save it as its template."""
+    import FreeCAD
+    import parametric
+    os.makedirs(directory, exist_ok=True)
+    document_path, meta_path = paths(script, directory)
+    temporary = os.path.join(directory, '%s.%d.tmp' % (script, os.getpid()))
+    doc, objects = parametric.document(script, temporary + '.FCStd')
+    try:
+        meta = {'source': source_hash(script), 'parts': {name: obj.Name for name, obj in objects.items()}}
+    finally:
+        FreeCAD.closeDocument(doc.Name)
+    with open(temporary + '.json', 'w') as f:
+        json.dump(meta, f, indent=1, sort_keys=True)
+    os.replace(temporary + '.FCStd', document_path)
+    os.replace(temporary + '.json', meta_path)
+    return meta
+
+
+def load_meta(script, directory=template_directory):
+    """The json of a template, None when there is none or its scripts changed since."""
+    document_path, meta_path = paths(script, directory)
+    if not (os.path.exists(document_path) and os.path.exists(meta_path)):
+        return None
+    with open(meta_path) as f:
+        meta = json.load(f)
+    return meta if meta.get('source') == source_hash(script) else None
+
+
+def can_patch(script, params):
+    return set(params) <= set(patchable.get(script, []))
+
+
+def open_template(script, params=None, directory=template_directory):
+    """Open the template of script with params set in its sheet, recomputed.
+    Returns (document, {part: object}), or None when params cannot be patched."""
+    import FreeCAD
+    import parametric
+    params = params or {}
+    if not can_patch(script, params):
+        return None
+    meta = load_meta(script, directory) or make_template(script, directory)
+    doc = FreeCAD.openDocument(paths(script, directory)[0])
+    sheet = doc.getObject(parametric.sheet_name)
+    for name, value in params.items():
+        sheet.set(sheet.getCellFromAlias(name), repr(value))
+    doc.recompute()
+    return doc, {name: doc.getObject(obj) for name, obj in meta['parts'].items()}
+
+
+if __name__ == "__main__":
+    import parts
+    for script in sorted(set(parts.generators.values())):
+        make_template(script)
+        print(paths(script)[0])
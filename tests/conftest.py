@@ -0,0 +1,14 @@
+"""
+conftest.py -- Paul Cobbaut
+2026-10-19
+Create a hexagon wall display for small figurines.
+3D-printed hexagon, covered by a bought plexiglass panel.
+This file ==> the tests import the modules of the repository, no FreeCAD needed
+Run with: python3 -m pytest tests
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('HEXAGON_KERNEL', 'numpy')
@@ -0,0 +1,37 @@
+"""Preview meshes by vertex clustering (decimate.py)."""
+
+import numpy
+import pytest
+
+import decimate
+import kernel
+
+
+@pytest.fixture
+def cylinder():
+    k = kernel.NumpyKernel()
+    return k.mesh(k.extrude(k.face([k.arc((0, 0), 10, 0, 360)]), 20))
+
+
+def test_within_target_is_kept(cylinder):
+    points, facets = cylinder
+    kept = decimate.decimate(points, facets, target=len(facets))
+    assert kept[0] is points or numpy.array_equal(kept[0], points)
+    assert numpy.array_equal(kept[1], facets)
+
+
+@pytest.mark.parametrize('target', [40, 100])
+def test_at_most_target(cylinder, target):
+    points, facets = cylinder
+    fewer_points, fewer = decimate.decimate(points, facets, target=target)
+    assert 0 < len(fewer) <= target
+    assert fewer.max() < len(fewer_points)
+    # the points are means of clusters: within the bounding box of the mesh
+    assert (fewer_points.min(axis=0) >= points.min(axis=0) - 1e-9).all()
+    assert (fewer_points.max(axis=0) <= points.max(axis=0) + 1e-9).all()
+
+
+def test_no_repeated_or_duplicate_facets(cylinder):
+    points, facets = decimate.decimate(*cylinder, target=60)
+    assert ((facets[:, 0] != facets[:, 1]) & (facets[:, 1] != facets[:, 2]) & (facets[:, 2] != facets[:, 0])).all()
+    assert len(numpy.unique(numpy.sort(facets, axis=1), axis=0)) == len(facets)
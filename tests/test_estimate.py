@@ -0,0 +1,62 @@
+"""Volume, area and filament of meshes (estimate.py)."""
+
+import math
+
+import pytest
+
+import estimate
+import exporters
+import kernel
+import layout
+
+
+@pytest.fixture
+def k():
+    return kernel.NumpyKernel()
+
+
+def test_measures_box(k):
+    measured = estimate.measures(*k.mesh(k.box(10, 20, 30)))
+    assert measured == {'volume': pytest.approx(6000), 'area': pytest.approx(2200), 'size': pytest.approx([10, 20, 30])}
+
+
+def test_measures_union_with_a_flat_step(k):
+    # a small box half into the top of a large one
+    measured = estimate.measures(*k.mesh(k.compound([k.box(10, 10, 10), k.placed(k.box(4, 4, 4), 3, 3, 8)])))
+    assert measured['volume'] == pytest.approx(1000 + 4 * 4 * 2)
+    assert measured['area'] == pytest.approx(600 + 4 * 4 * 2)
+
+
+def test_measures_sideq_counts_the_overlap_once(k):
+    points, facets = k.mesh(kernel.part('sideq', k=k))
+    assert estimate.measures(points, facets)['volume'] < 42816 - 800
+
+
+def test_filament():
+    used = estimate.filament({'volume': 1000.0, 'area': 100.0}, infill=0.5, walls=2, line_width=0.5)
+    # shell 100 mm3, half of the other 900
+    assert used['filament_mm3'] == pytest.approx(550)
+    assert used['grams'] == pytest.approx(0.55 * estimate.settings['density'])
+    assert used['meters'] == pytest.approx(550 / (math.pi * (estimate.settings['diameter'] / 2) ** 2) / 1000)
+
+
+def test_filament_thin_part_is_all_shell():
+    used = estimate.filament({'volume': 10.0, 'area': 1000.0})
+    assert used['filament_mm3'] == pytest.approx(10)
+
+
+def test_estimate_3mf(k):
+    data = exporters.arrays_3mf(*k.mesh(k.box(10, 10, 10)))
+    row = estimate.estimate(data)
+    assert row['volume'] == pytest.approx(1000)
+    assert row['grams'] > 0
+
+
+def test_wall(k):
+    files = {name: exporters.arrays_3mf(*k.mesh(kernel.part(name, k=k))) for name in ['side', 'long_shelve']}
+    counts = layout.parse('0,0:long').parts()
+    result = estimate.wall(counts, files)
+    assert set(result['parts']) == {'side', 'long_shelve'}
+    assert result['total']['count'] == counts['side'] + counts['long_shelve']
+    assert result['total']['grams'] == pytest.approx(sum(row['grams'] * row['count'] for row in result['parts'].values()))
+    assert 'leaf' in result['missing'] and 'Hexagon Glass sketch' in result['missing']
@@ -0,0 +1,72 @@
+"""Byte-stable 3mf files (exporters.py) and the sinks they go to (sinks.py)."""
+
+import io
+import zipfile
+
+import numpy
+import pytest
+
+import exporters
+import kernel
+import sinks
+
+
+def box():
+    return kernel.NumpyKernel().mesh(kernel.NumpyKernel().box(10, 20, 30))
+
+
+def test_same_mesh_same_bytes():
+    assert exporters.arrays_3mf(*box()) == exporters.arrays_3mf(*box())
+
+
+def test_order_of_points_and_facets_does_not_matter():
+    points, facets = box()
+    shuffle = numpy.random.default_rng(0).permutation(len(points))
+    moved = numpy.empty_like(points)
+    moved[shuffle] = points
+    facets = shuffle[facets]
+    # every facet starts at another corner, the facets in another order
+    facets = numpy.roll(facets, 1, axis=1)[::-1]
+    assert exporters.arrays_3mf(moved, facets) == exporters.arrays_3mf(*box())
+
+
+def test_noise_below_the_decimals_does_not_matter():
+    points, facets = box()
+    assert exporters.arrays_3mf(points + 1e-7, facets) == exporters.arrays_3mf(points, facets)
+
+
+def test_number():
+    assert exporters.number(1.0) == '1'
+    assert exporters.number(-0.00001) == '0'
+    assert exporters.number(2.50) == '2.5'
+    assert exporters.number(0.123456) == '0.1235'
+
+
+def test_zip_is_fixed():
+    data = exporters.arrays_3mf(*box())
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        assert archive.namelist() == ['[Content_Types].xml', '_rels/.rels', '3D/3dmodel.model']
+        assert {info.date_time for info in archive.infolist()} == {exporters.zip_date}
+
+
+def test_array_files():
+    files = exporters.array_files('box.3mf', *box())
+    assert [name for name, data in files] == ['box.3mf', 'box.preview.3mf']
+    assert files == exporters.array_files('box.3mf', *box())
+
+
+def test_write_if_changed(tmp_path):
+    path = str(tmp_path / 'box.3mf')
+    data = exporters.arrays_3mf(*box())
+    assert exporters.write_if_changed(path, data)
+    assert not exporters.write_if_changed(path, data)
+    with open(path, 'rb') as f:
+        assert f.read() == data
+
+
+def test_sink_needs_put():
+    with pytest.raises(TypeError):
+        sinks.Sink()
+    with sinks.MemorySink() as sink:
+        assert sink.put('a.txt', 'a') == 'a.txt'
+    assert sink.files == {'a.txt': b'a'}
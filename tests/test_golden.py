@@ -0,0 +1,39 @@
+"""The prismatic parts against their golden records (golden.py, golden_numpy.json)."""
+
+import copy
+
+import pytest
+
+import golden
+
+
+@pytest.fixture(scope='module')
+def records():
+    return golden.build_numpy()
+
+
+def test_parts_match_the_records(records):
+    assert golden.compare(records, golden.load(golden.golden_files['numpy'])) == {}
+
+
+def test_differences_within_tolerance(records):
+    changed = copy.deepcopy(records['side'])
+    changed['volume'] *= 1 + golden.relative_tolerance / 2
+    changed['bound'][0] += golden.bound_tolerance / 2
+    assert golden.differences(changed, records['side']) == []
+
+
+def test_differences_found(records):
+    changed = copy.deepcopy(records['side'])
+    changed['volume'] *= 1.01
+    changed['bound'][5] += 0.1
+    found = golden.differences(changed, records['side'])
+    assert len(found) == 2
+    assert found[0].startswith('volume') and found[1].startswith('bounding box')
+
+
+def test_new_and_missing_parts(records):
+    golden_records = dict(records)
+    del golden_records['side']
+    golden_records['gone'] = records['sideq']
+    assert golden.compare(records, golden_records) == {'gone': ['missing'], 'side': ['new part']}
@@ -0,0 +1,82 @@
+"""Circle/segment and line intersections of the corner sketches (intersect.py)."""
+
+import math
+
+import numpy
+import pytest
+
+import intersect
+
+
+def test_circle_segment_two_hits_in_order():
+    hits = intersect.circle_segment(5, (-10, 0), (10, 0))
+    assert [(hit.x, hit.y) for hit in hits] == [pytest.approx((-5, 0)), pytest.approx((5, 0))]
+    assert hits[0].t == pytest.approx(0.25) and hits[1].t == pytest.approx(0.75)
+
+
+def test_circle_segment_miss():
+    assert intersect.circle_segment(5, (-10, 6), (10, 6)) == []
+    # the line hits the circle, the segment stops before it
+    assert intersect.circle_segment(5, (-10, 0), (-6, 0)) == []
+
+
+def test_circle_segment_tangent():
+    hits = intersect.circle_segment(5, (-10, 5), (10, 5))
+    assert len(hits) == 1
+    assert (hits[0].x, hits[0].y) == pytest.approx((0, 5))
+
+
+def test_circle_segment_end_point_tolerance():
+    # the segment ends a hair before the circle: still a hit, at its end
+    hits = intersect.circle_segment(5, (0, 0), (5 - 1e-7, 0))
+    assert len(hits) == 1 and hits[0].t == 1
+    assert intersect.circle_segment(5, (0, 0), (5 - 1e-3, 0)) == []
+
+
+def test_circle_segment_degenerate():
+    assert intersect.circle_segment(5, (5, 0), (5, 0)) == []
+
+
+def test_circle_segments_batch():
+    points, t, valid = intersect.circle_segments(5, [(-10, 0), (-10, 6), (0, 0)], [(10, 0), (10, 6), (0, 10)], center=(0, 0))
+    assert valid.tolist() == [[True, True], [False, False], [False, True]]
+    assert points[2, 1] == pytest.approx((0, 5))
+
+
+def test_circle_point():
+    point = intersect.circle_point(5, (0, 0), (10, 10))
+    assert (point.x, point.y) == (round(5 / math.sqrt(2), 2), round(5 / math.sqrt(2), 2))
+    with pytest.raises(intersect.IntersectionError):
+        intersect.circle_point(5, (-10, 6), (10, 6))
+
+
+def test_line_crossing():
+    crossing = intersect.line_crossing((0, 0), (10, 0), (5, -5), (5, 5))
+    assert crossing == pytest.approx(intersect.Crossing(5, 0, 0.5, 0.5))
+    # the lines cross outside both segments
+    crossing = intersect.line_crossing((0, 0), (1, 0), (5, 1), (5, 2))
+    assert crossing.t == pytest.approx(5) and crossing.u == pytest.approx(-1)
+
+
+def test_line_crossing_parallel():
+    assert intersect.line_crossing((0, 0), (10, 0), (0, 1), (10, 1)) is None
+    assert intersect.line_crossing((0, 0), (10, 0), (0, 0), (0, 0)) is None
+    with pytest.raises(intersect.IntersectionError):
+        intersect.crossing_point((0, 0), (10, 0), (0, 1), (10, 1))
+
+
+def test_line_crossings_batch():
+    points, t, u, parallel = intersect.line_crossings([(0, 0), (0, 0)], [(10, 0), (10, 0)], [(5, -5), (0, 1)], [(5, 5), (10, 1)])
+    assert parallel.tolist() == [False, True]
+    assert points[0] == pytest.approx((5, 0))
+    assert numpy.isnan(t[1])
+
+
+def test_on_segment():
+    assert intersect.on_segment((5, 1e-7), (0, 0), (10, 0))
+    assert not intersect.on_segment((11, 0), (0, 0), (10, 0))
+
+
+def test_polar():
+    assert intersect.polar(10, 90) == (0, 10)
+    assert intersect.polar(10, 30) == (8.66, 5)
@@ -0,0 +1,86 @@
+"""Numpy geometry backend (kernel.py): the box parts without FreeCAD."""
+
+import pytest
+
+import estimate
+import kernel
+import meshcheck
+
+
+@pytest.fixture
+def k():
+    return kernel.NumpyKernel()
+
+
+def test_box_measure(k):
+    measured = k.measure(k.box(10, 20, 30))
+    assert measured['volume'] == pytest.approx(6000)
+    assert measured['area'] == pytest.approx(2200)
+    assert measured['size'] == pytest.approx([10, 20, 30])
+
+
+def test_placed_and_mirrored_keep_the_measure(k):
+    box = k.box(10, 20, 30)
+    moved = k.mirrored(k.placed(box, 5, -3, 2, 30), (1, 0, 0), (1, 0, 0))
+    assert k.measure(moved)['volume'] == pytest.approx(6000)
+    assert meshcheck.problems(meshcheck.check(*k.mesh(moved))) == []
+
+
+def test_overlapping_boxes_are_measured_once(k):
+    both = k.compound([k.box(10, 10, 10), k.placed(k.box(10, 10, 10), 5, 0, 0)])
+    measured = k.measure(both)
+    assert measured['volume'] == pytest.approx(1500)
+    assert measured['area'] == pytest.approx(800)
+
+
+@pytest.mark.parametrize('name', kernel.prismatic())
+def test_prismatic_parts(k, name):
+    points, facets = k.mesh(kernel.part(name, k=k))
+    report = meshcheck.check(points, facets)
+    assert report['open_edges'] == report['flipped_edges'] == report['degenerate_facets'] == 0
+    assert report['volume'] > 0
+    measured = k.measure(kernel.part(name, k=k))
+    assert 0 < measured['volume'] <= report['volume'] + 1e-6
+
+
+def test_part_params(k):
+    side = k.measure(kernel.part('side', k=k))
+    longer = k.measure(kernel.part('side', {'side_length': 140}, k=k))
+    # side_main is 6 x 42, the ridge 2 x 3
+    assert longer['volume'] - side['volume'] == pytest.approx(10 * (6 * 42 + 2 * 3))
+
+
+def test_mirror_has_the_same_measure(k):
+    assert k.measure(kernel.part('sideq2_mirror', k=k))['volume'] == pytest.approx(k.measure(kernel.part('sideq2', k=k))['volume'])
+
+
+def test_not_prismatic(k):
+    with pytest.raises(ValueError):
+        kernel.part('leaf', k=k)
+
+
+def test_files_are_3mf(k):
+    files = k.files('side.3mf', kernel.part('side', k=k))
+    assert [name for name, data in files] == ['side.3mf', 'side.preview.3mf']
+    points, facets = estimate.read_3mf(files[0][1])
+    assert meshcheck.check(points, facets)['open_edges'] == 0
+
+
+def test_profile_with_arc(k):
+    face = k.face([k.segment((0, 0), (10, 0)), k.arc((10, 5), 5, -90, 90), k.segment((10, 10), (0, 10))])
+    measured = k.measure(k.extrude(face, 2))
+    # a rectangle and a half circle, the arc as straight segments (a little less)
+    assert measured['volume'] == pytest.approx(2 * (100 + 3.14159 * 25 / 2), rel=1e-2)
+
+
+def test_simplify():
+    square = kernel.simplify([(0, 0), (0, 0), (5, 0), (10, 0), (10, 10), (0, 10)])
+    assert len(square) == 4
+    assert kernel.shoelace(square) == pytest.approx(100)
+    with pytest.raises(ValueError):
+        kernel.simplify([(0, 0), (1, 0), (2, 0)])
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        kernel.backend('cad')
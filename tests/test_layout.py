@@ -0,0 +1,55 @@
+"""Walls of hexagons and the parts they need (layout.py)."""
+
+import pytest
+
+import assembly
+import layout
+
+
+def test_one_hexagon():
+    assert layout.parse('0,0').parts() == {'Glue_two_way': 6, 'Top_two_way': 6, 'side': 5, 'side_hinge': 1,
+                                           'leaf': 1, 'Hexagon Glass sketch': 1}
+
+
+def test_two_hexagons_share_a_side():
+    wall = layout.parse('0,0 1,0')
+    counts = wall.parts()
+    assert len(wall.sides()) == 11
+    assert len(wall.corners()) == 10
+    assert counts['Glue_three_way'] == counts['Top_three_way'] == 2
+    assert counts['Glue_two_way'] == 8
+    assert counts['side_hinge'] == counts['leaf'] == 2
+    assert counts['Hexagon Glass sketch'] == 2
+
+
+def test_shelves():
+    counts = layout.parse('0,0:long 0,1:short').parts()
+    assert counts['long_shelve'] == counts['short_shelve'] == 1
+    assert counts['Glue_mid_shelve'] == counts['Top_mid_shelve'] == 2
+    assert counts['sideq2'] + counts['sideq2_mirror'] == 2
+
+
+def test_big_hexagon():
+    wall = layout.hexagon(1)
+    assert len(wall.cells) == 7
+    assert len(wall.sides()) == 30
+    assert len(wall.corners()) == 24
+    assert sum(count for name, count in wall.parts().items() if name.startswith('Glue_')) == 24
+
+
+def test_json_spec():
+    assert layout.parse('[[0, 0], [1, 0, "long"]]').parts() == layout.parse('0,0 1,0:long').parts()
+
+
+def test_bad_specs():
+    with pytest.raises(ValueError):
+        layout.parse('0,0 0,0')
+    with pytest.raises(ValueError):
+        layout.parse('0,0:wide')
+
+
+@pytest.mark.parametrize('spec', ['0,0', '0,0 1,0:long 0,1:short', '0,0:long 1,0 2,0:short 1,1'])
+def test_placements_match_the_parts(spec):
+    wall = layout.parse(spec)
+    placed = assembly.placements(wall, assembly.dimensions())
+    assert {name: len(places) for name, places in placed.items()} == dict(wall.parts())
@@ -0,0 +1,75 @@
+"""Watertightness, manifold and overlap check of meshes (meshcheck.py)."""
+
+import numpy
+import pytest
+
+import kernel
+import meshcheck
+
+
+@pytest.fixture
+def box():
+    return kernel.NumpyKernel().mesh(kernel.NumpyKernel().box(10, 10, 10))
+
+
+def test_closed_box(box):
+    report = meshcheck.check(*box)
+    assert report['facets'] == 12
+    assert report['volume'] == pytest.approx(1000)
+    assert meshcheck.problems(report) == []
+
+
+def test_open_edges(box):
+    points, facets = box
+    report = meshcheck.check(points, facets[1:])
+    assert report['open_edges'] == 3
+    assert '3 open edges' in meshcheck.problems(report)
+
+
+def test_flipped_facet(box):
+    points, facets = box
+    facets = facets.copy()
+    facets[0] = facets[0, ::-1]
+    assert meshcheck.check(points, facets)['flipped_edges'] == 3
+
+
+def test_inside_out(box):
+    points, facets = box
+    report = meshcheck.check(points, facets[:, ::-1])
+    assert report['volume'] == pytest.approx(-1000)
+    assert meshcheck.problems(report) == ['inside out (volume -1000.0 mm3)']
+
+
+def test_degenerate_facet(box):
+    points, facets = box
+    facets = numpy.concatenate([facets, [[0, 0, 1]]])
+    assert meshcheck.check(points, facets)['degenerate_facets'] == 1
+
+
+def test_shells():
+    k = kernel.NumpyKernel()
+    points, facets = k.mesh(k.compound([k.box(1, 1, 1), k.placed(k.box(1, 1, 1), 5, 0, 0)]))
+    shell = meshcheck.shells(facets)
+    assert sorted(numpy.bincount(shell)) == [12, 12]
+    assert len(set(shell[:12])) == 1
+
+
+def test_overlapping_shells():
+    k = kernel.NumpyKernel()
+    points, facets = k.mesh(k.compound([k.box(10, 10, 10), k.placed(k.box(10, 10, 10), 5, 5, 5)]))
+    report = meshcheck.check(points, facets)
+    assert report['overlapping_shells'] == 1
+    assert meshcheck.overlaps(points, facets)[0][2] == pytest.approx(125)
+    assert '1 pairs of overlapping shells' in meshcheck.problems(report)
+
+
+def test_touching_shells_do_not_overlap():
+    k = kernel.NumpyKernel()
+    points, facets = k.mesh(k.compound([k.box(10, 10, 10), k.placed(k.box(10, 10, 10), 10, 0, 0),
+                                        k.placed(k.box(10, 10, 10), 0, 0, 20)]))
+    assert meshcheck.check(points, facets)['overlapping_shells'] == 0
+
+
+def test_sideq_holders_overlap():
+    k = kernel.NumpyKernel()
+    assert meshcheck.check(*k.mesh(kernel.part('sideq', k=k)))['overlapping_shells'] > 0
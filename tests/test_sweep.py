@@ -0,0 +1,40 @@
+"""Ranges and variants of a tolerance sweep (sweep.py)."""
+
+import pytest
+
+import sweep
+
+
+def test_parse_ranges():
+    assert sweep.parse_ranges(['insert_width=2.00:2.20:0.05']) == {'insert_width': (2.0, 2.2, 0.05)}
+    assert sweep.parse_ranges([' hole_width =1.9:2.1:0.1']) == {'hole_width': (1.9, 2.1, 0.1)}
+
+
+@pytest.mark.parametrize('spec', ['insert_width=2.0:2.2:0', 'insert_width=2.0:2.2:-0.1',
+                                  'insert_width=2.2:2.0:0.1', 'insert_width=2.0:2.2:0.15'])
+def test_parse_ranges_rejects(spec):
+    with pytest.raises(ValueError):
+        sweep.parse_ranges([spec])
+
+
+def test_steps():
+    assert sweep.steps(2.0, 2.2, 0.05) == [2.0, 2.05, 2.1, 2.15, 2.2]
+    assert sweep.steps(1, 1, 0.1) == [1]
+
+
+def test_variants_matrix():
+    ranges = sweep.parse_ranges(['insert_width=2.0:2.1:0.1', 'hole_width=1.9:2.1:0.1'])
+    variants = list(sweep.variants(ranges))
+    assert len(variants) == 6
+    assert {(v['insert_width'], v['hole_width']) for v in variants} == {(a, b) for a in (2.0, 2.1) for b in (1.9, 2.0, 2.1)}
+
+
+def test_cross_width_follows_common_width():
+    assert 'cross_width' not in sweep.defaults()
+    ranges = sweep.parse_ranges(['common_width=5.8:6.2:0.2'])
+    assert [v['cross_width'] for v in sweep.variants(ranges)] == pytest.approx([2.9, 3.0, 3.1])
+
+
+def test_swept_coupons():
+    assert sweep.swept_coupons({'insert_width': None}) == ['insert', 'pocket']
+    assert sweep.swept_coupons({'common_width': None}) == ['insert', 'cross', 'pocket', 'slot']
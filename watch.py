@@ -0,0 +1,158 @@
+"""
+watch.py -- Paul Cobbaut
+2026-10-19
+Create a hexagon wall display for small figurines.
+3D-printed hexagon, covered by a bought plexiglass panel.
+This file ==> watch the dimensions and the scripts, rebuild only the parts that changed
+  freecadcmd watch.py params.json [output directory] [part ...]
+params.json has the dimensions being tuned, as in a request to server.py:
+  {"params": {"insert_width": 2.05}, "parts": {"sideq2": {"holder_length": 12}}}
+FreeCAD is loaded once (worker.warm_up); the files are polled for changes.
+- params.json changed : the parts whose script has a dimension that changed
+- a generator script  : the parts it builds (its module is reloaded)
+- a shared module     : every part (see shared)
+Other files (server.py, preview.py, ...) are not watched.
+New params are fit checked (fitcheck.py) first, parts are built from their
+templates (templates.py) when the changed dimensions allow it. Every part is
+reported with its build time, every change with the time from the edit to
+the last file written.
+"""
+
+import importlib
+import json
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__))) # local helper modules
+import parts
+
+here = os.path.dirname(os.path.abspath(__file__))
+
+# seconds between two looks at the files
+interval = float(os.environ.get('HEXAGON_WATCH_INTERVAL', '0.3'))
+
+# modules every part is built with, in the order they are reloaded
+shared = list(parts.shared)
+
+
+def read_params(path):
+    """(overrides, per part params) of a params file; an empty or missing file has none."""
+    if not os.path.exists(path):
+        return {}, {}
+    with open(path) as f:
+        text = f.read().strip()
+    request = json.loads(text) if text else {}
+    return request.get('params') or {}, request.get('parts') or {}
+
+
+def watched_files(params_path):
+    """{path: module name or None for the params file} of all files watched."""
+    import parts
+    files = {params_path: None}
+    for module in shared + sorted(set(parts.generators.values())):
+        files[os.path.join(here, module + '.py')] = module
+    return files
+
+
+def modification_times(files):
+    times = {}
+    for path in files:
+        try:
+            times[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            times[path] = None
+    return times
+
+
+def affected(names, modules, old, new):
+    """Parts of names to build again: the params of old and new are (overrides, per part),
+    modules are the changed module names."""
+    import parts
+    if set(modules) & set(shared):
+        return list(names)
+    result = []
+    for name in names:
+        script = parts.generators[parts.mirrors.get(name, name)]
+        if script in modules or parts.params_for(name, *old) != parts.params_for(name, *new):
+            result.append(name)
+    return result
+
+
+def reload(modules):
+    """Reload the changed modules, shared ones first, the generator scripts after them."""
+    order = [m for m in shared if m in modules] + sorted(m for m in modules if m not in shared)
+    for module in order:
+        if module in sys.modules:
+            importlib.reload(sys.modules[module])
+
+
+def build(names, overrides, per_part, sink):
+    """Build and export names, each reported with its time. Returns the number that failed."""
+    import parts
+    failed = 0
+    for name in names:
+        start = time.perf_counter()
+        try:
+            params = parts.params_for(name, overrides, per_part)
+            locations = parts.make(name, params, sink, template=True)
+        except Exception as e:
+            failed += 1
+            print('%-22s failed: %s: %s' % (name, type(e).__name__, e))
+            continue
+        print('%-22s %6.2f s  %s' % (name, time.perf_counter() - start, ' '.join(locations)))
+    return failed
+
+
+def watch(params_path, directory, names):
+    import fitcheck
+    import sinks
+    import worker
+    start = time.perf_counter()
+    worker.warm_up()
+    print('warm in %.2f s' % (time.perf_counter() - start))
+    sink = sinks.DirectorySink(directory)
+    files = watched_files(params_path)
+    times = modification_times(files)
+    old = read_params(params_path)
+    build(names, *old, sink)
+    # modules changed since the last build, kept while a change cannot be built
+    modules = set()
+    print('watching %s and %d scripts' % (params_path, len(files) - 1))
+    while True:
+        time.sleep(interval)
+        now = modification_times(files)
+        changed = [path for path in files if now[path] != times[path]]
+        if not changed:
+            continue
+        edited = max((now[path] for path in changed if now[path] is not None), default=time.time_ns()) / 1e9
+        times = now
+        changed_modules = [files[path] for path in changed if files[path]]
+        modules.update(changed_modules)
+        try:
+            new = read_params(params_path)
+            fitcheck.check(dict(new[0]))
+            reload(changed_modules)
+        except Exception as e:
+            print('%s: %s' % (type(e).__name__, e))
+            continue
+        todo = affected(names, modules, old, new)
+        old, modules = new, set()
+        print('changed: %s, building %d part(s)' % (', '.join(os.path.basename(path) for path in changed), len(todo)))
+        failed = build(todo, *new, sink)
+        print('edit to files: %.2f s%s' % (time.time() - edited, ', %d failed' % failed if failed else ''))
+
+
+if __name__ == "__main__":
+    import parts
+    import sinks
+    args = [arg for arg in sys.argv[1:] if not arg.endswith('.py')]
+    params_path = os.path.abspath(args[0] if args else 'params.json')
+    directory = args[1] if len(args) > 1 else sinks.default_output
+    names = args[2:] or parts.names()
+    for name in names:
+        if name not in parts.names():
+            sys.exit('unknown part: ' + name)
+    try:
+        watch(params_path, directory, names)
+    except KeyboardInterrupt:
+        pass
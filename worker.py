@@ -0,0 +1,118 @@
+"""
+worker.py -- Paul Cobbaut
+2026-10-19
+Create a hexagon wall display for small figurines.
+3D-printed hexagon, covered by a bought plexiglass panel.
+This file ==> long-running FreeCAD worker that builds parts on request
+FreeCAD and the workbench modules are loaded once, at start:
+  freecadcmd worker.py
+Clients send one JSON line per request over a Unix socket:
+  {"part": "sideq", "params": {"insert_width": 2.05}, "directory": "/tmp/out"}
+and get one JSON line back:
+  {"ok": true, "artifacts": ["/tmp/out/sideq.3mf"], "seconds": 0.41}
+"template": true opens the part's template (templates.py) instead of building it.
+"inline": true writes no files, the answer has them base64 encoded:
+  {"ok": true, "artifacts": ["sideq.3mf"], "files": {"sideq.3mf": "UEsDB..."}, "seconds": 0.40}
+From a shell (plain python, no FreeCAD needed):
+  python3 worker.py build sideq insert_width=2.05
+"""
+
+import base64
+import importlib
+import json
+import os
+import socket
+import socketserver
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__))) # local helper modules
+
+socket_path       = os.environ.get('HEXAGON_WORKER_SOCKET', '/tmp/hexagon-worker.sock')
+default_directory = os.environ.get('HEXAGON_WORKER_OUTPUT', '/tmp/hexagon-parts')
+
+
+def warm_up():
+    """Load FreeCAD, the workbench modules and every generator script, once."""
+    import FreeCAD
+    import Part
+    import PartDesign
+    import Sketcher
+    import Mesh
+    import MeshPart
+    from ProfileLib import RegularPolygon
+    import parts
+    for module in sorted(set(parts.generators.values())):
+        importlib.import_module(module)
+
+
+class Handler(socketserver.StreamRequestHandler):
+    """One JSON request per line, several requests per connection."""
+
+    def handle(self):
+        import parts
+        import sinks
+        for line in self.rfile:
+            start = time.perf_counter()
+            try:
+                request = json.loads(line)
+                if request.get('inline'):
+                    sink = sinks.MemorySink()
+                else:
+                    sink = sinks.DirectorySink(request.get('directory') or default_directory)
+                artifacts = parts.make(request['part'], request.get('params'), sink, request.get('template', False))
+                answer = {'ok': True, 'artifacts': artifacts}
+                if request.get('inline'):
+                    answer['files'] = {name: base64.b64encode(data).decode('ascii') for name, data in sink.files.items()}
+            except Exception as e:
+                answer = {'ok': False, 'error': '%s: %s' % (type(e).__name__, e)}
+            answer['seconds'] = round(time.perf_counter() - start, 3)
+            self.wfile.write((json.dumps(answer) + '\n').encode())
+            self.wfile.flush()
+
+
+def serve(path=socket_path):
+    """Run the worker until interrupted. Requests are handled one at a time, FreeCAD is not thread safe."""
+    warm_up()
+    if os.path.exists(path):
+        os.unlink(path)
+    server = socketserver.UnixStreamServer(path, Handler)
+    print('hexagon worker listening on ' + path)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.unlink(path)
+
+
+def request(part, params=None, directory=None, path=socket_path):
+    """Ask a running worker to build part with params. Returns its answer as a dict."""
+    message = {'part': part, 'params': params or {}}
+    if directory:
+        message['directory'] = directory
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(path)
+        s.sendall((json.dumps(message) + '\n').encode())
+        answer = s.makefile('rb').readline()
+    return json.loads(answer)
+
+
+def parse_params(args):
+    """key=value arguments to a dict, values are JSON when they parse as JSON."""
+    params = {}
+    for arg in args:
+        key, value = arg.split('=', 1)
+        try:
+            params[key] = json.loads(value)
+        except ValueError:
+            params[key] = value
+    return params
+
+
+if __name__ == "__main__":
+    if 'build' in sys.argv:
+        args = sys.argv[sys.argv.index('build') + 1:]
+        print(json.dumps(request(args[0], parse_params(args[1:])), indent=2))
+    else:
+        serve()